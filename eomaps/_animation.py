@@ -0,0 +1,242 @@
+# Copyright EOmaps Contributors
+#
+# This file is part of EOmaps and is released under the BSD 3-clause license.
+# See LICENSE in the root of the repository for full licensing details.
+
+"""Export animations of multiple layers from the cached layer backgrounds."""
+
+import logging
+import queue
+import threading
+from pathlib import Path
+
+_log = logging.getLogger(__name__)
+
+
+class _ImageSequenceWriter:
+    # write each frame to a separate image-file
+    # (path must contain a format-field for the frame-number, e.g. "{:04d}")
+
+    def __init__(self, path, dpi):
+        self._path = str(path)
+        self._dpi = dpi
+
+    def write(self, i, rgba):
+        from matplotlib.image import imsave
+
+        imsave(self._path.format(i), rgba, dpi=self._dpi)
+
+    def finish(self):
+        pass
+
+
+class _PillowWriter:
+    # write an animated GIF (or WebP) with Pillow
+    # (Pillow can only save all frames at once, so frames are kept in memory)
+
+    def __init__(self, path, fps):
+        self._path = path
+        self._fps = fps
+        self._frames = []
+
+    def write(self, i, rgba):
+        from PIL import Image
+
+        self._frames.append(Image.fromarray(rgba))
+
+    def finish(self):
+        if len(self._frames) == 0:
+            return
+
+        self._frames[0].save(
+            self._path,
+            save_all=True,
+            append_images=self._frames[1:],
+            duration=int(1000 / self._fps),
+            loop=0,
+        )
+        self._frames = []
+
+
+class _RGBAFrameMixin:
+    # a mixin for pipe-based matplotlib MovieWriters to write RGBA arrays as frames
+    # (instead of saving the figure to the pipe)
+
+    def grab_frame(self, rgba=None, **savefig_kwargs):
+        if rgba is None:
+            return super().grab_frame(**savefig_kwargs)
+
+        self._proc.stdin.write(rgba.tobytes())
+
+
+class _PipeWriter:
+    # stream raw RGBA frames to the pipe of a matplotlib MovieWriter (e.g. ffmpeg)
+
+    def __init__(self, writer_cls, fig, path, dpi, **kwargs):
+        from matplotlib.animation import FileMovieWriter, MovieWriter
+
+        if (
+            not issubclass(writer_cls, MovieWriter)
+            or issubclass(writer_cls, FileMovieWriter)
+            or "rgba" not in writer_cls.supported_formats
+        ):
+            raise TypeError(
+                f"EOmaps: The writer {writer_cls.__name__} cannot be used to "
+                "export animations since it does not support piping raw RGBA frames."
+            )
+
+        rgba_writer_cls = type(writer_cls.__name__, (_RGBAFrameMixin, writer_cls), {})
+
+        writer = rgba_writer_cls(**kwargs)
+        writer.frame_format = "rgba"
+        writer.setup(fig, path, dpi=dpi)
+
+        self._writer = writer
+
+    @classmethod
+    def from_writer(cls, writer, fig, path, dpi):
+        # get a pipe-writer with the same properties as a MovieWriter instance
+        return cls(
+            type(writer),
+            fig,
+            path,
+            dpi,
+            fps=writer.fps,
+            codec=writer.codec,
+            bitrate=writer.bitrate,
+            extra_args=getattr(writer, "extra_args", None),
+            metadata=writer.metadata,
+        )
+
+    def write(self, i, rgba):
+        self._writer.grab_frame(rgba=rgba)
+
+    def finish(self):
+        self._writer.finish()
+
+
+def _get_writer(writer, fig, path, fps, **kwargs):
+    # get a writer that accepts RGBA arrays for the given output path
+    from matplotlib import animation, rcParams
+
+    if isinstance(writer, animation.AbstractMovieWriter):
+        return _PipeWriter.from_writer(writer, fig, path, fig.dpi)
+
+    if writer is None:
+        if "{" in str(path):
+            writer = "sequence"
+        elif Path(path).suffix.lower() in (".gif", ".webp"):
+            writer = "pillow"
+        else:
+            writer = rcParams["animation.writer"]
+
+    if writer == "sequence":
+        if "{" not in str(path):
+            raise ValueError(
+                "EOmaps: The path of an image-sequence must contain a format-field "
+                "for the frame-number (e.g. 'frame_{:04d}.png')."
+            )
+        return _ImageSequenceWriter(path, fig.dpi)
+    elif writer == "pillow":
+        return _PillowWriter(path, fps)
+
+    if not animation.writers.is_available(writer):
+        raise ValueError(
+            f"EOmaps: The animation writer '{writer}' is not available. "
+            f"Use one of {['sequence', *animation.writers.list()]}."
+        )
+
+    return _PipeWriter(animation.writers[writer], fig, path, fig.dpi, fps=fps, **kwargs)
+
+
+class _FrameWriter(threading.Thread):
+    # a thread that writes frames from a bounded queue
+    # (rendering blocks if the writer falls behind by more than queue_size frames)
+
+    def __init__(self, writer, queue_size=8):
+        super().__init__(name="EOmaps_animation_writer", daemon=True)
+
+        self._writer = writer
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._exception = None
+
+    def run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            # skip remaining frames if an exception occurred
+            if self._exception is not None:
+                continue
+
+            try:
+                self._writer.write(*item)
+            except Exception as ex:
+                self._exception = ex
+
+    def put(self, i, rgba):
+        if self._exception is not None:
+            raise self._exception
+
+        self._queue.put((i, rgba))
+
+    def close(self):
+        self._queue.put(None)
+        self.join()
+
+        try:
+            if self._exception is not None:
+                raise self._exception
+        finally:
+            self._writer.finish()
+
+
+def export_animation(m, layers, path, fps=10, writer=None, queue_size=8, **kwargs):
+    # render all layers from cached backgrounds and stream them to the writer
+    BM = m.BM
+
+    layers = [
+        BM._get_combined_layer_name(*l) if isinstance(l, list) else str(l)
+        for l in layers
+    ]
+
+    # check if all (public) layers exist
+    existing_layers = set(m._get_layers())
+    missing_layers = {
+        l
+        for layer in layers
+        for l in BM._parse_multi_layer_str(layer)[0]
+        if not l.startswith("_") and l not in existing_layers
+    }
+    if len(missing_layers) > 0:
+        raise ValueError(f"EOmaps: The layers {missing_layers} do not exist.")
+
+    frame_writer = _FrameWriter(
+        _get_writer(writer, m.f, path, fps, **kwargs), queue_size=queue_size
+    )
+    frame_writer.start()
+
+    initial_layer = BM.bg_layer
+    # layers that have been cached prior to the export
+    cached_layers = set(BM._bg_layers)
+    try:
+        for i, layer in enumerate(layers):
+            _log.debug(f"EOmaps: Exporting frame {i} (layer '{layer}')")
+            frame_writer.put(i, BM._render_frame(layer))
+
+            # don't keep backgrounds that have only been fetched for the export
+            # (to avoid keeping all frames in memory)
+            for l in BM._parse_multi_layer_str(layer)[0]:
+                if l not in cached_layers:
+                    BM._bg_layers.pop(l, None)
+    except Exception:
+        try:
+            frame_writer.close()
+        except Exception:
+            pass
+        raise
+    else:
+        frame_writer.close()
+    finally:
+        m.show_layer(initial_layer)
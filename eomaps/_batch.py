@@ -0,0 +1,212 @@
+# Copyright EOmaps Contributors
+#
+# This file is part of EOmaps and is released under the BSD 3-clause license.
+# See LICENSE in the root of the repository for full licensing details.
+
+"""Batch rendering of multiple datasets on a map with a static layout."""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+_log = logging.getLogger(__name__)
+
+
+def _write_image(fname, rgba, kwargs):
+    # save a rendered frame to disk (executed in a worker-process)
+    from matplotlib.image import imsave
+
+    imsave(fname, rgba, **kwargs)
+
+
+class BatchRenderer:
+    """
+    Render multiple datasets on a map with a shared (static) layout.
+
+    All features of the template map (e.g. coastlines, gridlines, logos, ...)
+    are rendered only once and their cached backgrounds are re-used for all
+    frames. For each frame, only the dataset is replaced (via `m.set_data` and
+    `m.plot_map`) and the result is written to disk in a pool of
+    worker-processes.
+
+    Use :py:meth:`Maps.new_batch_renderer` to get a new BatchRenderer.
+
+    Note
+    ----
+    Frames are rendered with the dpi of the figure. Use `Maps(dpi=...)` or
+    `m.f.set_dpi(...)` to adjust the resolution of the outputs.
+
+    """
+
+    def __init__(self, m, layer="batch", show_layer=None, processes=None):
+        self._m = m.parent
+        # the Maps-object used to plot the datasets
+        self.m = m.new_layer(layer)
+
+        # static artists above the dataset are moved to an overlay-layer
+        # (only if the visible layer is not provided explicitly)
+        self._static_layer = m.layer if show_layer is None else None
+        self._overlay_layer = f"__{layer}_overlay"
+
+        if show_layer is None:
+            show_layer = self._m.BM._get_combined_layer_name(
+                m.layer, self.m.layer, self._overlay_layer
+            )
+        self._show_layer = show_layer
+
+        self._processes = processes
+        self._pool = None
+        self._futures = []
+
+        self._nframes = 0
+        self._colorbar = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def show_layer(self):
+        """The layer that is rendered for each frame."""
+        return self._show_layer
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._processes)
+        return self._pool
+
+    def _split_static_layer(self):
+        # move static artists with a zorder above the dataset to the overlay-layer
+        # (to maintain the zorder of the artists in the rendered frames)
+        if self._static_layer is None or self.m.coll is None:
+            return
+
+        BM = self._m.BM
+        zorder = self.m.coll.get_zorder()
+        for a in list(BM._bg_artists.get(self._static_layer, [])):
+            if a.get_zorder() > zorder:
+                BM.remove_bg_artist(a, layer=self._static_layer, draw=False)
+                BM.add_bg_artist(a, layer=self._overlay_layer, draw=False)
+
+    def _get_frame(self):
+        # render the visible layer and return an RGBA array of the figure
+        if self._nframes == 0:
+            self._split_static_layer()
+
+        return self._m.BM._render_frame(self._show_layer)
+
+    def render(self, fname, data, plot_kwargs=None, colorbar=None, **kwargs):
+        """
+        Plot a dataset and save the rendered map.
+
+        Parameters
+        ----------
+        fname : str or path-like
+            The filename of the output. The format is deduced from the extension.
+        data : array-like
+            The dataset to plot (see :py:meth:`Maps.set_data`).
+        plot_kwargs : dict, optional
+            Additional kwargs passed to :py:meth:`Maps.plot_map`.
+
+            If the extent of the map has not been set explicitly, it is only set
+            to the extent of the first dataset (to avoid re-drawing the
+            static layers on each frame). The default is None.
+        colorbar : dict or bool, optional
+            If True, a colorbar is shown. If a dict is provided, it is used as
+            kwargs for :py:meth:`Maps.add_colorbar`.
+
+            The colorbar is only created once and subsequently updated with the
+            new dataset (e.g. kwargs are ignored as long as the colorbar exists).
+            If False or None, an existing colorbar is removed.
+            The default is None.
+        kwargs :
+            Additional kwargs passed to :py:meth:`Maps.set_data`
+            (e.g. x, y, crs, parameter, ...).
+
+        Returns
+        -------
+        future : concurrent.futures.Future or None
+            A future that is resolved once the output has been written to disk.
+            If the BatchRenderer uses 0 processes, the file is written
+            immediately and None is returned.
+
+        """
+        plot_kwargs = dict(plot_kwargs or {})
+        if self._nframes > 0:
+            plot_kwargs.setdefault("set_extent", False)
+
+        self.m.set_data(data, **kwargs)
+        self.m.plot_map(**plot_kwargs)
+
+        self._update_colorbar(colorbar)
+
+        rgba = self._get_frame()
+        self._nframes += 1
+
+        return self.write(fname, rgba)
+
+    def _update_colorbar(self, colorbar):
+        # re-use the existing colorbar (creating a new colorbar is expensive!)
+        if not colorbar:
+            if self._colorbar is not None:
+                self._colorbar.remove()
+                self.m._colorbars.remove(self._colorbar)
+                self._colorbar = None
+        elif self._colorbar is None:
+            kwargs = colorbar if isinstance(colorbar, dict) else dict()
+            self._colorbar = self.m.add_colorbar(**kwargs)
+        else:
+            self._colorbar._set_map(self.m)
+            self._colorbar._redraw()
+            # the background of the layer might already have been fetched with
+            # the colorbar of the previous frame
+            self._m.BM._refetch_layer(self._colorbar.layer)
+
+    def write(self, fname, rgba):
+        """
+        Write a rendered frame to disk.
+
+        Parameters
+        ----------
+        fname : str or path-like
+            The filename of the output. The format is deduced from the extension.
+        rgba : np.ndarray
+            An array of shape (height, width, 4) with the RGBA values of the frame.
+
+        Returns
+        -------
+        future : concurrent.futures.Future or None
+            A future that is resolved once the output has been written to disk.
+            If the BatchRenderer uses 0 processes, the file is written
+            immediately and None is returned.
+
+        """
+        kwargs = dict(dpi=self._m.f.dpi)
+
+        if self._processes == 0:
+            _write_image(fname, rgba, kwargs)
+            return None
+
+        future = self._get_pool().submit(_write_image, fname, rgba, kwargs)
+        self._futures.append(future)
+        return future
+
+    def wait(self):
+        """
+        Wait until all pending outputs have been written to disk.
+
+        Raises the first exception encountered while writing the outputs.
+        """
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def close(self):
+        """Wait for all pending outputs and shut down the worker-processes."""
+        try:
+            self.wait()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
@@ -6,18 +6,27 @@
 """The BlitManager used to handle drawing and caching of backgrounds."""
 
 import logging
+import sys
+from collections import Counter, OrderedDict
+from collections.abc import MutableMapping
 from contextlib import ExitStack, contextmanager
-from functools import lru_cache
 from itertools import chain
 from weakref import WeakSet
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import TimerBase
 from matplotlib.spines import Spine
 from matplotlib.transforms import Bbox
 
+from ._profiling import RenderProfiler
+
 _log = logging.getLogger(__name__)
 
+# bit-shift of the alpha-channel if RGBA pixels are viewed as uint32
+_ALPHA_SHIFT = 24 if sys.byteorder == "little" else 0
+
 
 class LayerParser:
     @staticmethod
@@ -166,11 +175,451 @@ class LayerParser:
         return layer
 
 
+class BackgroundCache(MutableMapping):
+    """
+    A LRU cache for fetched background-layers with a memory budget.
+
+    If the total size of the cached buffers exceeds the budget, the least
+    recently shown layers are evicted first (pinned layers are never evicted).
+
+    Parameters
+    ----------
+    maxsize : int or None
+        The max. size of all cached buffers in bytes (None = unlimited).
+        Ignored if a parent is provided.
+    pinned : callable or None
+        A function that returns a set of layer-names that must not be evicted.
+    parent : BackgroundCache or None
+        A cache whose budget is shared. The buffers of this cache count towards
+        the budget of the parent and they are evicted before any layer of
+        the parent.
+
+    """
+
+    def __init__(self, maxsize=None, pinned=None, parent=None):
+        self.maxsize = maxsize
+        self._pinned = pinned
+
+        # caches that share the budget of this cache
+        self._children = []
+        self._parent = parent
+        if parent is not None:
+            parent._children.append(self)
+
+        self._data = OrderedDict()
+        self._sizes = dict()
+        self.nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _get_nbytes(bg):
+        try:
+            return memoryview(bg).nbytes
+        except TypeError:
+            return 0
+
+    def __getitem__(self, layer):
+        # accessing a layer marks it as recently used
+        bg = self._data[layer]
+        self._data.move_to_end(layer)
+        self.hits += 1
+        return bg
+
+    def __setitem__(self, layer, bg):
+        if layer in self._data:
+            self._remove(layer)
+
+        self._data[layer] = bg
+        self._sizes[layer] = self._get_nbytes(bg)
+        self.nbytes += self._sizes[layer]
+
+        self._evict(keep=layer)
+
+    def __delitem__(self, layer):
+        self._remove(layer)
+
+    def __contains__(self, layer):
+        return layer in self._data
+
+    def __iter__(self):
+        # iterate over a copy of the keys (accessing items changes the order!)
+        return iter(list(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, layer, default=None):
+        # get a layer without marking it as recently used
+        return self._data.get(layer, default)
+
+    def pop(self, layer, *args):
+        if layer not in self._data:
+            if args:
+                return args[0]
+            raise KeyError(layer)
+
+        bg = self._data[layer]
+        self._remove(layer)
+        return bg
+
+    def clear(self):
+        self._data.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+
+    def _remove(self, layer):
+        del self._data[layer]
+        self.nbytes -= self._sizes.pop(layer)
+
+    @property
+    def _total_nbytes(self):
+        # the size of all buffers that count towards the budget
+        return self.nbytes + sum(cache.nbytes for cache in self._children)
+
+    def _evict(self, keep=None):
+        # remove least recently used layers until the cache fits the budget
+        if self._parent is not None:
+            return self._parent._evict()
+
+        if self.maxsize is None or self._total_nbytes <= self.maxsize:
+            return
+
+        # layers of caches that share the budget are evicted first
+        for cache in self._children:
+            for layer in cache:
+                if self._total_nbytes <= self.maxsize:
+                    return
+
+                cache._remove(layer)
+                cache.evictions += 1
+
+        pinned = self._pinned() if self._pinned is not None else set()
+
+        for layer in list(self._data):
+            if self._total_nbytes <= self.maxsize:
+                break
+            if layer == keep or layer in pinned:
+                continue
+
+            _log.debug(f"EOmaps: Evicting cached background of layer '{layer}'")
+            self._remove(layer)
+            self.evictions += 1
+
+    def cache_info(self):
+        """
+        Get statistics of the cache.
+
+        Returns
+        -------
+        info : dict
+            A dict with the number of hits, misses and evictions, the number
+            of cached layers, the size of all cached buffers ("nbytes") and the
+            max. size of the cache ("maxsize") in bytes.
+
+        """
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            layers=len(self._data),
+            nbytes=self.nbytes,
+            maxsize=self.maxsize,
+        )
+
+
+class LayerCompositor:
+    """
+    Alpha-compositing of cached background-layers.
+
+    Layers are blended with premultiplied alpha ("over"-operator) in-place on a
+    re-usable integer buffer. Composites are cached by the combined layer-names,
+    alphas, figure-size and dpi (and re-computed if a source-layer changed).
+
+    To speed up interactive changes of the transparency of a layer, the
+    composite of all layers below the first semi-transparent layer is kept.
+
+    Parameters
+    ----------
+    maxsize : int
+        The max. number of cached composites.
+
+    """
+
+    # layers with less visible pixels are blended pixel-wise
+    _sparse_fraction = 0.25
+
+    def __init__(self, maxsize=10):
+        self.maxsize = maxsize
+
+        # cached composites {key: (sources, region)}
+        self._cache = OrderedDict()
+        # premultiplied data of the source-layers of the last composite
+        self._layer_data = dict()
+        # partial composite of the last composite (key, sources, buffer)
+        self._prefix = None
+
+        # re-usable working buffers
+        self._buffer = None
+        self._tmp = None
+
+        # number of composites returned from the cache
+        self.hits = 0
+
+    def clear(self):
+        """Clear all cached composites."""
+        self._cache.clear()
+        self._layer_data.clear()
+        self._prefix = None
+
+    def _get_buffers(self, shape):
+        if self._buffer is None or self._buffer.shape != shape:
+            self._buffer = np.empty(shape, dtype=np.uint16)
+            self._tmp = np.empty(shape, dtype=np.uint16)
+            self._prefix = None
+        return self._buffer, self._tmp
+
+    @staticmethod
+    def _premultiply(rgba):
+        # get premultiplied rgba values, the inverse alpha (255 - alpha) of all
+        # channels, an indicator if the layer is opaque and the region of the
+        # visible pixels (flat indices for sparse layers or a tuple of slices)
+        # (returns None if the layer is completely transparent)
+        h, w, _ = rgba.shape
+        px = np.ascontiguousarray(rgba).view(np.uint32).reshape(h, w)
+
+        alpha = (px >> _ALPHA_SHIFT) & 0xFF
+        if not alpha.any():
+            return None
+
+        # replicate alpha-values to all channels
+        alpha4 = (alpha * 0x01010101).view(np.uint8).reshape(h, w, 4)
+        inv_alpha = np.subtract(255, alpha4, dtype=np.uint8)
+
+        if alpha.min() == 255:
+            return rgba, inv_alpha, True, (slice(None), slice(None))
+
+        # multiply rgb with alpha (use alpha=1 for the alpha-channel)
+        rgb1 = (px | np.uint32(0xFF << _ALPHA_SHIFT)).view(np.uint8).reshape(h, w, 4)
+        pm = np.multiply(rgb1, alpha4, dtype=np.uint16)
+        pm += 127
+        pm //= 255
+        pm = pm.astype(np.uint8)
+
+        # only blend visible pixels of sparse layers (e.g. spines, markers etc.)
+        idx = np.flatnonzero(alpha)
+        if idx.size < LayerCompositor._sparse_fraction * alpha.size:
+            return pm.reshape(-1, 4)[idx], inv_alpha.reshape(-1, 4)[idx], False, idx
+
+        # only blend the bounding box of visible pixels of dense layers
+        rows = np.flatnonzero(alpha.any(axis=1))
+        cols = np.flatnonzero(alpha.any(axis=0))
+        region = (slice(rows[0], rows[-1] + 1), slice(cols[0], cols[-1] + 1))
+        return pm[region], inv_alpha[region], False, region
+
+    def _get_layer_data(self, layer, source, shape, cache=True):
+        if source is None:
+            return None
+
+        data = self._layer_data.get(layer, None)
+        if data is not None and data[0] is source:
+            return data[1]
+
+        rgba = np.asarray(source)
+        if rgba.shape != shape:
+            _log.debug(f"EOmaps: Unable to combine background of layer '{layer}'")
+            return None
+
+        data = self._premultiply(rgba)
+        if cache:
+            self._layer_data[layer] = (source, data)
+        return data
+
+    @staticmethod
+    def _blend(buffer, tmp, data, alpha):
+        # blend a layer (with a global alpha in [0, 255]) over the buffer
+        pm, inv_alpha, _, region = data
+
+        if isinstance(region, tuple):
+            values = buffer[region]
+            tmp = tmp.reshape(-1)[: values.size].reshape(values.shape)
+            LayerCompositor._blend_values(values, pm, inv_alpha, alpha, tmp)
+        else:
+            # blend only the visible pixels of sparse layers
+            flat = buffer.view(np.uint64).reshape(-1)
+            values = flat[region].view(np.uint16).reshape(-1, 4)
+            LayerCompositor._blend_values(values, pm, inv_alpha, alpha)
+            flat[region] = values.view(np.uint64).reshape(-1)
+
+    @staticmethod
+    def _blend_values(buffer, pm, inv_alpha, alpha, tmp=None):
+        if alpha == 255:
+            np.multiply(buffer, inv_alpha, out=buffer)
+            buffer += 127
+            buffer //= 255
+            buffer += pm
+        else:
+            if tmp is None:
+                tmp = np.empty_like(buffer)
+
+            # inverse of the effective alpha: 255 - alpha_pixel * alpha / 255
+            np.multiply(inv_alpha, alpha, out=tmp, dtype=np.uint16)
+            tmp += 255 * (255 - alpha) + 127
+            tmp //= 255
+            buffer *= tmp
+
+            np.multiply(pm, alpha, out=tmp, dtype=np.uint16)
+            buffer += tmp
+            buffer += 127
+            buffer //= 255
+
+    @staticmethod
+    def _unpremultiply(buffer, out):
+        # write premultiplied values to a (straight alpha) rgba array
+        alpha = buffer[..., 3:].astype(np.float32)
+        rgb = buffer[..., :3] * np.float32(255)
+        np.divide(rgb, alpha, out=rgb, where=alpha > 0)
+        rgb += 0.5
+        np.minimum(rgb, 255, out=rgb)
+        np.copyto(out[..., :3], rgb, casting="unsafe")
+        np.copyto(out[..., 3:], alpha, casting="unsafe")
+
+    def composite(self, layers, alphas, sources, new_region, key=None):
+        """
+        Composite background-layers.
+
+        Parameters
+        ----------
+        layers, alphas : list
+            The names and global transparencies of the layers (bottom to top).
+        sources : list
+            The (full-figure) buffers of the layers (None for empty layers).
+        new_region : callable
+            A function that returns a new full-figure BufferRegion.
+            The composite is written to the buffer of this region.
+        key : hashable or None
+            The cache-key of the composite. If None, the result is not cached.
+
+        Returns
+        -------
+        region : BufferRegion
+            The composite.
+
+        """
+        if key is not None:
+            cached = self._cache.get(key, None)
+            if cached is not None and all(i is j for i, j in zip(cached[0], sources)):
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+
+        region = new_region()
+        out = np.asarray(region)
+
+        # get premultiplied data of all visible layers
+        visible, used = [], set()
+        for layer, alpha, source in zip(layers, alphas, sources):
+            data = self._get_layer_data(layer, source, out.shape, key is not None)
+            alpha = int(round(min(max(alpha, 0), 1) * 255))
+            used.add(layer)
+            if data is None or alpha == 0:
+                continue
+            visible.append((layer, alpha, source, data))
+
+        # only keep data of the most recently combined layers
+        for layer in set(self._layer_data).difference(used):
+            del self._layer_data[layer]
+
+        # layers below the top-most fully opaque layer are not visible
+        opaque = False
+        for i in reversed(range(len(visible))):
+            _, alpha, _, data = visible[i]
+            if alpha == 255 and data[2]:
+                visible, opaque = visible[i:], True
+                break
+
+        if len(visible) == 0:
+            out[:] = 0
+        else:
+            buffer, tmp = self._get_buffers(out.shape)
+
+            start = self._restore_prefix(visible, buffer)
+            if start == 0:
+                data = visible[0][3]
+                if opaque and data[3] == (slice(None), slice(None)):
+                    # the first layer covers the full figure
+                    np.copyto(buffer, data[0])
+                    start = 1
+                else:
+                    buffer.fill(0)
+
+            for i in range(start, len(visible)):
+                _, alpha, _, data = visible[i]
+                if alpha != 255 and i > 0 and key is not None:
+                    self._store_prefix(visible[:i], buffer)
+
+                self._blend(buffer, tmp, data, alpha)
+
+            if opaque:
+                np.copyto(out, buffer, casting="unsafe")
+            else:
+                self._unpremultiply(buffer, out)
+
+        if key is not None:
+            self._cache[key] = (tuple(sources), region)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+        return region
+
+    def _store_prefix(self, visible, buffer):
+        # remember the composite of the layers below a semi-transparent layer
+        prefix_key = tuple((layer, alpha) for layer, alpha, _, _ in visible)
+        if self._prefix is not None and self._prefix[0] == prefix_key:
+            return
+
+        self._prefix = (
+            prefix_key,
+            tuple(source for _, _, source, _ in visible),
+            buffer.copy(),
+        )
+
+    def _restore_prefix(self, visible, buffer):
+        # restore the composite of the first layers (if available)
+        # and return the index of the next layer to blend
+        if self._prefix is None:
+            return 0
+
+        prefix_key, sources, prefix = self._prefix
+        if len(visible) <= len(prefix_key) or prefix.shape != buffer.shape:
+            return 0
+
+        for (layer, alpha, source, _), (l, a), s in zip(visible, prefix_key, sources):
+            if layer != l or alpha != a or source is not s:
+                return 0
+
+        np.copyto(buffer, prefix)
+        return len(prefix_key)
+
+
 # taken from https://matplotlib.org/stable/tutorials/advanced/blitting.html#class-based-example
 class BlitManager(LayerParser):
     """Manager used to schedule draw events, cache backgrounds, etc."""
 
     _snapshot_on_update = False
+    # max. size of cached backgrounds in bytes (None = unlimited)
+    # (see Maps.config(bg_cache_size=...))
+    _bg_cache_size = None
+    # idle-time (in ms) before the next layer is prefetched
+    # (see BlitManager.prefetch_layers())
+    _prefetch_delay = 250
+    # number of last axes-children that are compared to detect changes
+    # (see `_update_unmanaged_artists()`)
+    _axes_snapshot_size = 5
+    # record timings of all rendering stages (see Maps.config(profile=...))
+    _profile = False
 
     def __init__(self, m):
         """
@@ -196,10 +645,24 @@ class BlitManager(LayerParser):
         self._artists = dict()
 
         self._bg_artists = dict()
-        self._bg_layers = dict()
+        self._bg_layers = BackgroundCache(self._bg_cache_size, self._get_pinned_layers)
 
         self._pending_webmaps = dict()
 
+        # alpha-compositing (and caching) of combined background-layers
+        self._compositor = LayerCompositor()
+
+        # timings of the rendering stages (see `profile()`)
+        self._profiler = RenderProfiler(enabled=self._profile)
+
+        # window-extents of the dynamic artists drawn on the last update and the
+        # associated background (used to blit only regions that changed)
+        self._blit_extents = (None, dict())
+        self._pending_blit = []
+        # cached canvas with dynamic artists that did not change
+        # (see `_draw_animated()`)
+        self._overlay = None
+
         # the name of the layer at which all "unmanaged" artists are drawn
         self._unmanaged_artists_layer = "base"
 
@@ -216,6 +679,26 @@ class BlitManager(LayerParser):
         self._refetch_bg = True
         self._layers_to_refetch = set()
 
+        # cached backgrounds of the previous map-extent that are shown as
+        # (shifted) previews on layer-changes after the map has been panned
+        # (see `_update_bg_previews()`)
+        # (previews share the budget of the background-layers and are evicted first)
+        self._bg_previews = BackgroundCache(parent=self._bg_layers)
+        self._bg_preview_views = dict()
+        self._bg_view = None
+        self._store_bg_previews = False
+        self._pending_bg_previews = set()
+        self._bg_preview_timer = None
+        self._drawing = False
+
+        # layers that are fetched in the background while the map is idle
+        # (see `prefetch_layers()`)
+        self._prefetch_queue = []
+        self._prefetch_timer = None
+        # callbacks to cancel prefetching on user-interaction
+        # (only connected while layers are prefetched)
+        self._cid_prefetch = []
+
         # TODO these activate some crude fixes for jupyter notebook and webagg
         # backends... proper fixes would be nice
         self._mpl_backend_blit_fix = any(
@@ -252,6 +735,18 @@ class BlitManager(LayerParser):
         # unmanaged artists
         self._ignored_unmanaged_artists = WeakSet()
 
+        # incremental tracking of unmanaged artists (see `_get_unmanaged_artists()`)
+        # number of layers each artist is managed on
+        self._managed_artists = Counter()
+        # all tracked children of the map-axes {artist: axes}
+        self._axes_children = dict()
+        # snapshots of the children of the map-axes used to detect changes
+        # {axes: (number of children, last children)}
+        self._axes_snapshots = dict()
+        # artists whose managed/unmanaged state must be re-evaluated
+        self._unmanaged_recheck = set()
+        self._unmanaged_artists = set()
+
     def _get_renderer(self):
         # don't return the renderer if the figure is saved.
         # in this case the normal draw-routines are used (see m.savefig) so there is
@@ -288,6 +783,339 @@ class BlitManager(LayerParser):
         unmanaged_axes = allaxes.difference(managed_axes)
         return unmanaged_axes
 
+    def _get_pinned_layers(self):
+        # layers whose cached backgrounds should never be evicted
+        # (e.g. the active layer and private background/spines layers)
+        show_layer = self._get_showlayer_name()
+        return {
+            self.bg_layer,
+            show_layer,
+            *self._parse_multi_layer_str(show_layer)[0],
+            "__BG__",
+            "__SPINES__",
+        }
+
+    def _timers_supported(self):
+        # check if canvas-timers are executed
+        # (timers of non-interactive backends are never executed!)
+        canvas = self.canvas
+        return getattr(type(canvas), "_timer_cls", TimerBase) is not TimerBase
+
+    def _get_map_view(self):
+        # get the affine data-to-display transform and the bbox of the map
+        # (only defined for figures with a single map-axes)
+        maxes = self._get_all_map_axes()
+        if len(maxes) != 1:
+            return None
+
+        (ax,) = maxes
+        return (
+            ax.transData.get_affine().get_matrix().copy(),
+            ax.bbox.bounds,
+            self.figure.bbox.bounds,
+        )
+
+    @staticmethod
+    def _get_view_offset(view, new_view):
+        # get the offset (in pixels) between 2 views
+        # (None if the views are not related by a pure translation)
+        if view is None or new_view is None:
+            return None
+
+        (m0, ax_bounds0, fig_bounds0), (m1, ax_bounds1, fig_bounds1) = view, new_view
+        if ax_bounds0 != ax_bounds1 or fig_bounds0 != fig_bounds1:
+            return None
+        if not np.allclose(m0[:2, :2], m1[:2, :2]):
+            return None
+
+        return m1[:2, 2] - m0[:2, 2]
+
+    def _on_extent_change(self):
+        # refetch all layers but keep cached backgrounds as previews
+        # (in case the map has only been panned)
+        self._refetch_bg = True
+        self._store_bg_previews = True
+
+    def _update_bg_previews(self):
+        # remember cached backgrounds of the previous view as previews
+        # (executed before all cached backgrounds are cleared)
+        view = self._get_map_view()
+
+        if not self._store_bg_previews or view is None:
+            self._bg_previews.clear()
+            self._bg_preview_views.clear()
+        else:
+            for layer in self._bg_layers:
+                # combined and private layers are always re-drawn
+                if "|" in layer or layer.startswith("__"):
+                    continue
+                # move the buffers (to avoid counting them twice in the budget)
+                self._bg_previews[layer] = self._bg_layers.pop(layer)
+                self._bg_preview_views[layer] = self._bg_view
+
+            # remove previews that cannot be shifted to the new view
+            for layer in list(self._bg_previews):
+                offset = self._get_view_offset(
+                    self._bg_preview_views.get(layer, None), view
+                )
+                if offset is None:
+                    del self._bg_previews[layer]
+
+            for layer in set(self._bg_preview_views).difference(self._bg_previews):
+                del self._bg_preview_views[layer]
+
+        self._bg_view = view
+        self._store_bg_previews = False
+
+    def _use_bg_preview(self, layer):
+        # check if a (shifted) preview should be used for a layer
+        # (previews are only shown on updates outside of draw-events and
+        # a re-draw of the layer is scheduled with a timer)
+        if self._drawing or layer not in self._bg_previews:
+            return False
+
+        if layer not in self._pending_bg_previews:
+            offset = self._get_view_offset(
+                self._bg_preview_views.get(layer, None), self._get_map_view()
+            )
+            if offset is None or not self._timers_supported():
+                return False
+
+            self._pending_bg_previews.add(layer)
+
+        if self._bg_preview_timer is None:
+            self._bg_preview_timer = self.canvas.new_timer(interval=0)
+            self._bg_preview_timer.single_shot = True
+            self._bg_preview_timer.add_callback(self._refresh_bg_previews)
+        self._bg_preview_timer.start()
+
+        return True
+
+    def _get_preview_array(self, layer):
+        # get the rgba array of a preview shifted to the current view
+        bg = self._bg_previews.get(layer)
+        offset = self._get_view_offset(
+            self._bg_preview_views.get(layer, None), self._get_map_view()
+        )
+        if bg is None or offset is None:
+            return None
+
+        rgba = np.array(bg)[::-1, :, :]
+        (ax,) = self._get_all_map_axes()
+
+        # only shift the content of the map-axes
+        x0, y0, x1, y1 = np.round(ax.bbox.extents).astype(int)
+        x0, y0 = max(x0, 0), max(y0, 0)
+        region = rgba[y0:y1, x0:x1]
+
+        h, w = region.shape[:2]
+        dx, dy = np.round(offset).astype(int)
+
+        shifted = np.zeros_like(region)
+        if abs(dx) < w and abs(dy) < h:
+            shifted[max(dy, 0) : h + min(dy, 0), max(dx, 0) : w + min(dx, 0)] = region[
+                max(-dy, 0) : h - max(dy, 0), max(-dx, 0) : w - max(dx, 0)
+            ]
+        rgba[y0:y1, x0:x1] = shifted
+
+        return rgba
+
+    def _refresh_bg_previews(self):
+        # re-draw layers that are currently shown as previews
+        if len(self._pending_bg_previews) == 0:
+            return
+
+        while len(self._pending_bg_previews) > 0:
+            layer = self._pending_bg_previews.pop()
+            self._bg_previews.pop(layer, None)
+            self._bg_preview_views.pop(layer, None)
+
+        self.update()
+
+    def prefetch_layers(self, layers):
+        """
+        Fetch (and cache) the backgrounds of layers while the map is idle.
+
+        The layers are fetched one after another (in the provided order) with a
+        canvas-timer. Each layer is fetched only after the map was idle for
+        `BlitManager._prefetch_delay` milliseconds.
+
+        - Prefetching is cancelled on user-interaction (e.g. mouse-button press,
+          scroll or keypress events) and if new layers are scheduled.
+        - Prefetching stops if the next layer would no longer fit into the cache
+          for background layers (see `Maps.config(bg_cache_size=...)`).
+        - Prefetching requires an interactive backend (no layers are fetched
+          for non-interactive backends).
+
+        Parameters
+        ----------
+        layers : list of str
+            The names of the layers to prefetch (sorted by priority).
+
+        See Also
+        --------
+        Maps.fetch_layers : Fetch (and cache) layers of a map.
+        BlitManager.cancel_prefetch : Cancel prefetching of layers.
+
+        """
+        self._prefetch_queue = [
+            l for l in dict.fromkeys(layers) if l != "all" and not l.startswith("__")
+        ]
+
+        if len(self._prefetch_queue) == 0 or not self._timers_supported():
+            self.cancel_prefetch()
+            return
+
+        if self._prefetch_timer is None:
+            self._prefetch_timer = self.canvas.new_timer(interval=self._prefetch_delay)
+            self._prefetch_timer.single_shot = True
+            self._prefetch_timer.add_callback(self._do_prefetch)
+
+        if len(self._cid_prefetch) == 0:
+            self._cid_prefetch = [
+                self.canvas.mpl_connect(event, self._on_prefetch_interaction)
+                for event in ("button_press_event", "scroll_event", "key_press_event")
+            ]
+
+        # (re)start the timer to make sure the map is idle before fetching
+        self._prefetch_timer.stop()
+        self._prefetch_timer.start()
+
+    def cancel_prefetch(self):
+        """Cancel prefetching of layers (see `BlitManager.prefetch_layers()`)."""
+        self._prefetch_queue.clear()
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+
+        self._disconnect_prefetch_callbacks()
+
+    def _disconnect_prefetch_callbacks(self):
+        while len(self._cid_prefetch) > 0:
+            self.canvas.mpl_disconnect(self._cid_prefetch.pop())
+
+    def _on_prefetch_interaction(self, event):
+        if len(self._prefetch_queue) > 0:
+            self.cancel_prefetch()
+
+    def _prefetch_fits_cache(self, nlayers=1):
+        # check if additional layers can be cached without evicting other layers
+        maxsize = self._bg_layers.maxsize
+        if maxsize is None:
+            return True
+
+        w, h = self.figure.bbox.size
+        return self._bg_layers.nbytes + nlayers * int(w) * int(h) * 4 <= maxsize
+
+    def _do_prefetch(self):
+        # fetch the next layer of the prefetch-queue (executed by a timer)
+        if self._refetch_bg:
+            # wait until the pending draw has cleared the cache
+            self._prefetch_timer.start()
+            return
+
+        renderer = self._get_renderer()
+        if renderer is None:
+            self.cancel_prefetch()
+            return
+
+        while len(self._prefetch_queue) > 0:
+            layer = self._prefetch_queue.pop(0)
+            sublayers = [
+                l
+                for l in self._parse_multi_layer_str(layer)[0]
+                if l not in self._bg_layers
+            ]
+            if len(sublayers) == 0:
+                continue
+
+            if not self._prefetch_fits_cache(len(sublayers)):
+                _log.debug("EOmaps: Prefetching stopped (background cache is full).")
+                self.cancel_prefetch()
+                return
+
+            _log.debug(f"EOmaps: Prefetching layer '{layer}'")
+            # fetching layers clears the renderer so we need to restore the
+            # current state of the canvas afterwards
+            init_bg = renderer.copy_from_bbox(self.figure.bbox)
+            try:
+                for l in sublayers:
+                    # execute actions on layer-changes
+                    # (to make sure all lazy WMS services are properly added)
+                    self._do_on_layer_change(layer=l, new=False)
+                    self.fetch_bg(l)
+            finally:
+                self.canvas.restore_region(init_bg)
+            break
+
+        if len(self._prefetch_queue) > 0:
+            self._prefetch_timer.start()
+        else:
+            self._disconnect_prefetch_callbacks()
+
+    def bg_cache_info(self):
+        """
+        Get statistics of the cache for fetched background-layers.
+
+        The max. size of the cache can be set with `Maps.config(bg_cache_size=...)`.
+
+        Returns
+        -------
+        info : dict
+            A dict with the number of hits, misses and evictions, the number
+            of cached layers, the size of all cached buffers ("nbytes") and the
+            max. size of the cache ("maxsize") in bytes.
+
+        """
+        return self._bg_layers.cache_info()
+
+    @property
+    def profiler(self):
+        """
+        The profiler used to record timings of the rendering stages.
+
+        The profiler is only active within :py:meth:`profile` or if profiling is
+        enabled for all figures via `Maps.config(profile=True)`.
+        """
+        return self._profiler
+
+    @contextmanager
+    def profile(self, clear=True):
+        """
+        Record timings of all rendering stages within a context.
+
+        Timings are recorded per stage (e.g. "fetch_bg", "draw_artist",
+        "combine_bgs", "update", "blit", "get_props", "get_coll") together with
+        the associated layer and artist. Hits and misses of the background-cache
+        ("bg_layers"), combined layers ("composite") and the datasets ("data")
+        are counted as well.
+
+        >>> with m.BM.profile() as p:
+        >>>     m.show_layer("A")
+        >>> p.report()  # a dict with a summary of all timings
+        >>> p.to_dataframe()  # a pandas.DataFrame of all recorded events
+        >>> p.to_chrome_trace("trace.json")  # open with https://ui.perfetto.dev
+
+        Parameters
+        ----------
+        clear : bool, optional
+            If True, previously recorded timings are removed. The default is True.
+
+        Yields
+        ------
+        profiler : RenderProfiler
+            The profiler used to record the timings.
+
+        """
+        enabled = self._profiler.enabled
+        if clear:
+            self._profiler.clear()
+
+        try:
+            self._profiler.enabled = True
+            yield self._profiler
+        finally:
+            self._profiler.enabled = enabled
+
     @property
     def figure(self):
         """The matplotlib figure instance."""
@@ -526,9 +1354,11 @@ class BlitManager(LayerParser):
         if layer == "all":
             # if the all layer changed, all backgrounds need a refetch
             self._refetch_bg = True
+            self._bg_previews.clear()
         else:
             # set any background that contains the layer for refetch
             self._layers_to_refetch.add(layer)
+            self._bg_previews.pop(layer, None)
 
             for l in self._bg_layers:
                 sublayers, _ = self._parse_multi_layer_str(l)
@@ -655,48 +1485,66 @@ class BlitManager(LayerParser):
         """
         return self._parse_multi_layer_str(self.bg_layer)
 
-    # cache the last 10 combined backgrounds to avoid re-combining backgrounds
-    # on updates of interactive artists
-    # cache is automatically cleared on draw if any layer is tagged for re-fetch!
-    @lru_cache(10)
     def _combine_bgs(self, layer):
+        with self._profiler.stage("combine_bgs", layer=layer):
+            return self._do_combine_bgs(layer)
+
+    def _do_combine_bgs(self, layer):
         layers, alphas = self._parse_multi_layer_str(layer)
 
         # make sure all layers are already fetched
+        # (or shifted previews of the layers are available)
         for l in layers:
-            if l not in self._bg_layers:
+            if l in self._bg_layers:
+                self._profiler.count("bg_layers", True)
+            elif not self._use_bg_preview(l):
                 # execute actions on layer-changes
                 # (to make sure all lazy WMS services are properly added)
                 self._do_on_layer_change(layer=l, new=False)
                 self.fetch_bg(l)
 
         renderer = self._get_renderer()
-        # clear the renderer to avoid drawing on existing backgrounds
-        renderer.clear()
-        if renderer:
-            gc = renderer.new_gc()
-            gc.set_clip_rectangle(self.canvas.figure.bbox)
+        if renderer is None:
+            return None
 
-            x0, y0, w, h = self.figure.bbox.bounds
-            for l, a in zip(layers, alphas):
-                rgba = self._get_array(l, a=a)
-                if rgba is None:
-                    # to handle completely empty layers
-                    continue
-                renderer.draw_image(
-                    gc,
-                    int(x0),
-                    int(y0),
-                    rgba[int(y0) : int(y0 + h), int(x0) : int(x0 + w), :],
-                )
-            bg = renderer.copy_from_bbox(self._m.f.bbox)
-            gc.restore()
-            return bg
+        sources, cache = [], True
+        for l in layers:
+            if l in self._bg_layers:
+                sources.append(self._bg_layers[l])
+            elif l in self._pending_bg_previews:
+                # don't cache composites of previews (they are re-drawn on a timer)
+                rgba = self._get_preview_array(l)
+                sources.append(None if rgba is None else rgba[::-1])
+                cache = False
+            else:
+                # to handle completely empty layers
+                sources.append(None)
+
+        # cache composites to avoid re-combining backgrounds on updates of
+        # interactive artists (composites are re-combined if a layer is re-fetched)
+        key = (tuple(layers), tuple(alphas), self.figure.bbox.bounds, self.figure.dpi)
+
+        hits = self._compositor.hits
+        bg = self._compositor.composite(
+            layers,
+            alphas,
+            sources,
+            new_region=lambda: renderer.copy_from_bbox(self.figure.bbox),
+            key=key if cache else None,
+        )
+        self._profiler.count("composite", self._compositor.hits > hits)
+
+        return bg
 
     def _get_array(self, l, a=1):
-        if l not in self._bg_layers:
+        if l in self._pending_bg_previews and l not in self._bg_layers:
+            rgba = self._get_preview_array(l)
+            if rgba is None:
+                return None
+        elif l not in self._bg_layers:
             return None
-        rgba = np.array(self._bg_layers[l])[::-1, :, :]
+        else:
+            rgba = np.array(self._bg_layers[l])[::-1, :, :]
         if a != 1:
             rgba = rgba.copy()
             rgba[..., -1] = (rgba[..., -1] * a).astype(rgba.dtype)
@@ -751,8 +1599,9 @@ class BlitManager(LayerParser):
 
             # execute actions before fetching new artists
             # (e.g. update data based on extent etc.)
-            for action in self._before_fetch_bg_actions:
-                action(layer=layer, bbox=bbox)
+            with self._profiler.stage("before_fetch_bg", layer=layer):
+                for action in self._before_fetch_bg_actions:
+                    action(layer=layer, bbox=bbox)
 
             # get all relevant artists to plot and remember zorders
             # self.get_bg_artists() already returns artists sorted by zorder!
@@ -773,10 +1622,14 @@ class BlitManager(LayerParser):
                 return
 
             if renderer:
+                self._bg_layers.misses += 1
                 for art in allartists:
                     if art not in self._hidden_artists:
                         try:
-                            art.draw(renderer)
+                            with self._profiler.stage(
+                                "draw_artist", layer=layer, artist=art
+                            ):
+                                art.draw(renderer)
                             art.stale = False
                         except Exception:
                             if _log.getEffectiveLevel() <= logging.DEBUG:
@@ -788,6 +1641,7 @@ class BlitManager(LayerParser):
                                 )
 
                 self._bg_layers[layer] = renderer.copy_from_bbox(bbox)
+                self._bg_previews.pop(layer, None)
 
     def fetch_bg(self, layer=None, bbox=None):
         """
@@ -809,12 +1663,16 @@ class BlitManager(LayerParser):
         if layer is None:
             layer = self.bg_layer
 
+        # (combined layers are counted as hits or misses of the composites)
+        if "|" not in layer:
+            self._profiler.count("bg_layers", layer in self._bg_layers)
+
         if layer in self._bg_layers:
             # don't re-fetch existing layers
             # (layers get cleared automatically if re-draw is necessary)
             return
 
-        with self._disconnect_draw():
+        with self._disconnect_draw(), self._profiler.stage("fetch_bg", layer=layer):
             self._do_fetch_bg(layer, bbox)
 
     @contextmanager
@@ -860,12 +1718,14 @@ class BlitManager(LayerParser):
             if event.canvas != cv:
                 raise RuntimeError
         try:
+            self._drawing = True
             # reset all background-layers and re-fetch the default one
             if self._refetch_bg:
+                self._update_bg_previews()
                 self._bg_layers.clear()
                 self._layers_to_refetch.clear()
                 self._refetch_bg = False
-                type(self)._combine_bgs.cache_clear()  # clear combined_bg cache
+                self._compositor.clear()  # clear combined backgrounds
 
             else:
                 # in case there is a stale (unmanaged) artists and the
@@ -876,12 +1736,11 @@ class BlitManager(LayerParser):
                     a.stale for a in self._get_unmanaged_artists()
                 ):
                     self._refetch_layer(self._unmanaged_artists_layer)
-                    type(self)._combine_bgs.cache_clear()  # clear combined_bg cache
 
                 # remove all cached backgrounds that were tagged for refetch
+                # (combined backgrounds are automatically re-combined)
                 while len(self._layers_to_refetch) > 0:
                     self._bg_layers.pop(self._layers_to_refetch.pop(), None)
-                    type(self)._combine_bgs.cache_clear()  # clear combined_bg cache
 
             # workaround for nbagg backend to avoid glitches
             # it's slow but at least it works...
@@ -902,6 +1761,8 @@ class BlitManager(LayerParser):
             # we need to catch exceptions since QT does not like them...
             if loglevel <= 5:
                 _log.log(5, "There was an error during draw!", exc_info=True)
+        finally:
+            self._drawing = False
 
     def add_artist(self, *artists, layer=None):
         """
@@ -942,6 +1803,7 @@ class BlitManager(LayerParser):
             else:
                 art.set_animated(True)
                 self._artists[layer].append(art)
+                self._add_managed_artist(art)
 
                 if isinstance(art, plt.Axes):
                     self._managed_axes.add(art)
@@ -994,6 +1856,7 @@ class BlitManager(LayerParser):
 
             art.set_animated(True)
             self._bg_artists.setdefault(layer, []).append(art)
+            self._add_managed_artist(art)
 
             if isinstance(art, plt.Axes):
                 self._managed_axes.add(art)
@@ -1044,6 +1907,7 @@ class BlitManager(LayerParser):
                 if art in val:
                     art.set_animated(False)
                     val.remove(art)
+                    self._remove_managed_artist(art)
 
                     # remove axes from the managed_axes set as well!
                     if art in self._managed_axes:
@@ -1058,6 +1922,7 @@ class BlitManager(LayerParser):
             if art in self._bg_artists[layer]:
                 art.set_animated(False)
                 self._bg_artists[layer].remove(art)
+                self._remove_managed_artist(art)
 
                 # remove axes from the managed_axes set as well!
                 if art in self._managed_axes:
@@ -1098,6 +1963,7 @@ class BlitManager(LayerParser):
                 if art in layerartists:
                     art.set_animated(False)
                     layerartists.remove(art)
+                    self._remove_managed_artist(art)
 
                     # remove axes from the managed_axes set as well!
                     if art in self._managed_axes:
@@ -1107,6 +1973,7 @@ class BlitManager(LayerParser):
             if art in self._artists.get(layer, []):
                 art.set_animated(False)
                 self._artists[layer].remove(art)
+                self._remove_managed_artist(art)
 
                 # remove axes from the managed_axes set as well!
                 if art in self._managed_axes:
@@ -1121,7 +1988,7 @@ class BlitManager(LayerParser):
             _log.error(f"EOmaps: unalble to identify zorder of {a}... using 99")
             return 99
 
-    def _draw_animated(self, layers=None, artists=None):
+    def _draw_animated(self, layers=None, artists=None, bg=None):
         """
         Draw animated artists
 
@@ -1129,11 +1996,19 @@ class BlitManager(LayerParser):
         - if layers is not None: all artists from the selected layers will be re-drawn
         - if artists is not None: all provided artists will be redrawn
 
+        If the restored background `bg` is provided, artists that did not change
+        since the last update are restored from a cached overlay. Only the region
+        that changed (e.g. the old and new extents of stale artists) is re-drawn
+        (with all artists that overlap with this region).
+
+        Returns a list of all drawn artists (incl. unmanaged axes) and a set of
+        the artists that were stale before drawing.
+
         """
         fig = self.canvas.figure
         renderer = self._get_renderer()
         if renderer is None:
-            return
+            return [], set()
 
         if layers is None:
             active_layers, _ = self._get_active_layers_alphas
@@ -1157,8 +2032,7 @@ class BlitManager(LayerParser):
         # TODO would be nice to find a better way to handle this!
         # - NOTE: this must be done before drawing managed artists to properly support
         #   temporary artists on unmanaged axes!
-        for ax in self._get_unmanaged_axes():
-            ax.draw(renderer)
+        unmanaged_axes = list(self._get_unmanaged_axes())
 
         # redraw artists from the selected layers and explicitly provided artists
         # (sorted by zorder for each layer)
@@ -1167,6 +2041,23 @@ class BlitManager(LayerParser):
             for layer in layers
         )
 
+        drawn = [*unmanaged_axes, *chain(*layer_artists, artists)]
+        # remember stale artists (drawing an artist resets the stale-state)
+        stale = {a for a in drawn if a.stale}
+
+        # check if unchanged artists can be restored from the cached overlay
+        if bg is not None:
+            redraw = self._get_overlay_redraw(bg, drawn, stale, renderer)
+        else:
+            redraw, self._overlay = None, None
+
+        if redraw is None:
+            # re-draw all artists
+            bbox, redraw = None, drawn
+        else:
+            bbox, redraw = redraw
+
+        managed_axes_stale = {ax: ax.stale for ax in self._managed_axes}
         with ExitStack() as stack:
             # avoid drawing the background-patches of managed (dynamic) axes
             # since they might interfere with consecutive draws issued by callbacks
@@ -1175,22 +2066,246 @@ class BlitManager(LayerParser):
                     ax_i.patch._cm_set(facecolor="none", edgecolor="none")
                 )
 
-            for a in chain(*layer_artists, artists):
+            for a in redraw:
                 fig.draw_artist(a)
 
-    def _get_unmanaged_artists(self):
-        # return all artists not explicitly managed by the blit-manager
-        # (e.g. any artist added via cartopy or matplotlib functions)
-        managed_artists = set(
-            chain(
-                *self._bg_artists.values(),
-                *self._artists.values(),
-                self._ignored_unmanaged_artists,
+        if bbox is not None:
+            # put the re-drawn region on top of the cached overlay
+            region = self.canvas.copy_from_bbox(bbox)
+            self.canvas.restore_region(self._overlay[2])
+            self.canvas.restore_region(region)
+        elif redraw is not drawn:
+            # nothing changed
+            self.canvas.restore_region(self._overlay[2])
+
+        if bg is not None and (bbox is not None or redraw is drawn):
+            self._overlay = (
+                bg,
+                tuple(drawn),
+                self.canvas.copy_from_bbox(self.figure.bbox),
             )
+
+        # temporarily changing the background-patches marks managed axes as stale
+        for ax, was_stale in managed_axes_stale.items():
+            if not was_stale or ax in stale:
+                ax.patch.stale = False
+                ax.stale = False
+
+        return drawn, stale
+
+    def _get_overlay_redraw(self, bg, artists, stale, renderer):
+        # get the region that changed since the cached overlay was stored and
+        # the artists that must be re-drawn on top of the background in this region
+        # Returns None if the cached overlay cannot be used.
+        if self._overlay is None:
+            return None
+
+        overlay_bg, overlay_artists, _ = self._overlay
+        prev_bg, prev_extents = self._blit_extents
+        if overlay_bg is not bg or prev_bg is not bg:
+            return None
+
+        # the order of unchanged artists must be the same
+        drawn, cached = set(artists), set(overlay_artists)
+        if [a for a in artists if a in cached] != [
+            a for a in overlay_artists if a in drawn
+        ]:
+            return None
+
+        extents, dirty = dict(), []
+        for a in overlay_artists:
+            if a not in prev_extents:
+                return None
+            if a not in drawn:
+                # the region of removed artists
+                dirty.append(prev_extents[a])
+
+        for a in artists:
+            if a in stale or a not in cached:
+                try:
+                    extents[a] = self._get_artist_extent(a, renderer)
+                except Exception:
+                    return None
+                dirty.extend((prev_extents.get(a, None), extents[a]))
+            elif prev_extents[a] is None and a.get_visible():
+                # the region of the artist is unknown
+                return None
+            else:
+                extents[a] = prev_extents[a]
+
+        dirty = [i for i in dirty if i is not None]
+        if len(dirty) == 0:
+            return None, []
+
+        bbox = Bbox.intersection(Bbox.union(dirty).padded(2), self.figure.bbox)
+        if bbox is None:
+            return None, []
+
+        (x0, y0), (x1, y1) = np.floor(bbox.p0), np.ceil(bbox.p1)
+        bbox = Bbox.from_extents(x0, y0, x1, y1)
+
+        # only artists that overlap with the changed region must be re-drawn
+        redraw = [
+            a for a in artists if extents[a] is not None and extents[a].overlaps(bbox)
+        ]
+        return bbox, redraw
+
+    @staticmethod
+    def _get_artist_extent(a, renderer):
+        # get the window-extent of an artist (None if the artist is not drawn)
+        if not a.get_visible():
+            return None
+
+        if isinstance(a, Axes):
+            bbox = a.get_tightbbox(renderer)
+        else:
+            bbox = a.get_window_extent(renderer)
+
+        # text-artists don't include the background-patch in the window-extent
+        get_patch = getattr(a, "get_bbox_patch", None)
+        if get_patch is not None and get_patch() is not None:
+            bbox = Bbox.union([bbox, get_patch().get_window_extent(renderer)])
+
+        if bbox is None or not np.isfinite(bbox.get_points()).all():
+            raise ValueError(f"EOmaps: Unable to determine the extent of {a}.")
+
+        return bbox
+
+    def _get_blit_bbox(self, bg, artists, stale, full=False, blit=True):
+        # get the region of the figure that changed since the last blit
+        # (e.g. the union of the old and new extents of all changed artists)
+        # Returns the full figure-bbox if the whole figure needs to be re-drawn
+        # and None if there is nothing to blit.
+        renderer = self._get_renderer()
+        prev_bg, prev_extents = self._blit_extents
+
+        # the whole figure changed if the background changed
+        full = full or bg is not prev_bg or self._mpl_backend_force_full
+
+        extents, dirty = dict(), []
+        for a in artists:
+            if a not in stale and a in prev_extents:
+                extents[a] = prev_extents[a]
+                continue
+
+            try:
+                extents[a] = self._get_artist_extent(a, renderer)
+                # (evaluating the extent of some artists marks them as stale)
+                a.stale = False
+            except Exception:
+                extents[a], full = None, True
+
+            dirty.extend((prev_extents.get(a, None), extents[a]))
+
+        # regions of artists that have been removed
+        dirty.extend(ext for a, ext in prev_extents.items() if a not in extents)
+
+        self._blit_extents = (bg, extents)
+
+        if self._drawing:
+            # the whole canvas is re-drawn on draw-events
+            self._pending_blit.clear()
+            return None
+
+        # accumulate changes until the next blit
+        self._pending_blit.extend(
+            (self.figure.bbox,) if full else (i for i in dirty if i is not None)
         )
 
+        if not blit or len(self._pending_blit) == 0:
+            return None
+
+        bbox = Bbox.union(self._pending_blit).padded(2)
+        self._pending_blit.clear()
+
+        bbox = Bbox.intersection(bbox, self.figure.bbox)
+        if bbox is None:
+            return None
+
+        # blit whole pixels
+        (x0, y0), (x1, y1) = np.floor(bbox.p0), np.ceil(bbox.p1)
+        return Bbox.from_extents(x0, y0, x1, y1)
+
+    def _add_managed_artist(self, art):
+        self._managed_artists[art] += 1
+        self._unmanaged_recheck.add(art)
+
+    def _remove_managed_artist(self, art):
+        n = self._managed_artists.pop(art, 0) - 1
+        if n > 0:
+            self._managed_artists[art] = n
+        self._unmanaged_recheck.add(art)
+
+    def _untrack_axes_children(self, ax):
+        for a in [a for a, a_ax in self._axes_children.items() if a_ax is ax]:
+            del self._axes_children[a]
+            self._unmanaged_recheck.add(a)
+        self._axes_snapshots.pop(ax, None)
+
+    @staticmethod
+    def _get_axes_children(ax):
+        # get the children of an axes (excluding spines, axis, titles, legends,
+        # child-axes and the axes-patch)
+        exclude = {
+            ax.patch,
+            ax.xaxis,
+            ax.yaxis,
+            ax.title,
+            ax._left_title,
+            ax._right_title,
+            ax.legend_,
+            *ax.spines.values(),
+            *ax.child_axes,
+        }
+        return [a for a in ax.get_children() if a not in exclude]
+
+    def _update_unmanaged_artists(self, axes):
+        # evaluate all changes of managed artists and children of the map-axes
+        # since the last call (only re-checks artists that actually changed)
+        for ax in set(self._axes_snapshots).difference(axes):
+            self._untrack_axes_children(ax)
+
+        for ax in axes:
+            children = self._get_axes_children(ax)
+
+            # only re-scan the children if the number of children or the
+            # last children of the axes changed
+            snapshot = (len(children), children[-self._axes_snapshot_size :])
+            prev = self._axes_snapshots.get(ax, None)
+            if (
+                prev is not None
+                and prev[0] == snapshot[0]
+                and all(a is b for a, b in zip(prev[1], snapshot[1]))
+            ):
+                continue
+
+            self._axes_snapshots[ax] = snapshot
+
+            new = set(children)
+            old = {a for a, a_ax in self._axes_children.items() if a_ax is ax}
+            for a in old.difference(new):
+                del self._axes_children[a]
+                self._unmanaged_recheck.add(a)
+            for a in new.difference(old):
+                self._axes_children[a] = ax
+                self._unmanaged_recheck.add(a)
+
+        while len(self._unmanaged_recheck) > 0:
+            a = self._unmanaged_recheck.pop()
+            if a in self._axes_children and a not in self._managed_artists:
+                self._unmanaged_artists.add(a)
+            else:
+                self._unmanaged_artists.discard(a)
+
+    def _get_unmanaged_artists(self):
+        # return all artists not explicitly managed by the blit-manager
+        # (e.g. any artist added via cartopy or matplotlib functions)
         axes = {m.ax for m in (self._m, *self._m._children) if m.ax is not None}
 
+        # children of the axes are tracked incrementally to avoid checking all
+        # (managed) artists on each draw
+        self._update_unmanaged_artists(axes)
+
         allartists = set()
         for ax in axes:
             # only include axes titles if they are actually set
@@ -1201,15 +2316,18 @@ class BlitManager(LayerParser):
                 if len(i.get_text()) > 0
             ]
 
-            axartists = {
-                *ax._children,
-                *titles,
-                *([ax.legend_] if ax.legend_ is not None else []),
-            }
+            allartists.update(titles)
+            if ax.legend_ is not None:
+                allartists.add(ax.legend_)
 
-            allartists.update(axartists)
+        allartists.update(self._unmanaged_artists)
 
-        return allartists.difference(managed_artists)
+        return {
+            a
+            for a in allartists
+            if a not in self._managed_artists
+            and a not in self._ignored_unmanaged_artists
+        }
 
     def _clear_all_temp_artists(self):
         for method in self._m.cb._methods:
@@ -1352,11 +2470,16 @@ class BlitManager(LayerParser):
         # add additional layers (background, spines etc.)
         show_layer = self._get_showlayer_name()
 
-        if show_layer not in self._bg_layers:
-            # make sure the background is properly fetched
-            self.fetch_bg(show_layer)
+        # make sure the background is properly fetched
+        # (cached backgrounds are not re-fetched)
+        self.fetch_bg(show_layer)
+
+        with self._profiler.stage("restore_bg", layer=show_layer):
+            bg = self._get_background(show_layer)
+            cv.restore_region(bg)
 
-        cv.restore_region(self._get_background(show_layer))
+        # after restore actions might change arbitrary parts of the figure
+        full = len(self._after_restore_actions) > 0
 
         # execute after restore actions (e.g. peek layer callbacks)
         while len(self._after_restore_actions) > 0:
@@ -1364,7 +2487,14 @@ class BlitManager(LayerParser):
             action()
 
         # draw all of the animated artists
-        self._draw_animated(layers=layers, artists=artists)
+        # (re-use unchanged artists if no after restore actions were executed)
+        with self._profiler.stage("draw_animated", layer=show_layer):
+            drawn, stale = self._draw_animated(
+                layers=layers, artists=artists, bg=None if full else bg
+            )
+        # get the region that changed since the last blit
+        blit_bbox = self._get_blit_bbox(bg, drawn, stale, full=full, blit=blit)
+
         if blit:
             # workaround for nbagg backend to avoid glitches
             # it's slow but at least it works...
@@ -1378,10 +2508,13 @@ class BlitManager(LayerParser):
                 class bbox:
                     bounds = bbox_bounds
 
-                cv.blit(bbox)
-            else:
+                with self._profiler.stage("blit", layer=show_layer):
+                    cv.blit(bbox)
+            elif blit_bbox is not None:
                 # update the GUI state
-                cv.blit(self.figure.bbox)
+                # (only blit the region where dynamic artists changed)
+                with self._profiler.stage("blit", layer=show_layer):
+                    cv.blit(blit_bbox)
 
         # execute all actions registered to be called after blitting
         while len(self._after_update_actions) > 0:
@@ -1395,6 +2528,40 @@ class BlitManager(LayerParser):
         if blit and BlitManager._snapshot_on_update is True:
             self._m.snapshot(clear=clear_snapshot)
 
+    def _render_frame(self, layer=None):
+        """
+        Render a layer from the cached backgrounds and get the figure as RGBA array.
+
+        A full draw of the figure is only performed if all backgrounds need to be
+        re-fetched (e.g. on the first call or after a resize of the figure).
+
+        Parameters
+        ----------
+        layer : str, optional
+            The layer to render. If None, the currently visible layer is used.
+            The default is None.
+
+        Returns
+        -------
+        rgba : np.ndarray
+            A copy of the canvas buffer with shape (height, width, 4).
+
+        """
+        if layer is not None:
+            self.bg_layer = layer
+
+        if self._refetch_bg:
+            self.canvas.draw()
+        else:
+            # remove cached backgrounds that were tagged for refetch
+            # (this is usually done on a draw-event)
+            while len(self._layers_to_refetch) > 0:
+                self._bg_layers.pop(self._layers_to_refetch.pop(), None)
+
+        self.update(blit=False)
+
+        return np.array(self.canvas.buffer_rgba())
+
     def blit_artists(self, artists, bg="active", blit=True):
         """
         Blit artists (optionally on top of a given background)
@@ -1416,6 +2583,9 @@ class BlitManager(LayerParser):
             _log.error("EOmaps: encountered a problem while trying to blit artists...")
             return
 
+        # the next update needs to blit the whole figure
+        self._blit_extents = (None, dict())
+
         # restore the background
         if bg is not None:
             if bg == "active":
@@ -1509,6 +2679,7 @@ class BlitManager(LayerParser):
         artists = self._bg_artists[layer]
         while len(artists) > 0:
             a = artists.pop()
+            self._remove_managed_artist(a)
             try:
                 self.remove_bg_artist(a, layer, draw=False)
                 # no need to remove spines (to avoid NotImplementedErrors)!
@@ -1526,6 +2697,7 @@ class BlitManager(LayerParser):
         artists = self._artists[layer]
         while len(artists) > 0:
             a = artists.pop()
+            self._remove_managed_artist(a)
             try:
                 self.remove_artist(a)
                 # no need to remove spines (to avoid NotImplementedErrors)!
@@ -1543,6 +2715,7 @@ class BlitManager(LayerParser):
             # remove cached background-layers
             if layer in self._bg_layers:
                 del self._bg_layers[layer]
+            self._bg_previews.pop(layer, None)
         except Exception:
             _log.debug(
                 "EOmaps-cleanup: Problem while clearing cached background layers"
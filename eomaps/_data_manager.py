@@ -4,16 +4,66 @@
 # See LICENSE in the root of the repository for full licensing details.
 
 import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+from functools import partial
 
 import numpy as np
 from pyproj import CRS, Transformer
+from matplotlib.backend_bases import TimerBase
+from matplotlib.image import AxesImage
 
 from .helpers import register_modules
 
 _log = logging.getLogger(__name__)
 
 
+def _is_dask_array(a):
+    # check if an object is a dask-array (without importing dask)
+    da = sys.modules.get("dask.array", None)
+    return da is not None and isinstance(a, da.Array)
+
+
+def _get_xarray_values(a):
+    # get the values of a xarray.DataArray (dask-backed arrays are kept lazy)
+    return a.data if _is_dask_array(a.data) else a.values
+
+
+class _JobCancelled(Exception):
+    """Raised to stop background-jobs that have been superseded by a newer job."""
+
+
 class DataManager:
+    # max. number of datapoints that are re-projected at once
+    # (see Maps.config(reproject_chunksize=...))
+    _reproject_chunksize = 1_000_000
+    # number of threads used for re-projection (0 = number of available CPUs)
+    # (see Maps.config(reproject_workers=...))
+    _reproject_workers = 0
+    # min. number of datapoints of rectilinear grids (1D coordinates + 2D data)
+    # that are plotted as "raster" to reproject only the visible part of the grid
+    # on demand (instead of reprojecting the full grid on plot_map)
+    # (see Maps.config(lazy_grid_threshold=...), 0 = always reproject the full grid)
+    _lazy_grid_threshold = 1_000_000
+    # on-disk cache for re-projected coordinates (None = no caching)
+    # (see Maps.config(reproject_cache=...))
+    _reproject_cache = None
+    # max. size of the on-disk cache in bytes
+    _reproject_cache_size = 1_000_000_000
+    # max. number of datapoints that are aggregated at once
+    # (see Maps.config(aggregate_chunksize=...))
+    _aggregate_chunksize = 10_000_000
+    # number of threads used for data-aggregation (0 = number of available CPUs)
+    # (see Maps.config(aggregate_workers=...))
+    _aggregate_workers = 1
+    # max. number of values used to evaluate histograms and classifications
+    # of lazy (dask) arrays
+    _lazy_sample_size = 10_000_000
+    # re-use the aggregated data of the previous extent on pan
+    # (see Maps.config(incremental_pan=...))
+    _incremental_pan = True
+
     def __init__(self, m):
         self.m = m
         self.last_extent = None
@@ -29,6 +79,28 @@ class DataManager:
 
         self._extent_margin_factor = 0.1
 
+        # a counter that is increased whenever the data changes
+        # (used to invalidate cached objects that depend on the data, e.g. m.tree)
+        self._props_version = 0
+
+        # cached overview-pyramid levels of the data (see `_get_overview()`)
+        self._overviews = dict()
+        self._overviews_key = None
+
+        # aggregated data of the last window (re-used on pan)
+        # (see `_get_incremental_props()`)
+        self._last_window = None
+
+        # background-worker to prepare data and collections
+        # (see `m.plot_map(background=True)`)
+        self._background = False
+        self._executor = None
+        self._job = None
+        self._job_token = 0
+        self._job_timer = None
+        # the extent for which data is selected by the pending background job
+        self._job_extent = None
+
     def set_margin_factors(self, radius_margin_factor, extent_margin_factor):
         """
         Set the margin factors that are applied to the plot extent
@@ -66,10 +138,14 @@ class DataManager:
 
     @property
     def x0(self):
+        if "x0" not in self._all_data and self._lazy_grid is not None:
+            self._reproject_lazy_grid()
         return self._all_data.get("x0", None)
 
     @property
     def y0(self):
+        if "y0" not in self._all_data and self._lazy_grid is not None:
+            self._reproject_lazy_grid()
         return self._all_data.get("y0", None)
 
     @property
@@ -96,6 +172,12 @@ class DataManager:
     def y0_1D(self):
         return getattr(self, "_y0_1D", None)
 
+    @property
+    def _lazy_grid(self):
+        # 1D coordinates and transformer of rectilinear grids whose reprojection
+        # is deferred until the data is actually selected (see `_prepare_data`)
+        return self._all_data.get("lazy_grid", None)
+
     def set_props(
         self,
         layer,
@@ -104,24 +186,79 @@ class DataManager:
         indicate_masked_points=True,
         dynamic=False,
         only_pick=False,
+        background=False,
+        on_ready=None,
     ):
         # cleanup existing callbacks before attaching new ones
         self.cleanup_callbacks()
+        # stop pending background jobs (they will be superseded)
+        self._cancel_job()
 
         self._only_pick = only_pick
+        self._background = background
 
         if self.m._data_plotted:
             self._remove_existing_coll()
 
-        self._all_data = self._prepare_data(assume_sorted=assume_sorted)
+        kwargs = dict(
+            layer=layer,
+            update_coll_on_fetch=update_coll_on_fetch,
+            indicate_masked_points=indicate_masked_points,
+            dynamic=dynamic,
+        )
+
+        if background:
+            # prepare the data in a background thread and continue once it's ready
+            def cb(result):
+                props, state = result
+                self._set_state(state)
+                self._set_all_data(props, **kwargs)
+                if on_ready is not None:
+                    on_ready()
+
+            self._run_in_background(
+                partial(self._get_prepared_data, assume_sorted=assume_sorted), cb
+            )
+        else:
+            self._set_all_data(
+                self._prepare_data(assume_sorted=assume_sorted), **kwargs
+            )
+            if on_ready is not None:
+                on_ready()
+
+    def _set_all_data(
+        self, props, layer, update_coll_on_fetch, indicate_masked_points, dynamic
+    ):
+        self._all_data = props
+        self._props_version += 1
+        self._overviews.clear()
+        self._last_window = None
+
+        # remember shapes for later use
+        # TODO remove this!
+        self.m._xshape = props["xorig"].shape
+        self.m._yshape = props["yorig"].shape
+        self.m._zshape = props["z_data"].shape
+
         self._indicate_masked_points = indicate_masked_points
         self.layer = layer
 
-        if len(self.x0) == 0:
+        if len(self.xorig) == 0:
             _log.info("EOmaps: There is no data to plot")
             return
 
-        if self.x0_1D is not None:
+        extent = None
+        if self._lazy_grid is not None:
+            # get the extent without re-projecting the full grid
+            extent = self._get_lazy_grid_extent()
+            if extent is None:
+                # fall back to reprojecting the full grid
+                self._reproject_lazy_grid()
+                self._all_data.pop("lazy_grid")
+
+        if extent is not None:
+            (self._x0min, self._x0max), (self._y0min, self._y0max) = extent
+        elif self.x0_1D is not None:
             # if we have 1D coordinates, use them to get the extent
             self._x0min, self._x0max = np.nanmin(self.x0_1D), np.nanmax(self.x0_1D)
             self._y0min, self._y0max = np.nanmin(self.y0_1D), np.nanmax(self.y0_1D)
@@ -151,6 +288,114 @@ class DataManager:
             # ("shade" shapes take care about updating the data themselves!)
             self.attach_callbacks(dynamic=dynamic)
 
+    def _set_state(self, state):
+        # assign attributes that have been determined by a (background) job
+        # (always executed on the main thread)
+        for key, val in state.items():
+            setattr(self, key, val)
+
+    def _background_supported(self):
+        # results of background jobs are passed to the main thread with a timer
+        # (timers of non-interactive backends are never executed!)
+        canvas = self.m.f.canvas
+        return getattr(type(canvas), "_timer_cls", TimerBase) is not TimerBase
+
+    def _run_in_background(self, func, on_done):
+        """
+        Execute a function in a background thread.
+
+        Previously submitted (and not yet finished) jobs are cancelled.
+
+        Parameters
+        ----------
+        func : callable
+            The function to execute. It is called with a single kwarg "token"
+            that must be forwarded to `_update_progress()` to report the progress
+            and to support cancellation of the job.
+        on_done : callable
+            A function that is called with the return-value of `func` once the
+            job is finished (executed on the main thread).
+
+        """
+        self._cancel_job()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="EOmaps_DataManager"
+            )
+
+        self._job_token += 1
+        future = self._executor.submit(func, token=self._job_token)
+        self._job = (future, on_done)
+
+        # regularly check for results
+        if self._job_timer is None:
+            self._job_timer = self.m.f.canvas.new_timer(interval=50)
+            self._job_timer.add_callback(self._check_job)
+        self._job_timer.start()
+
+    def _cancel_job(self):
+        if self._job is None:
+            return
+
+        future, _ = self._job
+        future.cancel()
+        self._job = None
+        # invalidate the token so that running jobs stop at the next checkpoint
+        self._job_token += 1
+
+        _log.debug("EOmaps: Background job cancelled.")
+        self.m._emit_signal("dataProgress", "cancelled", 0.0)
+
+    def _check_job(self):
+        # check if the pending background job is finished
+        # (executed on the main thread by the canvas-timer)
+        if self._job is None:
+            self._job_timer.stop()
+            return
+
+        future, on_done = self._job
+        if not future.done():
+            return
+
+        self._job = None
+        self._job_timer.stop()
+
+        try:
+            result = future.result()
+        except (_JobCancelled, CancelledError):
+            return
+        except Exception:
+            _log.exception("EOmaps: There was an error during a background job.")
+            return
+
+        on_done(result)
+
+    def _update_progress(self, token, stage, progress):
+        """
+        Report the progress of a background job.
+
+        Raises a `_JobCancelled` exception if the job has been cancelled.
+
+        Parameters
+        ----------
+        token : int or None
+            The job-token. If None, the function is not executed as background job.
+        stage : str
+            A description of the current processing step.
+        progress : float
+            The progress (0-1).
+
+        """
+        if token is None:
+            return
+
+        if token != self._job_token:
+            raise _JobCancelled
+
+        _log.debug(f"EOmaps: {stage} ({progress:.0%})")
+        self.m._emit_signal("dataProgress", stage, float(progress))
+
     def attach_callbacks(self, dynamic):
         if dynamic is True:
             if self.on_fetch_bg not in self.m.BM._before_update_actions:
@@ -243,7 +488,7 @@ class DataManager:
                 "EOmaps: provided dataset has more than 2 dimensions..."
                 f"({data[parameter].dims})."
             )
-            z_data = data[parameter].values
+            z_data = _get_xarray_values(data[parameter])
             data_dims = data[parameter].dims
         else:
             assert len(data.dims) <= 2, (
@@ -251,7 +496,7 @@ class DataManager:
                 f"({data.dims})."
             )
 
-            z_data = data.values
+            z_data = _get_xarray_values(data)
             data_dims = data.dims
             parameter = data.name
 
@@ -307,7 +552,7 @@ class DataManager:
             if val is None:
                 return True
 
-            if isinstance(val, (list, tuple, np.ndarray)):
+            if isinstance(val, (list, tuple, np.ndarray)) or _is_dask_array(val):
                 return True
 
             # lazily check if pandas was used
@@ -347,8 +592,8 @@ class DataManager:
             yorig = np.asanyarray(y)
 
         if data is not None:
-            # get the data-values
-            z_data = np.asanyarray(data)
+            # get the data-values (dask-arrays are kept lazy)
+            z_data = data if _is_dask_array(data) else np.asanyarray(data)
         else:
             if xorig.shape == yorig.shape:
                 z_data = np.full(xorig.shape, np.nan)
@@ -415,6 +660,35 @@ class DataManager:
         )
 
     def _prepare_data(self, assume_sorted=True):
+        props, state = self._get_prepared_data(assume_sorted=assume_sorted)
+        self._set_state(state)
+        return props
+
+    def _get_prepared_data(self, assume_sorted=True, token=None):
+        """
+        Identify and reproject the data.
+
+        The data-manager is not modified (so that the function can be executed
+        as background job). Attributes derived from the data are returned as
+        a separate dict that must be assigned with `_set_state()`.
+
+        Parameters
+        ----------
+        assume_sorted : bool, optional
+            Indicator if the coordinates are sorted. The default is True.
+        token : int or None, optional
+            The job-token (see `_update_progress()`). The default is None.
+
+        Returns
+        -------
+        props : dict
+            The prepared data.
+        state : dict
+            The attributes of the data-manager derived from the data.
+
+        """
+        self._update_progress(token, "Preparing data", 0)
+
         in_crs = self.m.data_specs.crs
         cpos = self.m.data_specs.cpos
         cpos_radius = self.m.data_specs.cpos_radius
@@ -428,11 +702,15 @@ class DataManager:
 
         # identify the provided data and get it in the internal format
         z_data, xorig, yorig, ids, parameter = self._identify_data()
+        self._update_progress(token, "Preparing data", 0.1)
 
         # check if Fill-value is provided, and mask the data accordingly
         if self.m.data_specs.encoding:
             fill_value = self.m.data_specs.encoding.get("_FillValue", None)
-            if fill_value:
+            if fill_value and _is_dask_array(z_data):
+                # keep dask-arrays lazy
+                z_data = sys.modules["dask.array"].ma.masked_equal(z_data, fill_value)
+            elif fill_value:
                 z_data = np.ma.MaskedArray(
                     data=z_data,
                     mask=z_data == fill_value,
@@ -472,13 +750,16 @@ class DataManager:
                     xs, ys = np.argsort(xorig), np.argsort(yorig)
                     np.take(xorig, xs, out=xorig, mode="wrap")
                     np.take(yorig, ys, out=yorig, mode="wrap")
-                    np.take(
-                        np.take(z_data, xs, 0),
-                        indices=ys,
-                        axis=1,
-                        out=z_data,
-                        mode="wrap",
-                    )
+                    if _is_dask_array(z_data):
+                        z_data = z_data[xs][:, ys]
+                    else:
+                        np.take(
+                            np.take(z_data, xs, 0),
+                            indices=ys,
+                            axis=1,
+                            out=z_data,
+                            mode="wrap",
+                        )
                 else:
                     _log.info(
                         "EOmaps: using 'assume_sorted=False' is only possible"
@@ -492,7 +773,8 @@ class DataManager:
                     + "...continuing without sorting."
                 )
 
-        self._z_transposed = False
+        state = dict(_z_transposed=False, _x0_1D=None, _y0_1D=None)
+        self._update_progress(token, "Preparing data", 0.2)
 
         if crs1 == crs2:
             if (
@@ -501,8 +783,7 @@ class DataManager:
                 and len(z_data.shape) == 2
             ):
                 # remember 1 dimensional coordinate vectors for querying
-                self._x0_1D = xorig
-                self._y0_1D = yorig
+                state.update(_x0_1D=xorig, _y0_1D=yorig)
                 if used_shape.name in ["shade_raster"]:
                     pass
                 else:
@@ -510,10 +791,37 @@ class DataManager:
                     xorig, yorig = np.meshgrid(xorig, yorig, copy=False)
 
                     z_data = z_data.T
-                    self._z_transposed = True
+                    state["_z_transposed"] = True
 
             x0, y0 = xorig, yorig
 
+        elif (
+            used_shape.name == "raster"
+            and len(xorig.shape) == 1
+            and len(yorig.shape) == 1
+            and len(z_data.shape) == 2
+            and self._lazy_grid_threshold > 0
+            and z_data.size >= self._lazy_grid_threshold
+            and not (crs1.is_geographic and np.nanmax(np.abs(xorig)) > 180)
+        ):
+            # for large rectilinear grids, keep the 1D coordinates and reproject
+            # only the visible part of the grid on demand (see `get_props`)
+            _log.info(
+                f"EOmaps: Deferring reprojection of {z_data.size} datapoints "
+                "to the visible extent."
+            )
+            props["lazy_grid"] = dict(
+                x=np.asanyarray(xorig),
+                y=np.asanyarray(yorig),
+                transformer=Transformer.from_crs(crs1, crs2, always_xy=True),
+                dx=np.nanmax(np.abs(np.diff(xorig))) if xorig.size > 1 else 0,
+                dy=np.nanmax(np.abs(np.diff(yorig))) if yorig.size > 1 else 0,
+            )
+
+            xorig, yorig = np.meshgrid(xorig, yorig, copy=False)
+            z_data = z_data.T
+            state["_z_transposed"] = True
+            x0 = y0 = None
         else:
             if z_data.size > 1e7:
                 _log.warning(
@@ -537,29 +845,236 @@ class DataManager:
                 and len(yorig.shape) == 1
                 and len(z_data.shape) == 2
             ):
+                key_coords = (xorig, yorig, True)
                 xorig, yorig = np.meshgrid(xorig, yorig, copy=False)
                 z_data = z_data.T
-                self._z_transposed = True
+                state["_z_transposed"] = True
+            else:
+                key_coords = (xorig, yorig, False)
 
-            x0, y0 = transformer.transform(xorig, yorig)
+            self._update_progress(token, "Reprojecting data", 0.3)
+            x0, y0 = self._transform_cached(
+                transformer, xorig, yorig, key_coords=key_coords, token=token
+            )
             _log.info("EOmaps: Done reprojecting")
 
+        self._update_progress(token, "Preparing data", 0.9)
+
         # use np.asanyarray to ensure that the output is a proper numpy-array
         # (relevant for categorical dtypes in pandas.DataFrames)
         props["xorig"] = np.asanyarray(xorig)
         props["yorig"] = np.asanyarray(yorig)
         props["ids"] = ids
-        props["z_data"] = np.asanyarray(z_data)
-        props["x0"] = np.asanyarray(x0)
-        props["y0"] = np.asanyarray(y0)
+        # (dask-arrays are kept lazy and only the selected data is computed)
+        props["z_data"] = z_data if _is_dask_array(z_data) else np.asanyarray(z_data)
+        if x0 is not None:
+            props["x0"] = np.asanyarray(x0)
+            props["y0"] = np.asanyarray(y0)
 
-        # remember shapes for later use
-        # TODO remove this!
-        self.m._xshape = props["x0"].shape
-        self.m._yshape = props["y0"].shape
-        self.m._zshape = props["z_data"].shape
+        self._update_progress(token, "Preparing data", 1)
+        return props, state
 
-        return props
+    def _transform_chunked(self, transformer, x, y, token=None):
+        """
+        Transform coordinates in chunks (in parallel threads).
+
+        The output is written to pre-allocated arrays to limit the peak memory
+        usage to the size of the output and a few chunks.
+
+        Parameters
+        ----------
+        transformer : pyproj.Transformer
+            The transformer to use.
+        x, y : array-like
+            The coordinates to transform (arrays must have the same shape).
+        token : int, optional
+            The token of the background-job (used to report the progress).
+            The default is None.
+
+        Returns
+        -------
+        x0, y0 : np.ndarray
+            The transformed coordinates.
+
+        """
+        x, y = np.asanyarray(x), np.asanyarray(y)
+        chunksize = max(self._reproject_chunksize, 1)
+
+        if x.size <= chunksize or x.ndim == 0:
+            return transformer.transform(x, y)
+
+        # split the first axis into chunks
+        # (slices of 2D arrays remain views, even for broadcasted meshgrids)
+        rowsize = max(x.size // x.shape[0], 1)
+        step = max(chunksize // rowsize, 1)
+        chunks = [slice(i, i + step) for i in range(0, x.shape[0], step)]
+
+        x0 = np.empty(x.shape, dtype=float)
+        y0 = np.empty(y.shape, dtype=float)
+
+        def transform_chunk(s):
+            x0[s], y0[s] = transformer.transform(x[s], y[s])
+
+        nworkers = self._reproject_workers or os.cpu_count() or 1
+        nworkers = min(nworkers, len(chunks))
+
+        _log.debug(
+            f"EOmaps: Reprojecting {len(chunks)} chunks with {nworkers} threads."
+        )
+
+        # pyproj releases the GIL during transformations so using threads
+        # results in proper parallelization
+        executor = ThreadPoolExecutor(
+            max_workers=nworkers, thread_name_prefix="EOmaps_reproject"
+        )
+        try:
+            for i, _ in enumerate(executor.map(transform_chunk, chunks)):
+                self._update_progress(
+                    token, "Reprojecting data", 0.3 + 0.6 * (i + 1) / len(chunks)
+                )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return x0, y0
+
+    def _transform_cached(self, transformer, x, y, key_coords=None, token=None):
+        """
+        Transform coordinates and use the on-disk cache (if enabled).
+
+        Parameters
+        ----------
+        transformer : pyproj.Transformer
+            The transformer to use.
+        x, y : array-like
+            The coordinates to transform.
+        key_coords : tuple, optional
+            A tuple (x, y, grid) of the coordinates used to identify the
+            cache-entry (e.g. the 1D coordinate vectors of rectilinear grids).
+            If None, (x, y, False) is used. The default is None.
+        token : int, optional
+            The token of the background-job (used to report the progress).
+            The default is None.
+
+        Returns
+        -------
+        x0, y0 : np.ndarray or np.memmap
+            The transformed coordinates.
+
+        """
+        cache = self._reproject_cache
+        if cache is None:
+            return self._transform_chunked(transformer, x, y, token=token)
+
+        if key_coords is None:
+            key_coords = (x, y, False)
+
+        kx, ky, grid = key_coords
+        key = cache.get_key(kx, ky, transformer, grid=grid)
+
+        cached = cache.get(key)
+        if cached is not None and cached[0].shape == np.shape(x):
+            _log.info("EOmaps: Using cached re-projected coordinates")
+            return cached
+
+        x0, y0 = self._transform_chunked(transformer, x, y, token=token)
+        cache.put(key, x0, y0)
+        return x0, y0
+
+    def _compute_sample(self, a):
+        # compute a regularly strided subsample of a lazy (dask) array
+        step = int(np.ceil((a.size / self._lazy_sample_size) ** (1 / a.ndim)))
+        if step > 1:
+            _log.info(
+                f"EOmaps: Using every {step}th value of the lazy dataset "
+                f"along each axis ({a.shape})."
+            )
+            a = a[(slice(None, None, step),) * a.ndim]
+        return a.compute()
+
+    def _reproject_lazy_grid(self):
+        # reproject the full grid of a lazy rectilinear grid
+        # (only required if all coordinates are needed, e.g. for picking)
+        _log.info(
+            f"EOmaps: Starting to reproject {self.z_data.size} datapoints "
+            "of the full grid"
+        )
+        self._all_data["x0"], self._all_data["y0"] = self._transform_cached(
+            self._lazy_grid["transformer"],
+            self.xorig,
+            self.yorig,
+            key_coords=(self._lazy_grid["x"], self._lazy_grid["y"], True),
+        )
+        _log.info("EOmaps: Done reprojecting")
+
+    def _get_lazy_grid_corner(self, n):
+        # get the reprojected coordinates of the first (n x n) datapoints
+        # of a lazy rectilinear grid
+        return self._lazy_grid["transformer"].transform(
+            self.xorig[:n, :n], self.yorig[:n, :n]
+        )
+
+    def _get_lazy_grid_extent(self):
+        # estimate the extent of a lazy rectilinear grid in the plot-crs
+        # from the boundary and a subsample of the interior of the grid
+        # (None is returned if none of the points is valid in the plot-crs)
+        x, y = self._lazy_grid["x"], self._lazy_grid["y"]
+        transformer = self._lazy_grid["transformer"]
+
+        sx, sy = max(x.size // 100, 1), max(y.size // 100, 1)
+        xs = np.concatenate((x[::sx], x[-1:]))
+        ys = np.concatenate((y[::sy], y[-1:]))
+
+        xx, yy = np.meshgrid(xs, ys, copy=False)
+        xt, yt = [np.ravel(i) for i in transformer.transform(xx, yy)]
+
+        for bx, by in (
+            (x, np.full(x.shape, y[0])),
+            (x, np.full(x.shape, y[-1])),
+            (np.full(y.shape, x[0]), y),
+            (np.full(y.shape, x[-1]), y),
+        ):
+            bxt, byt = transformer.transform(bx, by)
+            xt, yt = np.concatenate((xt, bxt)), np.concatenate((yt, byt))
+
+        mask = np.isfinite(xt) & np.isfinite(yt)
+        if not mask.any():
+            return None
+
+        xt, yt = xt[mask], yt[mask]
+
+        return (xt.min(), xt.max()), (yt.min(), yt.max())
+
+    def _get_lazy_grid_q(self, extent):
+        # query a lazy rectilinear grid on the 1D coordinates in the input-crs
+        x0, x1, y0, y1 = extent
+        x, y = self._lazy_grid["x"], self._lazy_grid["y"]
+        dx, dy = self._lazy_grid["dx"], self._lazy_grid["dy"]
+
+        # clip the extent to the data-extent
+        # (to avoid transforming points outside the domain of the plot-crs)
+        x0, x1 = max(x0, self._x0min), min(x1, self._x0max)
+        y0, y1 = max(y0, self._y0min), min(y1, self._y0max)
+
+        try:
+            xmin, ymin, xmax, ymax = self._lazy_grid["transformer"].transform_bounds(
+                x0, y0, x1, y1, densify_pts=21, direction="INVERSE"
+            )
+        except Exception:
+            xmin = ymin = xmax = ymax = np.nan
+
+        # add a margin of 1 pixel to include partially visible pixels
+        # (if the bounds can not be determined, fall back to the full grid)
+        if np.isfinite((xmin, xmax)).all() and xmin <= xmax:
+            qx = (x >= xmin - dx) & (x <= xmax + dx)
+        else:
+            qx = np.ones(x.shape, dtype=bool)
+
+        if np.isfinite((ymin, ymax)).all() and ymin <= ymax:
+            qy = (y >= ymin - dy) & (y <= ymax + dy)
+        else:
+            qy = np.ones(y.shape, dtype=bool)
+
+        return None, qx, qy
 
     def _set_cpos(self, x, y, radiusx, radiusy, cpos):
         # use x = x + ...   instead of x +=  to allow casting from int to float
@@ -701,6 +1216,8 @@ class DataManager:
         if self.extent_changed:
             return True
 
+        # the existing collection can be re-used
+        self.m.BM._profiler.count("data", True)
         return False
 
     def _remove_existing_coll(self):
@@ -879,49 +1396,137 @@ class DataManager:
             if check_redraw and not self.redraw_required(layer):
                 return
 
+            profiler = self.m.BM._profiler
+            profiler.count("data", False)
+
             # check if the data_manager has no data assigned
-            if self.x0 is None and self.m.coll is not None:
+            if self.z_data is None and self.m.coll is not None:
                 self._remove_existing_coll()
                 return False
 
-            props = self.get_props()
-            if props is None or props["x0"] is None or props["y0"] is None:
-                # fail-fast in case the data is completely outside the extent
-                return
-
-            s = self._get_datasize(**props)
-            self._print_datasize_warnings(s)
-            # stop here in case we are dealing with a pick-only dataset
-            if self._only_pick:
+            # shapes that are directly added to the axes can only be created
+            # on the main thread
+            if self._background and self.m.shape.name not in [
+                "scatter_points",
+                "contour",
+                "hexbin",
+            ]:
+                # select the data in a background thread and swap in the new
+                # collection once it's ready (the previous collection is kept
+                # until then)
+                extent = self.current_extent
+                if self._job is not None and extent == self._job_extent:
+                    # the data for this extent is already being selected
+                    return
+
+                self._job_extent = extent
+
+                self._run_in_background(
+                    partial(self._select_props_from_extent, extent=extent),
+                    partial(self._add_coll_from_props, layer=layer),
+                )
                 return
 
-            if props["x0"].size < 1 or props["y0"].size < 1:
-                # keep original data if too low amount of data is attempted
-                # to be plotted
+            with profiler.stage("get_props", layer=self.layer):
+                props = self.get_props()
+            if not self._check_props(props):
                 return
 
             # remove previous collection from the map
             self._remove_existing_coll()
             # draw the new collection
-            coll = self._get_coll(props, **self.m._coll_kwargs)
+            with profiler.stage("get_coll", layer=self.layer):
+                coll = self._get_coll(props, **self.m._coll_kwargs)
+            self._add_coll(coll, layer=layer)
+
+        except Exception as ex:
+            _log.exception(
+                f"EOmaps: Unable to plot the data for the layer '{layer}'!\n{ex}",
+                exc_info=_log.getEffectiveLevel() <= logging.DEBUG,
+            )
+
+    def _check_props(self, props):
+        # check if a collection should be created for the selected data
+        if props is None or props["x0"] is None or props["y0"] is None:
+            # fail-fast in case the data is completely outside the extent
+            return False
+
+        s = self._get_datasize(**props)
+        self._print_datasize_warnings(s)
+        # stop here in case we are dealing with a pick-only dataset
+        if self._only_pick:
+            return False
+
+        if props["x0"].size < 1 or props["y0"].size < 1:
+            # keep original data if too low amount of data is attempted
+            # to be plotted
+            return False
+
+        return True
+
+    def _select_props_from_extent(self, extent, token=None):
+        # select the data for a given extent
+        # (intended to be executed as background job, the data-manager is
+        # updated on the main thread, see `_add_coll_from_props()`)
+        self._update_progress(token, "Selecting data", 0)
+        state = dict()
+        with self.m.BM._profiler.stage("get_props", layer=self.layer):
+            props = self._select_props(extent, state, token=token)
+        self._update_progress(token, "Selecting data", 1)
+        return props, state
+
+    def _add_coll_from_props(self, result, layer):
+        # create and add the collection for data selected in a background job
+        # (artists are only created on the main thread)
+        props, state = result
+        try:
+            self._set_state(state)
+            self._current_data = props
+
+            if not self._check_props(props):
+                return
+
+            with self.m.BM._profiler.stage("get_coll", layer=self.layer):
+                coll = self._get_coll(props, **self.m._coll_kwargs)
+            self._add_coll(coll, layer=layer)
+        except Exception as ex:
+            _log.exception(
+                f"EOmaps: Unable to plot the data for the layer '{layer}'!\n{ex}",
+                exc_info=_log.getEffectiveLevel() <= logging.DEBUG,
+            )
+
+    def _add_coll(self, coll, layer):
+        # add a new collection to the map (and remove the existing one)
+        if coll is None:
+            return
+
+        try:
+            self._remove_existing_coll()
+
             coll.set_clim(self.m._vmin, self.m._vmax)
 
             coll.set_label("Dataset " f"({self.m.shape.name}  |  {self.z_data.shape})")
 
-            if self.m.shape.name not in ["scatter_points", "contour", "hexbin"]:
+            if isinstance(coll, AxesImage):
+                # regular grids of the "raster" shape are drawn as images
+                self.m.ax.add_image(coll)
+            elif self.m.shape.name not in ["scatter_points", "contour", "hexbin"]:
                 # avoid use "autolim=True" since it can cause problems in
                 # case the data-limits are infinite (e.g. for projected
                 # datasets containing points outside the used projection)
                 # the extent is set by calling "._set_lims()" in `m.plot_map()`
                 self.m.ax.add_collection(coll, autolim=False)
 
+            # set the collection before it is added to the blit-manager
+            # (adding bg-artists can trigger an immediate re-draw on non-interactive
+            # backends which would otherwise create yet another collection)
+            self.m._coll = coll
+
             if self.m._coll_dynamic:
                 self.m.BM.add_artist(coll, layer=self.layer)
             else:
                 self.m.BM.add_bg_artist(coll, layer=self.layer)
 
-            self.m._coll = coll
-
             # if required, add masked points indicators
             if self._indicate_masked_points is not False:
                 if isinstance(self._indicate_masked_points, dict):
@@ -963,9 +1568,12 @@ class DataManager:
             return True
         return False
 
-    def _get_q(self, *args, **kwargs):
+    def _get_q(self, extent=None):
         # identify the data mask
-        x0, x1, y0, y1 = self.current_extent
+        if extent is None:
+            extent = self.current_extent
+
+        x0, x1, y0, y1 = extent
 
         if self._radius_margin is not None:
             dx, dy = self._radius_margin
@@ -981,15 +1589,15 @@ class DataManager:
 
         # fail-fast in case the extent is completely outside the region
         if not self.data_in_extent((x0, x1, y0, y1)):
-            self.last_extent = (x0, x1, y0, y1)
-            self._current_data = None
             return None, None, None
 
+        if self._lazy_grid is not None:
+            # for lazy grids, query on the 1D coordinates in the input-crs
+            return self._get_lazy_grid_q((x0, x1, y0, y1))
+
         # in case the extent is larger than the full data,
         # there is no need to query!
         if self.full_data_in_extent((x0, x1, y0, y1)):
-            self.last_extent = self.current_extent
-            self._current_data = {**self._all_data}
             return True, True, True
 
         # get mask
@@ -1068,7 +1676,8 @@ class DataManager:
         elif all(i is None for i in (q, qx, qy)):
             ret = None
         else:
-            val = np.asanyarray(val)
+            if not _is_dask_array(val):
+                val = np.asanyarray(val)
 
             if (
                 len(val.shape) == 2
@@ -1190,24 +1799,27 @@ class DataManager:
 
         return view
 
-    def _zoom(self, blocksize):
+    def _zoom(self, data, blocksize, token=None):
+        # aggregate the selected data (the provided dict is updated inplace)
         method = getattr(self.m.shape, "_aggregator", "first")
         maxsize = getattr(self.m.shape, "_maxsize", None)
         order = getattr(self.m.shape, "_interp_order", 0)
         valid_fraction = getattr(self.m.shape, "_valid_fraction", 0)
 
         # only zoom if the shape provides a _maxsize attribute
-        if self._current_data["z_data"] is None or maxsize is None:
+        if data["z_data"] is None or maxsize is None:
             return
         elif blocksize is None:
             return
-        elif self._current_data["z_data"].size < maxsize:
+        elif data["z_data"].size < maxsize:
             return
 
         if method == "spline":
-            return self._zoom_scipy(maxsize, order)
+            return self._zoom_scipy(data, maxsize, order)
         else:
-            return self._zoom_block(maxsize, method, valid_fraction, blocksize)
+            return self._zoom_block(
+                data, maxsize, method, valid_fraction, blocksize, token=token
+            )
 
     def _fast_block_metric(self, blocks, bs, calc_mean=True):
         """
@@ -1218,101 +1830,519 @@ class DataManager:
         for the dtype of the input-array!
         """
         if isinstance(blocks, np.ma.masked_array):
-            valid_fraction = 0.5
+            # masked values are excluded via the "where" argument of the reduction
+            # (the input data is never modified)
+            return self._fast_nan_metric(
+                blocks, "mean" if calc_mean else "sum", ignore_nan=False
+            )
+
+        if calc_mean:
+            data = np.einsum("ijkl->ij", blocks) / np.prod(bs)
+        else:
+            data = np.einsum("ijkl->ij", blocks)
 
-            # make sure we don't count masked values
-            # (avoid using .filled since it creates a copy!)
-            blocks.data[blocks.mask] = 0
+        return data
 
-            if calc_mean:
-                data = np.einsum("ijkl->ij", blocks.data) / np.prod(bs)
-            else:
-                data = np.einsum("ijkl->ij", blocks.data)
+    def _get_valid_blocks(self, blocks, ignore_nan=True):
+        # get a boolean block-view of valid (e.g. not masked and not nan) values
+        # and an (optional) mask for blocks with too many masked values
+        mask = np.ma.getmask(blocks)
+        data = np.ma.getdata(blocks)
+
+        if ignore_nan and np.issubdtype(data.dtype, np.inexact):
+            valid = ~np.isnan(data)
+            if mask is not np.ma.nomask:
+                valid &= ~mask
+        elif mask is not np.ma.nomask:
+            valid = ~mask
+        else:
+            valid = None
 
-            if valid_fraction == 0:
-                mask = np.einsum("ijkl->ij", blocks.mask)
-            else:
-                # avoid einsum here to avoid casting the boolean array to int
-                nmask = np.count_nonzero(blocks.mask, axis=(-1, -2))
-                mask = nmask > valid_fraction * np.prod(bs)
+        if mask is np.ma.nomask:
+            return data, valid, None
+
+        valid_fraction = getattr(self.m.shape, "_valid_fraction", 0)
+        nmasked = self._reduce_blocks(np.add, mask, dtype=np.intp)
+        blockmask = nmasked > valid_fraction * np.prod(blocks.shape[-2:])
+
+        return data, valid, blockmask
+
+    @staticmethod
+    def _reduce_blocks(ufunc, blocks, **kwargs):
+        # reduce a 4D block-view with a numpy ufunc
+        # (reducing the rows of the blocks first is considerably faster than
+        # reducing both block-axes at once since the inner loops are longer)
+        return ufunc.reduce(ufunc.reduce(blocks, axis=2, **kwargs), axis=-1)
+
+    def _fast_nan_metric(self, blocks, metric, ignore_nan=True):
+        """
+        Fast nan- and mask-aware aggregation of blocks.
+
+        Masked values (and NaN values if `ignore_nan=True`) are ignored.
+        For masked arrays, blocks where the fraction of masked values exceeds
+        the "valid_fraction" of the shape are masked.
 
-            data = np.ma.masked_array(data, mask)
+        The input data is never modified (only a boolean array of valid values
+        is created).
+
+        Parameters
+        ----------
+        blocks : np.array or np.ma.masked_array
+            A 4D block-view of the data.
+        metric : str
+            One of "sum", "mean", "max", "count".
+        ignore_nan : bool
+            If True, NaN values are ignored. The default is True.
+
+        Returns
+        -------
+        aggregated : np.array or np.ma.masked_array
+            The aggregated array.
+
+        """
+        if metric not in ("sum", "mean", "max", "count"):
+            raise TypeError(f"EOmaps: '{metric}' is not a valid block-metric!")
+
+        data = np.ma.getdata(blocks)
+        if (
+            metric == "max"
+            and np.issubdtype(data.dtype, np.inexact)
+            and not isinstance(blocks, np.ma.masked_array)
+        ):
+            # fmax ignores NaN values (and returns NaN for all-NaN blocks)
+            return self._reduce_blocks(np.fmax, data)
+
+        data, valid, blockmask = self._get_valid_blocks(blocks, ignore_nan)
+
+        if valid is None:
+            count = np.full(data.shape[:2], np.prod(data.shape[-2:]), dtype=np.intp)
         else:
-            if calc_mean:
-                data = np.einsum("ijkl->ij", blocks) / np.prod(bs)
+            count = self._reduce_blocks(np.add, valid, dtype=np.intp)
+
+        if metric == "count":
+            out = count
+        elif metric == "max":
+            if np.issubdtype(data.dtype, np.inexact):
+                initial = -np.inf
+            elif np.issubdtype(data.dtype, np.integer):
+                initial = np.iinfo(data.dtype).min
             else:
-                data = np.einsum("ijkl->ij", blocks)
+                initial = False
 
-        return data
+            out = self._reduce_blocks(
+                np.maximum,
+                data,
+                where=True if valid is None else valid,
+                initial=initial,
+            )
+        else:
+            out = self._reduce_blocks(
+                np.add, data, where=True if valid is None else valid
+            )
+            if metric == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    out = np.true_divide(out, count)
 
-    def _zoom_block(self, maxsize, method, valid_fraction, blocksize):
-        # zoom data based on a given blocksize
-        bs = (blocksize, blocksize)
+        if metric != "count":
+            # blocks without any valid values
+            empty = count == 0
+            if np.issubdtype(out.dtype, np.inexact):
+                out[empty] = np.nan
+            elif empty.any():
+                blockmask = empty if blockmask is None else blockmask | empty
+
+        if blockmask is not None:
+            return np.ma.masked_array(out, blockmask)
 
-        zdata = self._current_data["z_data"]
-        blocks = self._block_view(zdata, bs)
+        return out
 
+    def _aggregate_blocks(self, blocks, method, bs):
+        # aggregate a block-view of the data with the given method
         if method == "first":
-            self._current_data["z_data"] = blocks[:, :, 0, 0]
+            return blocks[:, :, 0, 0]
         elif method == "last":
-            self._current_data["z_data"] = blocks[:, :, -1, -1]
+            return blocks[:, :, -1, -1]
         elif method == "min":
-            self._current_data["z_data"] = blocks.min(axis=(-1, -2))
+            return blocks.min(axis=(-1, -2))
         elif method == "max":
-            self._current_data["z_data"] = blocks.max(axis=(-1, -2))
+            return blocks.max(axis=(-1, -2))
         elif method == "mean":
-            self._current_data["z_data"] = blocks.mean(axis=(-1, -2))
+            return blocks.mean(axis=(-1, -2))
         elif method == "std":
-            self._current_data["z_data"] = blocks.std(axis=(-1, -2))
+            return blocks.std(axis=(-1, -2))
         elif method == "sum":
-            self._current_data["z_data"] = blocks.sum(axis=(-1, -2))
+            return blocks.sum(axis=(-1, -2))
         elif method == "median":
-            self._current_data["z_data"] = np.median(blocks, axis=(-1, -2))
+            return self._block_median(blocks)
         elif method == "mode":
-            from scipy.stats import mode
-
-            out, counts = mode(blocks, axis=(-1, -2), nan_policy="propagate")
-            self._current_data["z_data"] = out
+            return self._block_mode(blocks)
         elif method == "fast_sum":
-            self._current_data["z_data"] = self._fast_block_metric(blocks, bs, False)
+            return self._fast_block_metric(blocks, bs, False)
         elif method == "fast_mean":
-            self._current_data["z_data"] = self._fast_block_metric(blocks, bs, True)
+            return self._fast_block_metric(blocks, bs, True)
+        elif method == "fast_nanmean":
+            return self._fast_nan_metric(blocks, "mean")
+        elif method == "fast_nanmax":
+            return self._fast_nan_metric(blocks, "max")
+        elif method == "fast_count":
+            return self._fast_nan_metric(blocks, "count")
         else:
             raise TypeError(
                 f"EOmaps: The method {method} is not a valid aggregation-method!\n"
                 "Use one of:\n"
                 "['first', 'last', 'min', 'max', 'mean', 'std', 'median', "
-                "'fast_mean', 'fast_sum', 'spline']"
+                "'fast_mean', 'fast_sum', 'fast_nanmean', 'fast_nanmax', "
+                "'fast_count', 'spline']"
             )
 
+    @staticmethod
+    def _block_median(blocks):
+        # median of blocks based on partitioning (O(n) instead of a full sort)
+        if isinstance(blocks, np.ma.masked_array):
+            return np.median(blocks, axis=(-1, -2))
+
+        n = blocks.shape[-1] * blocks.shape[-2]
+        a = blocks.reshape(blocks.shape[:2] + (n,))
+
+        k = n // 2
+        kth = [k] if n % 2 else [k - 1, k]
+        # partition a copy (reshape returns a view of the data if the window
+        # is only one block wide)
+        a = np.partition(a, kth, axis=-1)
+        # use np.mean to get the same dtypes as np.median
+        med = np.mean(a[..., kth], axis=-1)
+
+        if np.issubdtype(a.dtype, np.inexact):
+            # propagate nan-values (same as np.median)
+            nanmask = np.isnan(a).any(axis=-1)
+            if nanmask.any():
+                med[nanmask] = np.nan
+
+        return med
+
+    @staticmethod
+    def _block_mode(blocks, maxbins=50_000_000):
+        # mode of blocks (histogram-based for integer data)
+        if not isinstance(blocks, np.ma.masked_array) and np.issubdtype(
+            blocks.dtype, np.integer
+        ):
+            nblocks = blocks.shape[0] * blocks.shape[1]
+            if nblocks > 0:
+                vmin, vmax = int(blocks.min()), int(blocks.max())
+                nbins = vmax - vmin + 1
+
+                if nblocks * nbins <= maxbins:
+                    # count the occurrences of each value in each block
+                    offsets = np.arange(nblocks, dtype=np.intp)[:, None] * nbins
+                    # (use intp to avoid overflows of small integer dtypes)
+                    idx = blocks.reshape(nblocks, -1).astype(np.intp) - vmin + offsets
+                    counts = np.bincount(idx.ravel(), minlength=nblocks * nbins)
+                    # argmax returns the smallest value in case of ties (as scipy)
+                    out = counts.reshape(nblocks, nbins).argmax(axis=-1) + vmin
+                    return out.astype(blocks.dtype).reshape(blocks.shape[:2])
+
+        from scipy.stats import mode
+
+        out, counts = mode(blocks, axis=(-1, -2), nan_policy="propagate")
+        return out
+
+    def _aggregate_streaming(self, a, method, bs, token=None):
+        """
+        Aggregate a 2D array in blocks.
+
+        The blocks are processed in row-strips to limit the size of temporary
+        arrays to approx. `Maps.config(aggregate_chunksize=...)` datapoints.
+        Strips are processed in parallel threads if
+        `Maps.config(aggregate_workers=...)` is not 1.
+
+        Parameters
+        ----------
+        a : np.array
+            The 2D array to aggregate.
+        method : str
+            The aggregation method.
+        bs : tuple
+            The blocksize.
+        token : int, optional
+            The token of the background-job (used to report the progress and
+            to stop cancelled jobs after each strip). The default is None.
+
+        Returns
+        -------
+        aggregated : np.array
+            The aggregated array.
+
+        """
+        blocks = self._block_view(a, bs)
+
+        nrows = blocks.shape[0]
+        rowsize = max(blocks.shape[1] * np.prod(bs), 1)
+        step = max(self._aggregate_chunksize // rowsize, 1)
+
+        if step >= nrows or method in ("first", "last"):
+            return self._aggregate_blocks(blocks, method, bs)
+
+        strips = [blocks[i : i + step] for i in range(0, nrows, step)]
+        nstrips = len(strips)
+
+        nworkers = self._aggregate_workers or os.cpu_count() or 1
+        nworkers = min(nworkers, nstrips)
+
+        aggregate = partial(self._aggregate_blocks, method=method, bs=bs)
+        if nworkers > 1:
+            # numpy releases the GIL for most reductions
+            executor = ThreadPoolExecutor(
+                max_workers=nworkers, thread_name_prefix="EOmaps_aggregate"
+            )
+            strips = executor.map(aggregate, strips)
+        else:
+            executor, strips = None, map(aggregate, strips)
+
+        results = []
+        try:
+            for strip in strips:
+                results.append(strip)
+                self._update_progress(token, "Aggregating data", len(results) / nstrips)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        if any(isinstance(i, np.ma.masked_array) for i in results):
+            return np.ma.concatenate(results)
+        return np.concatenate(results)
+
+    def _zoom_block(self, data, maxsize, method, valid_fraction, blocksize, token=None):
+        # zoom data based on a given blocksize
+        bs = (blocksize, blocksize)
+
+        zdata = data["z_data"]
+        if _is_dask_array(zdata):
+            data["z_data"] = self._aggregate_dask(zdata, method, bs, token=token)
+        else:
+            data["z_data"] = self._aggregate_streaming(zdata, method, bs, token=token)
+
         # aggregate coordinates
-        for key, val in self._current_data.items():
+        for key, val in data.items():
             if key.startswith("x") or key.startswith("y"):
-                self._current_data[key] = np.einsum(
-                    "ijkl->ij", self._block_view(val, bs)
-                ) / np.prod(bs)
+                blocks = self._block_view(val, bs)
+                data[key] = np.einsum("ijkl->ij", blocks) / np.prod(bs)
+
+                # data[key] = self._block_view(val, bs).mean(axis=(-1, -2))
 
-                # self._current_data[key] = self._block_view(val, bs).mean(axis=(-1, -2))
+    def _aggregate_dask(self, a, method, bs, token=None):
+        # aggregate a dask-array blockwise (only the aggregated blocks are computed)
 
-    def _zoom_scipy(self, maxsize, order):
+        # drop boundary pixels (same as in `_block_view`)
+        mods = np.mod(a.shape, bs)
+        starts, stops = mods // 2 + mods % 2, mods // 2
+        a = a[starts[0] : a.shape[0] - stops[0], starts[1] : a.shape[1] - stops[1]]
+
+        # make sure the chunks are multiples of the blocksize
+        a = a.rechunk(tuple(max(c // b, 1) * b for c, b in zip(a.chunksize, bs)))
+
+        def aggregate(x):
+            return self._aggregate_streaming(x, method, bs, token=token)
+
+        # evaluate the output-dtype on a single block
+        dtype = aggregate(np.zeros(bs, dtype=a.dtype)).dtype
+
+        return a.map_blocks(
+            aggregate,
+            chunks=tuple(tuple(c // b for c in cs) for cs, b in zip(a.chunks, bs)),
+            dtype=dtype,
+        ).compute()
+
+    def _zoom_scipy(self, data, maxsize, order):
         from scipy.ndimage import zoom
 
         # estimate scale to approx. 2D data size
-        scale = np.sqrt(maxsize / self._current_data["z_data"].size)
+        scale = np.sqrt(maxsize / data["z_data"].size)
         zoomargs = dict(zoom=scale, order=order, mode="reflect", cval=np.nan)
 
-        for key, val in self._current_data.items():
+        for key, val in data.items():
             if key == "ids":
                 continue
+            if _is_dask_array(val):
+                val = val.compute()
             if isinstance(val, np.ndarray) and len(val.shape) == 2:
-                self._current_data[key] = zoom(val, **zoomargs)
+                data[key] = zoom(val, **zoomargs)
             else:
-                self._current_data[key] = zoom(val, **zoomargs)
+                data[key] = zoom(val, **zoomargs)
+
+    @staticmethod
+    def _trim_to_blocks(a, bs):
+        # drop trailing boundary pixels so that the blocksize fits the array
+        return a[: a.shape[0] - a.shape[0] % bs, : a.shape[1] - a.shape[1] % bs]
+
+    def _get_overview(self, level, overviews, token=None):
+        """
+        Get a (cached) aggregated overview of the data.
+
+        The overview of pyramid-level n is aggregated in blocks of (2^n x 2^n)
+        pixels (e.g. level 0 is the full-resolution dataset).
+
+        Levels are computed lazily on first use. If possible, a level is
+        aggregated from the next-finer level, otherwise it is computed from the
+        full-resolution dataset.
+
+        Parameters
+        ----------
+        level : int
+            The pyramid-level.
+        overviews : dict
+            The cache of already computed levels. Newly computed levels are
+            added to the dict.
+        token : int, optional
+            The token of the background-job (see `_update_progress()`).
+            The default is None.
+
+        Returns
+        -------
+        overview : dict
+            A dict with the aggregated 2D arrays "xorig", "yorig", "x0", "y0"
+            and "z_data".
+
+        """
+        method = getattr(self.m.shape, "_aggregator", "first")
+
+        if level == 0:
+            return dict(
+                xorig=self.xorig,
+                yorig=self.yorig,
+                x0=self.x0,
+                y0=self.y0,
+                z_data=self.z_data,
+            )
+
+        overview = overviews.get(level, None)
+        if overview is not None:
+            return overview
+
+        _log.debug(f"EOmaps: Calculating overview level {level}")
+
+        prev = self._get_overview(level - 1, overviews, token=token)
+
+        overview = dict()
+        # aggregate coordinates
+        for key in ("xorig", "yorig", "x0", "y0"):
+            overview[key] = np.einsum(
+                "ijkl->ij", self._block_view(self._trim_to_blocks(prev[key], 2), (2, 2))
+            ) / np.prod((2, 2))
+
+        # check if the aggregated values of the next-finer level can be re-used
+        if method in ("first", "last", "min", "max", "sum"):
+            derive_from_prev = True
+        elif method in ("mean", "fast_mean", "fast_sum", "fast_nanmax"):
+            derive_from_prev = not isinstance(self.z_data, np.ma.masked_array)
+        else:
+            derive_from_prev = False
+
+        if derive_from_prev:
+            zdata, bs = prev["z_data"], (2, 2)
+        else:
+            zdata, bs = self.z_data, (2**level, 2**level)
+
+        overview["z_data"] = self._aggregate_streaming(
+            self._trim_to_blocks(zdata, bs[0]), method, bs, token=token
+        )
+
+        overviews[level] = overview
+        return overview
+
+    def _use_overviews(self, qs, slices, blocksize):
+        # check if the data should be selected from the overview-pyramid
+        if blocksize is None or not getattr(self.m.shape, "_overviews", False):
+            return False
+
+        if self._lazy_grid is not None or _is_dask_array(self.z_data):
+            return False
+
+        if getattr(self.m.shape, "_aggregator", "first") == "spline":
+            return False
+
+        if all(i is True for i in qs):
+            size = self.z_data.size
+        else:
+            x0, x1, y0, y1 = slices
+            size = (x1 - x0) * (y1 - y0)
+
+        return size >= self.m.shape._maxsize
+
+    def _select_overview(self, qs, slices, blocksize, state, token=None):
+        # select the visible data from the appropriate overview-level
+        # (e.g. the first level whose blocksize is larger than the required one)
+        level = max(int(np.ceil(np.log2(blocksize))), 1)
+        level = min(level, int(np.log2(min(self.z_data.shape))))
+
+        # re-use the cached levels (unless the aggregation method changed)
+        key = (
+            getattr(self.m.shape, "_aggregator", "first"),
+            getattr(self.m.shape, "_valid_fraction", 0),
+        )
+        overviews = dict(self._overviews) if self._overviews_key == key else dict()
+
+        overview = self._get_overview(level, overviews, token=token)
+        state.update(_overviews=overviews, _overviews_key=key)
+
+        if all(i is True for i in qs):
+            return dict(overview)
+
+        x0, x1, y0, y1 = slices
+        bs = 2**level
+        # round slice-boundaries to include all partially visible blocks
+        sx, sy = slice(x0 // bs, -(-x1 // bs)), slice(y0 // bs, -(-y1 // bs))
+
+        return {key: val[sy, sx] for key, val in overview.items()}
+
+    def get_props(self, extent=None):
+        # select the currently visible data
+        if extent is None:
+            extent = self.current_extent
+
+        state = dict()
+        props = self._select_props(extent, state)
+
+        self._set_state(state)
+        self._current_data = props
+        return props
+
+    def _select_props(self, extent, state, token=None):
+        """
+        Select (and aggregate) the data that is visible in a given extent.
+
+        The data-manager is not modified (so that the function can be executed
+        as background job). Attributes that must be updated once the selected
+        data is used are added to the provided `state` dict instead
+        (see `_set_state()`).
+
+        Parameters
+        ----------
+        extent : tuple
+            The extent (x0, x1, y0, y1) in the plot-crs.
+        state : dict
+            A dict that is updated with the attributes to set.
+        token : int, optional
+            The token of the background-job (see `_update_progress()`).
+            The default is None.
+
+        Returns
+        -------
+        props : dict
+            The selected data.
 
-    def get_props(self, *args, **kwargs):
+        """
         # get the masks to select the currently visible data
         # (qs = [<2d mask>, <1d x mask>, <1d y mask>]
-        qs = self._get_q()
+        qs = self._get_q(extent)
+
+        # shapes that cache cells of the full dataset (e.g. voronoi diagrams)
+        # select the visible cells themselves
+        if (
+            getattr(self.m.shape, "_select_cells", False)
+            and self._lazy_grid is None
+            and any(q is not None for q in qs)
+        ):
+            qs = (True, True, True)
 
         # estimate slices (and optional blocksize if required) for 2D data
         if len(self.z_data.shape) == 2 and all(i is not None for i in qs[1:]):
@@ -1322,10 +2352,20 @@ class DataManager:
 
         # remember last selection and slices (required in case explicit
         # colors are provided since they must be selected accordingly)
-        self._last_qs = qs
-        self._last_slices = slices
+        state.update(_last_qs=qs, _last_slices=slices, last_extent=extent)
+
+        if self._use_overviews(qs, slices, blocksize):
+            # select the data from the pre-computed overview pyramid
+            return self._select_overview(qs, slices, blocksize, state, token=token)
+
+        if self._use_incremental(qs, slices, blocksize):
+            # re-use the aggregated data of the previous window
+            return self._get_incremental_props(slices, blocksize, state, token=token)
 
-        self._current_data = dict(
+        if self._lazy_grid is not None:
+            return self._get_lazy_grid_props(qs, slices, blocksize, token=token)
+
+        data = dict(
             xorig=self._select_vals(self.xorig, qs, slices),
             yorig=self._select_vals(self.yorig, qs, slices),
             x0=self._select_vals(self.x0, qs, slices),
@@ -1333,15 +2373,224 @@ class DataManager:
             z_data=self._select_vals(self.z_data, qs, slices),
             # ids=self._select_ids(),
         )
-        self.last_extent = self.current_extent
 
-        self._zoom(blocksize)
-        return self._current_data
+        self._zoom(data, blocksize, token=token)
+        self._compute_data(data)
+        return data
+
+    @staticmethod
+    def _compute_data(data):
+        # compute the selected values of lazy (dask) arrays
+        for key, val in data.items():
+            if _is_dask_array(val):
+                data[key] = val.compute()
+
+    def _get_lazy_grid_props(self, qs, slices, blocksize, token=None):
+        # select (and aggregate) the visible part of a lazy rectilinear grid
+        # and reproject only the selected coordinates
+        data = dict(
+            xorig=self._select_vals(self.xorig, qs, slices),
+            yorig=self._select_vals(self.yorig, qs, slices),
+            z_data=self._select_vals(self.z_data, qs, slices),
+        )
+
+        self._zoom(data, blocksize, token=token)
+        self._compute_data(data)
+
+        if data["xorig"] is None:
+            data["x0"] = data["y0"] = None
+        else:
+            data["x0"], data["y0"] = self._transform_chunked(
+                self._lazy_grid["transformer"],
+                data["xorig"],
+                data["yorig"],
+                token=token,
+            )
+
+        return data
+
+    def _get_window_key(self, blocksize):
+        # identifier for the aggregated data of a window
+        # (windows with the same key can be combined)
+        return (
+            self._props_version,
+            blocksize,
+            getattr(self.m.shape, "_aggregator", "first"),
+            getattr(self.m.shape, "_valid_fraction", 0),
+        )
+
+    def _get_window_slices(self, slices, blocksize):
+        # clip slices to the data-shape and drop boundary pixels that do not
+        # fit into full blocks (same as in `_block_view`)
+        x0, x1, y0, y1 = slices
+        ny, nx = self.z_data.shape
+        x1, y1 = min(x1, nx), min(y1, ny)
+
+        mx, my = (x1 - x0) % blocksize, (y1 - y0) % blocksize
+        x0, x1 = x0 + mx // 2 + mx % 2, x1 - mx // 2
+        y0, y1 = y0 + my // 2 + my % 2, y1 - my // 2
+        return x0, x1, y0, y1
+
+    def _use_incremental(self, qs, slices, blocksize):
+        # check if the data of a window can be combined from aggregated windows
+        if not self._incremental_pan or blocksize is None or slices is None:
+            return False
+
+        if self.z_data is None or len(self.z_data.shape) != 2:
+            return False
+
+        if all(i is True for i in qs):
+            return False
+
+        maxsize = getattr(self.m.shape, "_maxsize", None)
+        method = getattr(self.m.shape, "_aggregator", "first")
+        if maxsize is None or method == "spline":
+            return False
+
+        x0, x1, y0, y1 = self._get_window_slices(slices, blocksize)
+        if x1 <= x0 or y1 <= y0:
+            return False
+
+        # only use windows that would be aggregated (see `_zoom`)
+        return (x1 - x0) * (y1 - y0) >= maxsize
+
+    def _aggregate_window(self, slices, blocksize, token=None):
+        # select and aggregate the data of a window
+        # (the size of the window must be a multiple of the blocksize)
+        x0, x1, y0, y1 = slices
+
+        if self._lazy_grid is not None:
+            keys = ("xorig", "yorig", "z_data")
+        else:
+            keys = ("xorig", "yorig", "x0", "y0", "z_data")
+
+        data = {key: getattr(self, key)[y0:y1, x0:x1] for key in keys}
+
+        self._zoom_block(
+            data,
+            getattr(self.m.shape, "_maxsize", None),
+            getattr(self.m.shape, "_aggregator", "first"),
+            getattr(self.m.shape, "_valid_fraction", 0),
+            blocksize,
+            token=token,
+        )
+        self._compute_data(data)
+
+        if self._lazy_grid is not None:
+            data["x0"], data["y0"] = self._transform_chunked(
+                self._lazy_grid["transformer"],
+                data["xorig"],
+                data["yorig"],
+                token=token,
+            )
+
+        return data
+
+    def _get_incremental_props(self, slices, blocksize, state, token=None):
+        """
+        Get the aggregated data of a window.
+
+        If the window overlaps with the previously aggregated window, the
+        overlapping blocks are re-used and only the newly exposed strips
+        are aggregated (e.g. the work on pan is proportional to the new area).
+
+        Parameters
+        ----------
+        slices : tuple
+            The slices (x0, x1, y0, y1) of the window.
+        blocksize : int
+            The blocksize used for aggregation.
+        state : dict
+            A dict that is updated with the aggregated window
+            (see `_select_props()`).
+        token : int, optional
+            The token of the background-job (see `_update_progress()`).
+            The default is None.
+
+        Returns
+        -------
+        props : dict
+            A dict with the aggregated 2D arrays "xorig", "yorig", "x0", "y0"
+            and "z_data".
+
+        """
+        bs = blocksize
+        x0, x1, y0, y1 = slices = self._get_window_slices(slices, bs)
+
+        key = self._get_window_key(bs)
+        last = self._last_window
+
+        if last is not None and last["key"] == key:
+            px0, px1, py0, py1 = last["slices"]
+            ix0, ix1 = max(x0, px0), min(x1, px1)
+            iy0, iy1 = max(y0, py0), min(y1, py1)
+
+            # blocks can only be re-used if the block-grids are aligned
+            # (windows at the boundary of the data are trimmed symmetrically)
+            if (x0 - px0) % bs != 0 or (y0 - py0) % bs != 0:
+                ix0 = ix1 = iy0 = iy1 = 0
+        else:
+            ix0 = ix1 = iy0 = iy1 = 0
+
+        if (ix0, ix1, iy0, iy1) == (x0, x1, y0, y1):
+            # the window is already aggregated
+            props = dict(last["props"])
+        elif ix1 <= ix0 or iy1 <= iy0:
+            # no overlap with the previous window
+            props = self._aggregate_window(slices, bs, token=token)
+        else:
+            _log.debug("EOmaps: Aggregating newly exposed data")
+            # the strips above/below and left/right of the overlapping part
+            strips = dict(
+                top=(x0, x1, y0, iy0),
+                bottom=(x0, x1, iy1, y1),
+                left=(x0, ix0, iy0, iy1),
+                right=(ix1, x1, iy0, iy1),
+            )
+            parts = {
+                name: self._aggregate_window((sx0, sx1, sy0, sy1), bs, token=token)
+                for name, (sx0, sx1, sy0, sy1) in strips.items()
+                if sx1 > sx0 and sy1 > sy0
+            }
+
+            overlap = (
+                slice((iy0 - py0) // bs, (iy1 - py0) // bs),
+                slice((ix0 - px0) // bs, (ix1 - px0) // bs),
+            )
+
+            props = dict()
+            for name, val in last["props"].items():
+                row = [val[overlap]]
+                if "left" in parts:
+                    row.insert(0, parts["left"][name])
+                if "right" in parts:
+                    row.append(parts["right"][name])
+
+                rows = [self._concatenate(row, axis=1)]
+                if "top" in parts:
+                    rows.insert(0, parts["top"][name])
+                if "bottom" in parts:
+                    rows.append(parts["bottom"][name])
+
+                props[name] = self._concatenate(rows, axis=0)
+
+        state["_last_window"] = dict(key=key, slices=slices, props=dict(props))
+
+        return props
+
+    @staticmethod
+    def _concatenate(arrays, axis):
+        # concatenate arrays (and keep masks of masked arrays)
+        if len(arrays) == 1:
+            return arrays[0]
+        if any(isinstance(i, np.ma.masked_array) for i in arrays):
+            return np.ma.concatenate(arrays, axis=axis)
+        return np.concatenate(arrays, axis=axis)
 
     def _get_datasize(self, z_data, x0, y0, **kwargs):
         # if a dataset is provided, use it to identify the data-size
         if z_data is not None:
-            return np.size(z_data)
+            return z_data.size if _is_dask_array(z_data) else np.size(z_data)
 
         sx = np.size(x0)
 
@@ -1450,9 +2699,16 @@ class DataManager:
         # (to pick the correct value, we need to pick the transposed one!)
 
         if self.m.shape.name == "shade_raster" and self.x0_1D is not None:
-            val = self.z_data.T.flat[ind]
+            z_data = self.z_data.T
         else:
-            val = self.z_data.flat[ind]
+            z_data = self.z_data
+
+        if _is_dask_array(z_data):
+            # only compute the requested values of lazy arrays
+            val = z_data.vindex[np.unravel_index(np.atleast_1d(ind), z_data.shape)]
+            val = val.compute().reshape(np.shape(ind))
+        else:
+            val = z_data.flat[ind]
 
         return val
 
@@ -1537,6 +2793,16 @@ class DataManager:
     def cleanup(self):
         self.cleanup_callbacks()
 
+        self._cancel_job()
+        if self._job_timer is not None:
+            self._job_timer.stop()
+            self._job_timer = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
         self._all_data.clear()
         self._current_data.clear()
         self.last_extent = None
+        self._props_version += 1
+        self._overviews.clear()
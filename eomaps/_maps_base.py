@@ -7,6 +7,7 @@
 
 import gc
 import logging
+import os
 from contextlib import ExitStack
 from pyproj import CRS, Transformer
 from functools import lru_cache, wraps
@@ -25,6 +26,8 @@ _log = logging.getLogger(__name__)
 from .helpers import _parse_log_level
 from .layout_editor import LayoutEditor
 from ._blit_manager import BlitManager
+from ._data_manager import DataManager
+from ._reproject_cache import ReprojectCache
 from .projections import Equi7Grid_projection  # import also supercharges cartopy.ccrs
 
 
@@ -75,6 +78,17 @@ class _MapsMeta(type):
         always_on_top=None,
         use_interactive_mode=None,
         log_level=None,
+        reproject_chunksize=None,
+        reproject_workers=None,
+        reproject_cache=None,
+        reproject_cache_size=None,
+        aggregate_chunksize=None,
+        aggregate_workers=None,
+        incremental_pan=None,
+        lazy_grid_threshold=None,
+        bg_cache_size=None,
+        profile=None,
+        compound_polygons=None,
     ):
         """
         Set global configuration parameters for figures created with EOmaps.
@@ -125,9 +139,103 @@ class _MapsMeta(type):
             See :py:meth:`set_loglevel` on how to customize logging format.
 
             The default is None.
+        reproject_chunksize : int, optional
+            The max. number of datapoints that are re-projected at once when
+            plotting a dataset (larger datasets are re-projected in chunks to
+            limit the peak memory usage).
+
+            The default is 1 000 000.
+        reproject_workers : int, optional
+            The number of threads used to re-project chunks of large datasets
+            in parallel. If 0, the number of available CPUs is used.
+
+            The default is 0.
+        reproject_cache : bool or str, optional
+            Enable an on-disk cache for re-projected coordinates.
+
+            If enabled, re-projected coordinates are stored as `.npy` files
+            (keyed by a hash of the coordinates and the crs definitions) and
+            subsequent plots of the same coordinates in the same crs use
+            memory-mapped versions of the cached files.
+
+            - If True, the cache is stored in the "reproject_cache" folder of
+              the EOmaps data-directory (`eomaps._data_dir`).
+            - If a string is provided, it is used as path to the cache-directory.
+            - If False, the cache is disabled.
+
+            The default is False.
+        reproject_cache_size : float, optional
+            The max. size of the on-disk cache for re-projected coordinates in MB.
+            If the cache gets larger, the least recently used entries are removed.
+
+            The default is 1000.
+        aggregate_chunksize : int, optional
+            The max. number of datapoints that are aggregated at once if raster
+            datasets are aggregated (larger datasets are aggregated in strips
+            to limit the peak memory usage).
+
+            The default is 10 000 000.
+        aggregate_workers : int, optional
+            The number of threads used to aggregate strips of large raster datasets
+            in parallel. If 0, the number of available CPUs is used.
+
+            The default is 1.
+        incremental_pan : bool, optional
+            If True, the aggregated data of the previous map-extent is re-used
+            if aggregated raster datasets are panned (e.g. only the newly exposed
+            parts of the dataset are aggregated).
+
+            The default is True.
+        lazy_grid_threshold : int, optional
+            The min. number of datapoints of rectilinear grids (e.g. 1D coordinates
+            and 2D data) plotted with the "raster" shape for which only the visible
+            part of the grid is re-projected on each redraw (instead of
+            re-projecting the full grid once when the data is plotted).
+
+            This considerably speeds up plotting large grids that are provided
+            in a different crs than the plot-crs (the full grid is only
+            re-projected if all coordinates are required, e.g. for picking).
+
+            If 0, the full grid is always re-projected.
+
+            The default is 1 000 000.
+        bg_cache_size : float, optional
+            The max. size of cached background-layers in MB (per figure).
+
+            Each fetched layer is cached as a full-figure RGBA buffer. If the cache
+            gets larger, the least recently shown layers are removed (the visible
+            layers are always kept). Cached backgrounds of the previous map-extent
+            (used as previews while layers are re-drawn after panning the map)
+            count towards the same budget and they are removed first.
+            Use `m.BM.bg_cache_info()` to get the number of cache hits, misses
+            and evictions.
+
+            If 0, the size of the cache is unlimited.
+
+            The default is 0.
+        profile : bool, optional
+            If True, timings of all rendering stages (fetching backgrounds,
+            drawing artists, combining layers, blitting, data selection...) and
+            hit-rates of the involved caches are recorded for all new figures.
+
+            Use `m.BM.profiler.report()` to get a summary of the timings.
+            To profile only a section of code, use `with m.BM.profile(): ...`
+
+            The default is False.
+        compound_polygons : bool, optional
+            If True, polygons of shapes (e.g. "rectangles", "voronoi_diagram",
+            "delaunay_triangulation") with the same color are always drawn as a
+            single compound path. This is considerably faster for a large number of
+            polygons, but overlapping polygons are drawn grouped by color (and not
+            in the order of the data) and edges are drawn on top of all faces.
+
+            If False, compound paths are only used for shapes whose polygons
+            cannot overlap and if no edges are drawn.
+
+            The default is False.
         """
 
-        from . import set_loglevel
+        from . import set_loglevel, _data_dir
 
         if companion_widget_key is not None:
             cls._companion_widget_key = companion_widget_key
@@ -144,6 +252,53 @@ class _MapsMeta(type):
         if log_level is not None:
             set_loglevel(log_level)
 
+        if reproject_chunksize is not None:
+            DataManager._reproject_chunksize = int(reproject_chunksize)
+
+        if reproject_workers is not None:
+            DataManager._reproject_workers = int(reproject_workers)
+
+        if aggregate_chunksize is not None:
+            DataManager._aggregate_chunksize = int(aggregate_chunksize)
+
+        if aggregate_workers is not None:
+            DataManager._aggregate_workers = int(aggregate_workers)
+
+        if incremental_pan is not None:
+            DataManager._incremental_pan = bool(incremental_pan)
+
+        if lazy_grid_threshold is not None:
+            DataManager._lazy_grid_threshold = int(lazy_grid_threshold)
+
+        if bg_cache_size is not None:
+            BlitManager._bg_cache_size = int(bg_cache_size * 1e6) or None
+
+        if profile is not None:
+            BlitManager._profile = bool(profile)
+
+        if reproject_cache_size is not None:
+            DataManager._reproject_cache_size = int(reproject_cache_size * 1e6)
+            if DataManager._reproject_cache is not None:
+                DataManager._reproject_cache.maxsize = DataManager._reproject_cache_size
+
+        if reproject_cache is not None:
+            if reproject_cache is False:
+                DataManager._reproject_cache = None
+            else:
+                if reproject_cache is True:
+                    cache_dir = os.path.join(_data_dir, "reproject_cache")
+                else:
+                    cache_dir = reproject_cache
+
+                DataManager._reproject_cache = ReprojectCache(
+                    cache_dir, DataManager._reproject_cache_size
+                )
+
+        if compound_polygons is not None:
+            from .shapes import _PolygonCollection
+
+            _PolygonCollection._compound_default = bool(compound_polygons)
+
     def apply_webagg_fix(cls):
         """
         Apply fix to avoid slow updates and lags due to event-accumulation in webagg backend.
@@ -381,10 +536,10 @@ class MapsBase(metaclass=_MapsMeta):
         gc.collect
 
     def _on_xlims_change(self, *args, **kwargs):
-        self.BM._refetch_bg = True
+        self.BM._on_extent_change()
 
     def _on_ylims_change(self, *args, **kwargs):
-        self.BM._refetch_bg = True
+        self.BM._on_extent_change()
 
     @property
     def BM(self):
@@ -764,7 +919,7 @@ class MapsBase(metaclass=_MapsMeta):
             else:
                 plt.show()
 
-    def fetch_layers(self, layers=None):
+    def fetch_layers(self, layers=None, idle=False):
         """
         Fetch (and cache) the layers of a map.
 
@@ -781,6 +936,12 @@ class MapsBase(metaclass=_MapsMeta):
             A list of layer-names that should be fetched.
             If None, all layers (except the "all" layer) are fetched.
             The default is None.
+        idle : bool, optional
+            If True, the layers are fetched in the background while the map is
+            idle (in the provided order) instead of blocking until all layers
+            are fetched. (see `m.BM.prefetch_layers()` for details)
+
+            The default is False.
 
         See Also
         --------
@@ -804,6 +965,10 @@ class MapsBase(metaclass=_MapsMeta):
         nlayers = len(layers)
         assert nlayers > 0, "EOmaps: There are no layers to fetch."
 
+        if idle:
+            self.BM.prefetch_layers(layers)
+            return
+
         for i, l in enumerate(layers):
             _log.info(f"EOmaps: fetching layer {i + 1}/{nlayers}: {l}")
             self.show_layer(l)
@@ -1120,6 +1285,83 @@ class MapsBase(metaclass=_MapsMeta):
             # redraw after the save to ensure that backgrounds are correctly cached
             self.redraw()
 
+    def export_animation(
+        self, layers, path, fps=10, writer=None, queue_size=8, **kwargs
+    ):
+        """
+        Export an animation where each frame shows one layer of the map.
+
+        Frames are rendered from the cached layer-backgrounds (e.g. without a
+        full re-draw of the figure for each frame) and streamed to the output
+        by a separate writer-thread.
+
+        Note
+        ----
+        Frames are rendered with the size and dpi of the figure.
+        Use `Maps(figsize=..., dpi=...)` to adjust the resolution of the output.
+
+        Parameters
+        ----------
+        layers : list
+            The layers to show (one frame per entry). Entries can be layer-names
+            or lists of layers that are shown together (similar to
+            `m.show_layer(*layers)`), e.g. ["A", "B", ["A", ("B", 0.5)]].
+        path : str or pathlib.Path
+            The path of the output.
+
+            - A path with a format-field for the frame-number exports an
+              image-sequence (e.g. "frames/frame_{:04d}.png").
+            - A path with a ".gif" or ".webp" suffix exports an animated image
+              with Pillow. (NOTE: In this case all frames are kept in memory!)
+            - Any other suffix (e.g. ".mp4") exports a movie with the default
+              matplotlib animation writer (rcParams["animation.writer"]).
+
+        fps : int, optional
+            The frames per second of the animation. The default is 10.
+        writer : str or matplotlib.animation.MovieWriter, optional
+            The writer used to export the animation.
+
+            - "sequence" to export an image-sequence
+            - "pillow" to export an animated image with Pillow
+            - The name of any (pipe-based) matplotlib animation writer (e.g.
+              "ffmpeg") or an instance of such a writer. (For instances, a new
+              writer of the same type with the same fps, codec, bitrate,
+              extra_args and metadata is used.)
+            - None to determine the writer from the path.
+
+            The default is None.
+        queue_size : int, optional
+            The max. number of rendered frames that are waiting to be written.
+            If the writer falls behind, rendering is paused until frames have
+            been written (to avoid keeping all frames in memory).
+            The default is 8.
+        kwargs :
+            Additional kwargs passed to the matplotlib animation writer
+            (e.g. bitrate, codec, extra_args, ...).
+
+        Examples
+        --------
+        >>> m = Maps()
+        >>> m.add_feature.preset.coastline(layer="all")
+        >>> for i, data in enumerate(datasets):
+        >>>     m2 = m.new_layer(f"t_{i}")
+        >>>     m2.set_data(data, x="lon", y="lat")
+        >>>     m2.plot_map()
+        >>> m.export_animation([f"t_{i}" for i in range(len(datasets))], "anim.mp4")
+
+        """
+        from ._animation import export_animation
+
+        export_animation(
+            self,
+            layers,
+            path,
+            fps=fps,
+            writer=writer,
+            queue_size=queue_size,
+            **kwargs,
+        )
+
     def cleanup(self):
         """
         Cleanup all references to the object so that it can be safely deleted.
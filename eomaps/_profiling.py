@@ -0,0 +1,232 @@
+# Copyright EOmaps Contributors
+#
+# This file is part of EOmaps and is released under the BSD 3-clause license.
+# See LICENSE in the root of the repository for full licensing details.
+
+"""Collect timings of the individual stages used to render a figure."""
+
+import json
+import threading
+from contextlib import nullcontext
+from time import perf_counter
+
+from .helpers import register_modules
+
+# a re-usable context that does nothing (returned if profiling is disabled)
+_NULL_CONTEXT = nullcontext()
+
+
+class _Stage:
+    # context-manager that records the duration of a single stage
+    __slots__ = ("_profiler", "_name", "_layer", "_artist", "_t0")
+
+    def __init__(self, profiler, name, layer, artist):
+        self._profiler = profiler
+        self._name = name
+        self._layer = layer
+        self._artist = artist
+
+    def __enter__(self):
+        self._t0 = perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        t1 = perf_counter()
+        artist = self._artist
+        if artist is not None and not isinstance(artist, str):
+            artist = self._profiler._get_artist_label(artist)
+
+        self._profiler._events.append(
+            dict(
+                stage=self._name,
+                layer=self._layer,
+                artist=artist,
+                start=self._t0 - self._profiler._t0,
+                duration=t1 - self._t0,
+                thread=threading.get_ident(),
+            )
+        )
+
+
+class RenderProfiler:
+    """
+    Record timings of the stages used to render a figure.
+
+    Timings are recorded per stage (e.g. fetching backgrounds, drawing artists,
+    combining layers, blitting...) together with the associated layer and
+    artist. In addition, hits and misses of the involved caches are counted.
+
+    If the profiler is disabled, recording a stage does not measure anything.
+
+    Use :py:meth:`BlitManager.profile` to profile a section of code or
+    `Maps.config(profile=True)` to enable profiling for all new figures.
+
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.clear()
+
+    def clear(self):
+        """Remove all recorded timings and cache statistics."""
+        self._events = []
+        self._counts = dict()
+        self._t0 = perf_counter()
+
+    def stage(self, name, layer=None, artist=None):
+        """
+        Get a context-manager that records the duration of a stage.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage.
+        layer : str, optional
+            The layer associated with the stage. The default is None.
+        artist : matplotlib.artist.Artist or str, optional
+            The artist (or a label of the artist) associated with the stage.
+            The default is None.
+
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+
+        return _Stage(self, name, layer, artist)
+
+    def count(self, name, hit):
+        """
+        Count a hit (or miss) of a cache.
+
+        Parameters
+        ----------
+        name : str
+            The name of the cache.
+        hit : bool
+            True for a cache-hit, False for a cache-miss.
+
+        """
+        if not self.enabled:
+            return
+
+        counts = self._counts.setdefault(name, [0, 0])
+        counts[0 if hit else 1] += 1
+
+    @staticmethod
+    def _get_artist_label(art):
+        label = art.get_label()
+        if label and not label.startswith("_"):
+            return f"{type(art).__name__} ({label})"
+        return f"{type(art).__name__} ({id(art):#x})"
+
+    @staticmethod
+    def _summarize(durations):
+        return dict(
+            count=len(durations),
+            total=sum(durations),
+            mean=sum(durations) / len(durations),
+            max=max(durations),
+        )
+
+    def report(self):
+        """
+        Get a summary of all recorded timings (in seconds).
+
+        Returns
+        -------
+        report : dict
+            A dict with the following entries:
+
+            - "stages": count, total-, mean- and max. duration of each stage
+            - "layers": total duration of each stage per layer
+            - "artists": count and total duration of drawing individual artists
+            - "caches": number of hits, misses and the hit-rate of each cache
+            - "events": a list of all recorded events
+
+        """
+        events = list(self._events)
+
+        stages, layers, artists = dict(), dict(), dict()
+        for e in events:
+            stages.setdefault(e["stage"], []).append(e["duration"])
+
+            if e["layer"] is not None:
+                layer = layers.setdefault(e["layer"], dict())
+                layer[e["stage"]] = layer.get(e["stage"], 0) + e["duration"]
+
+            if e["artist"] is not None:
+                artists.setdefault(e["artist"], []).append(e["duration"])
+
+        caches = dict()
+        for name, (hits, misses) in self._counts.items():
+            caches[name] = dict(
+                hits=hits,
+                misses=misses,
+                hit_rate=hits / (hits + misses) if (hits + misses) > 0 else None,
+            )
+
+        return dict(
+            stages={key: self._summarize(val) for key, val in stages.items()},
+            layers=layers,
+            artists={key: self._summarize(val) for key, val in artists.items()},
+            caches=caches,
+            events=events,
+        )
+
+    def to_dataframe(self):
+        """
+        Get all recorded events as a pandas.DataFrame.
+
+        Returns
+        -------
+        df : pandas.DataFrame
+            A DataFrame with the columns "stage", "layer", "artist",
+            "start", "duration" and "thread".
+
+        """
+        (pd,) = register_modules("pandas")
+
+        return pd.DataFrame(
+            list(self._events),
+            columns=["stage", "layer", "artist", "start", "duration", "thread"],
+        )
+
+    def to_chrome_trace(self, path=None):
+        """
+        Export all recorded events in the "Trace Event Format".
+
+        The trace can be inspected with "chrome://tracing" or https://ui.perfetto.dev
+
+        Parameters
+        ----------
+        path : str or pathlib.Path, optional
+            If provided, the trace is written to a json-file. The default is None.
+
+        Returns
+        -------
+        trace : dict
+            The trace as a json-serializable dict.
+
+        """
+        events = []
+        for e in self._events:
+            args = {key: e[key] for key in ("layer", "artist") if e[key] is not None}
+            events.append(
+                dict(
+                    name=e["stage"],
+                    cat="eomaps",
+                    ph="X",
+                    ts=e["start"] * 1e6,
+                    dur=e["duration"] * 1e6,
+                    pid=0,
+                    tid=e["thread"],
+                    args=args,
+                )
+            )
+
+        trace = dict(traceEvents=events, displayTimeUnit="ms")
+
+        if path is not None:
+            with open(path, "w") as file:
+                json.dump(trace, file)
+
+        return trace
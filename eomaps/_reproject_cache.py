@@ -0,0 +1,174 @@
+# Copyright EOmaps Contributors
+#
+# This file is part of EOmaps and is released under the BSD 3-clause license.
+# See LICENSE in the root of the repository for full licensing details.
+
+"""On-disk cache for re-projected coordinates."""
+
+import hashlib
+import logging
+import os
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+_log = logging.getLogger(__name__)
+
+
+class ReprojectCache:
+    """
+    A size-bounded on-disk cache for re-projected coordinates.
+
+    Re-projected coordinates are stored as `.npy` files and are loaded as
+    read-only memory-maps. If the size of the cache exceeds `maxsize`, the
+    least recently used entries are removed.
+
+    Parameters
+    ----------
+    cache_dir : str or pathlib.Path
+        The directory used to store the cached coordinates.
+    maxsize : int
+        The max. size of the cache in bytes.
+
+    """
+
+    def __init__(self, cache_dir, maxsize):
+        self.cache_dir = Path(cache_dir)
+        self.maxsize = maxsize
+
+    @staticmethod
+    def get_key(x, y, transformer, grid=False):
+        """
+        Get a unique key for the given coordinates and coordinate-transformation.
+
+        Parameters
+        ----------
+        x, y : array-like
+            The coordinates.
+        transformer : pyproj.Transformer
+            The transformer used to re-project the coordinates.
+        grid : bool, optional
+            Indicator if x and y are the 1D coordinate-vectors of a rectilinear
+            grid (e.g. the cached coordinates are 2D). The default is False.
+
+        Returns
+        -------
+        key : str
+            A hash of the coordinates and the crs definitions.
+
+        """
+        h = hashlib.sha1(b"grid" if grid else b"")
+        for a in (x, y):
+            a = np.ascontiguousarray(a)
+            h.update(str((a.shape, a.dtype.str)).encode())
+            h.update(memoryview(a).cast("B"))
+
+        h.update(transformer.source_crs.to_wkt().encode())
+        h.update(transformer.target_crs.to_wkt().encode())
+
+        return h.hexdigest()
+
+    def _get_paths(self, key):
+        return self.cache_dir / f"{key}_x0.npy", self.cache_dir / f"{key}_y0.npy"
+
+    def get(self, key):
+        """
+        Get cached coordinates.
+
+        Parameters
+        ----------
+        key : str
+            The key of the cached coordinates (see `get_key`).
+
+        Returns
+        -------
+        x0, y0 : np.memmap or None
+            Read-only memory-maps of the cached coordinates
+            (or None if no cache-entry exists).
+
+        """
+        px, py = self._get_paths(key)
+        try:
+            x0 = np.load(px, mmap_mode="r")
+            y0 = np.load(py, mmap_mode="r")
+            # update access-times (used to identify the least recently used entries)
+            os.utime(px)
+            os.utime(py)
+        except (OSError, ValueError):
+            return None
+
+        _log.debug(f"EOmaps: Using cached re-projected coordinates ({key}).")
+        return x0, y0
+
+    def put(self, key, x0, y0):
+        """
+        Add re-projected coordinates to the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the coordinates (see `get_key`).
+        x0, y0 : array-like
+            The re-projected coordinates.
+
+        """
+        x0, y0 = np.asanyarray(x0), np.asanyarray(y0)
+        if x0.nbytes + y0.nbytes > self.maxsize:
+            _log.debug("EOmaps: Coordinates are too large to be cached.")
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for p, a in zip(self._get_paths(key), (x0, y0)):
+                # write to a temporary file first to avoid reading incomplete files
+                tmp = p.with_name(f"{p.stem}_{uuid.uuid4().hex}.tmp")
+                with open(tmp, "wb") as f:
+                    np.save(f, a)
+                os.replace(tmp, p)
+        except OSError:
+            _log.warning(
+                "EOmaps: Unable to write re-projected coordinates to the cache "
+                f"directory '{self.cache_dir}'.",
+                exc_info=_log.getEffectiveLevel() <= logging.DEBUG,
+            )
+            return
+
+        self._evict()
+
+    def _evict(self):
+        # remove the least recently used entries until the cache fits maxsize
+        entries = dict()
+        for p in self.cache_dir.glob("*.npy"):
+            try:
+                stat = p.stat()
+            except OSError:
+                continue
+            key = p.stem.rsplit("_", 1)[0]
+            mtime, size, paths = entries.get(key, (0, 0, []))
+            entries[key] = (max(mtime, stat.st_mtime), size + stat.st_size, paths + [p])
+
+        size = sum(i[1] for i in entries.values())
+        for _, s, paths in sorted(entries.values(), key=lambda i: i[0]):
+            if size <= self.maxsize:
+                break
+            try:
+                for p in paths:
+                    p.unlink()
+            except OSError:
+                # the file might be in use (e.g. memory-mapped on Windows)
+                continue
+            size -= s
+
+    @property
+    def size(self):
+        """The current size of the cache in bytes."""
+        return sum(p.stat().st_size for p in self.cache_dir.glob("*.npy"))
+
+    def clear(self):
+        """Remove all cached coordinates."""
+        for p in self.cache_dir.glob("*.npy"):
+            try:
+                p.unlink()
+            except OSError:
+                pass
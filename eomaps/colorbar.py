@@ -11,6 +11,7 @@ from matplotlib.patches import Rectangle
 import numpy as np
 
 from .helpers import _TransformedBoundsLocator, pairwise, version, mpl_version
+from ._data_manager import _is_dask_array
 
 import logging
 
@@ -687,6 +688,10 @@ class ColorBar(ColorBarBase):
         else:
             data = self._m._data_manager.z_data
 
+            if _is_dask_array(data):
+                # use a subsample of lazy arrays to evaluate the histogram
+                data = self._m._data_manager._compute_sample(data)
+
         return data
 
     def _identify_parent_cb(self):
@@ -10,7 +10,7 @@ import logging
 _log = logging.getLogger(__name__)
 
 from contextlib import ExitStack, contextmanager
-from functools import lru_cache, wraps
+from functools import lru_cache, wraps, partial
 from itertools import repeat, chain
 from pathlib import Path
 from types import SimpleNamespace
@@ -55,7 +55,8 @@ from .grid import GridFactory
 from .utilities import Utilities
 from .draw import ShapeDrawer
 from .annotation_editor import AnnotationEditor
-from ._data_manager import DataManager
+from ._data_manager import DataManager, _is_dask_array
+from ._batch import BatchRenderer
 
 try:
     from ._webmap import refetch_wms_on_size_change, _cx_refetch_wms_on_size_change
@@ -719,6 +720,60 @@ class Maps(MapsBase):
 
         return m
 
+    def new_batch_renderer(self, layer="batch", show_layer=None, processes=None):
+        """
+        Get a BatchRenderer to plot and export many datasets with the same layout.
+
+        All features of the map (coastlines, gridlines, logos etc.) are rendered
+        only once and the cached backgrounds are re-used for all outputs. For
+        each output, only the dataset is replaced and the resulting images are
+        written to disk in a pool of worker-processes.
+
+        Parameters
+        ----------
+        layer : str, optional
+            The layer used to plot the datasets. The default is "batch".
+        show_layer : str, optional
+            The (combined) layer that is rendered for each output.
+
+            If None, the dataset-layer is combined with the layer of this
+            Maps-object (e.g. "base|batch"). In this case, all artists of the
+            layer with a zorder above the dataset are moved to a (private)
+            overlay-layer so that they are rendered on top of the dataset.
+
+            The default is None.
+        processes : int or None, optional
+            The number of processes used to write the outputs.
+            If None, the number of available CPUs is used.
+            If 0, outputs are written immediately in the main process.
+            The default is None.
+
+        Returns
+        -------
+        BatchRenderer
+            The BatchRenderer. Use it as context-manager (or call `close()`)
+            to make sure all outputs are written.
+
+        Examples
+        --------
+        >>> import matplotlib
+        >>> matplotlib.use("agg")
+        >>> from eomaps import Maps
+        >>> m = Maps(Maps.CRS.Mollweide(), figsize=(8, 5))
+        >>> m.set_extent((-30, 60, 20, 75))
+        >>> m.add_feature.preset.coastline()
+        >>> m.add_gridlines(10)
+        >>> m.add_logo()
+        >>> with m.new_batch_renderer() as r:
+        >>>     for date, data in datasets.items():
+        >>>         r.render(f"{date}.png", data, x="lon", y="lat", crs=4326,
+        >>>                  plot_kwargs=dict(vmin=0, vmax=1))
+
+        """
+        return BatchRenderer(
+            self, layer=layer, show_layer=show_layer, processes=processes
+        )
+
     def new_inset_map(
         self,
         xy=(45, 45),
@@ -2286,6 +2341,8 @@ class Maps(MapsBase):
                 self._data_manager.yorig.ravel()[mask],
             )
             val = self._data_manager.z_data.ravel()[mask]
+            if _is_dask_array(val):
+                val = val.compute()
             ID = np.atleast_1d(ID)
             xy_crs = self.data_specs.crs
 
@@ -2842,6 +2899,7 @@ class Maps(MapsBase):
         set_extent=True,
         assume_sorted=True,
         indicate_masked_points=False,
+        background=False,
         **kwargs,
     ):
         """
@@ -2898,6 +2956,21 @@ class Maps(MapsBase):
             ('s': markersize, 'marker': the shape of the marker, ...)
 
             The default is False
+        background : bool, optional
+            If True, the data is prepared (e.g. re-projected) in a background
+            thread to avoid freezing the figure while large datasets are processed.
+            Collections are also created in the background on consecutive
+            redraws (e.g. after zooming). Pending jobs are cancelled if they are
+            superseded by a new request (e.g. if the map is zoomed again).
+
+            The progress is reported via the "dataProgress" signal of the
+            companion-widget.
+
+            NOTE: This requires an interactive backend (e.g. qt) and
+            `m.plot_map()` returns before the data is actually plotted!
+            (For non-interactive backends the data is prepared synchronously.)
+
+            The default is False.
 
         Other Parameters
         ----------------
@@ -2968,6 +3041,13 @@ class Maps(MapsBase):
 
         _log.debug("EOmaps: Preparing dataset")
 
+        if background and not self._data_manager._background_supported():
+            _log.info(
+                "EOmaps: Preparing data in the background requires an interactive "
+                "backend... continuing with synchronous data-preparation."
+            )
+            background = False
+
         # ---------------------- assign the data to the data_manager
 
         # shade shapes use datashader to update the data of the collections!
@@ -2979,8 +3059,30 @@ class Maps(MapsBase):
             update_coll_on_fetch=update_coll_on_fetch,
             indicate_masked_points=indicate_masked_points,
             dynamic=dynamic,
+            background=background,
+            on_ready=partial(
+                self._plot_prepared_data,
+                layer=layer,
+                dynamic=dynamic,
+                set_extent=set_extent,
+                assume_sorted=assume_sorted,
+                cmap=cmap,
+                **kwargs,
+            ),
         )
 
+    def _plot_prepared_data(
+        self,
+        layer=None,
+        dynamic=False,
+        set_extent=True,
+        assume_sorted=True,
+        cmap="viridis",
+        **kwargs,
+    ):
+        # plot the data once it has been assigned to the data-manager
+        shade_q = self.shape.name.startswith("shade_")  # indicator if shading is used
+
         # ---------------------- classify the data
         self._set_vmin_vmax(
             vmin=kwargs.pop("vmin", None), vmax=kwargs.pop("vmax", None)
@@ -3715,6 +3817,10 @@ class Maps(MapsBase):
         if z_data is None:
             z_data = self._data_manager.z_data
 
+        if _is_dask_array(z_data):
+            # evaluate classifications of lazy arrays on a subsample of the data
+            z_data = self._data_manager._compute_sample(z_data)
+
         if isinstance(cmap, str):
             cmap = plt.get_cmap(cmap).copy()
         else:
@@ -3797,8 +3903,9 @@ class Maps(MapsBase):
     def _set_default_shape(self):
         if self.data is not None:
             # size = np.size(self.data)
-            size = np.size(self._data_manager.z_data)
-            shape = np.shape(self._data_manager.z_data)
+            z_data = self._data_manager.z_data
+            size = z_data.size if _is_dask_array(z_data) else np.size(z_data)
+            shape = np.shape(z_data)
 
             if len(shape) == 2 and size > 200_000:
                 self.set_shape.raster()
@@ -4316,6 +4423,11 @@ class Maps(MapsBase):
         if calc_max:
             vmax = np.nanmax(self._data_manager.z_data)
 
+        if _is_dask_array(self._data_manager.z_data):
+            # evaluate min/max of lazy arrays in a single pass over the data
+            (dask,) = register_modules("dask")
+            vmin, vmax = dask.compute(vmin, vmax)
+
         return vmin, vmax
 
     def _set_vmin_vmax(self, vmin=None, vmax=None):
@@ -320,6 +320,12 @@ class SearchTree:
             The maps-object that provides the data.
         """
         self._m = m
+
+        # lazily initialized spatial index (see `_get_index()`)
+        self._index = None
+        self._index_ids = None
+        self._index_version = None
+
         # set starting pick-distance to 50 times the radius
         self.set_search_radius(self._m.cb.pick._search_radius)
 
@@ -383,56 +389,86 @@ class SearchTree:
                 "as float!"
             )
 
-    def _identify_search_subset(self, x, d):
-        # select a rectangle around the pick-coordinates
-        # (provides tremendous speedups for very large datasets)
+    def _get_index(self):
+        """
+        Get a (lazily initialized) spatial index of the reprojected coordinates.
 
-        if self._m._data_manager.x0_1D is not None:
-            # TODO check this!
-            # get a rectangular boolean mask
-            mx = np.logical_and(
-                self._m._data_manager.x0_1D > (x[0] - d),
-                self._m._data_manager.x0_1D < (x[0] + d),
-            )
-            my = np.logical_and(
-                self._m._data_manager.y0_1D > (x[1] - d),
-                self._m._data_manager.y0_1D < (x[1] + d),
-            )
+        The index is only re-built if the data of the data-manager changed
+        (e.g. after calling `m.set_data()` and `m.plot_map()`).
 
-            mx_id, my_id = np.where(mx)[0], np.where(my)[0]
-            m_rect_x, m_rect_y = np.meshgrid(mx_id, my_id)
+        Returns
+        -------
+        index : scipy.spatial.cKDTree or None
+            The spatial index (or None if no finite coordinates are available)
+        index_ids : np.ndarray
+            The flat indexes of the indexed points with respect to the data.
+        """
+        dm = self._m._data_manager
+        version = dm._props_version
 
-            x_rect = self._m._data_manager.x0[m_rect_x].ravel()
-            y_rect = self._m._data_manager.y0[m_rect_y].ravel()
+        if self._index_version != version:
+            from scipy.spatial import cKDTree
 
-            # get the unravelled indexes of the boolean mask
-            idx = np.ravel_multi_index((m_rect_x, m_rect_y), self._m._zshape).ravel()
-        else:
-            # get a rectangular boolean mask
-            mx = np.logical_and(
-                self._m._data_manager.x0 > (x[0] - d),
-                self._m._data_manager.x0 < (x[0] + d),
-            )
-            my = np.logical_and(
-                self._m._data_manager.y0 > (x[1] - d),
-                self._m._data_manager.y0 < (x[1] + d),
-            )
+            if dm.x0_1D is not None:
+                # 1D coordinates and 2D data (e.g. for "shade_raster" the
+                # coordinates are not converted to 2D by the data-manager)
+                # (indexes are flat indexes of the (y, x) grid)
+                x0, y0 = np.meshgrid(dm.x0_1D, dm.y0_1D, copy=False)
+            else:
+                x0, y0 = dm.x0, dm.y0
+                if x0 is None or y0 is None:
+                    return None, None
+
+            x0, y0 = np.asanyarray(x0).ravel(), np.asanyarray(y0).ravel()
+
+            # only index finite coordinates (e.g. ignore points that are outside
+            # the valid region of the plot-crs)
+            finite = np.isfinite(x0) & np.isfinite(y0)
+            if np.all(finite):
+                index_ids = None
+                pts = np.column_stack((x0, y0))
+            else:
+                index_ids = np.flatnonzero(finite)
+                pts = np.column_stack((x0[index_ids], y0[index_ids]))
 
-            m = np.logical_and(mx, my)
-            # get the indexes of the search-rectangle
-            idx = np.where(m.ravel())[0]
+            _log.debug(f"EOmaps: Building search-index for {len(pts)} datapoints.")
 
-            if len(idx) > 0:
-                x_rect = self._m._data_manager.x0[m].ravel()
-                y_rect = self._m._data_manager.y0[m].ravel()
+            if len(pts) > 0:
+                # use sliding midpoint rule (e.g. balanced_tree=False) since it is
+                # considerably faster to build for large datasets
+                self._index = cKDTree(
+                    pts, balanced_tree=False, compact_nodes=False, copy_data=False
+                )
             else:
-                x_rect, y_rect = [], []
+                self._index = None
 
-        if len(x_rect) > 0 and len(y_rect) > 0:
-            mcircle = (x_rect - x[0]) ** 2 + (y_rect - x[1]) ** 2 < d**2
-            return x_rect[mcircle], y_rect[mcircle], idx[mcircle]
-        else:
-            return [], [], []
+            self._index_ids = index_ids
+            self._index_version = version
+
+        return self._index, self._index_ids
+
+    def _invalidate_index(self):
+        # clear the spatial index (it is lazily re-built on the next query)
+        self._index = None
+        self._index_ids = None
+        self._index_version = None
+
+    def _query_index(self, x, k, d):
+        # find the k nearest points within a distance d (sorted by distance)
+        index, index_ids = self._get_index()
+        if index is None:
+            return np.array([], dtype=int)
+
+        dist, ind = index.query(x, k=k, distance_upper_bound=d)
+        dist, ind = np.atleast_1d(dist), np.atleast_1d(ind)
+
+        # cKDTree indicates missing neighbours with infinite distances
+        ind = ind[np.isfinite(dist)]
+
+        if index_ids is not None:
+            ind = index_ids[ind]
+
+        return ind
 
     def query(self, x, k=1, d=None, pick_relative_to_closest=True):
         """
@@ -540,27 +576,25 @@ class SearchTree:
 
                 return i
 
-        x_rect, y_rect, idx = self._identify_search_subset(x, d)
-        if len(idx) > 0:
-
-            if k == 1:
-                i = idx[((x_rect - x[0]) ** 2 + (y_rect - x[1]) ** 2).argmin()]
-            else:
-                if pick_relative_to_closest is True:
-                    i0 = ((x_rect - x[0]) ** 2 + (y_rect - x[1]) ** 2).argmin()
-
-                    return self.query(
-                        (x_rect[i0], y_rect[i0]),
-                        k=k,
-                        d=d,
-                        pick_relative_to_closest=False,
-                    )
-                i = idx[
-                    ((x_rect - x[0]) ** 2 + (y_rect - x[1]) ** 2).argpartition(
-                        range(min(k, x_rect.size))
-                    )[:k]
-                ]
+        if k == 1:
+            idx = self._query_index(x, k=1, d=d)
+            i = idx[0] if len(idx) > 0 else None
         else:
-            i = None
+            if pick_relative_to_closest is True:
+                idx = self._query_index(x, k=1, d=d)
+                if len(idx) == 0:
+                    return None
+
+                i0 = idx[0]
+                x0, y0 = self._m._data_manager.x0, self._m._data_manager.y0
+                return self.query(
+                    (x0.flat[i0], y0.flat[i0]),
+                    k=k,
+                    d=d,
+                    pick_relative_to_closest=False,
+                )
+
+            idx = self._query_index(x, k=k, d=d)
+            i = idx if len(idx) > 0 else None
 
         return i
@@ -15,6 +15,8 @@ class _SignalContainer(QObject):
     clipboardKwargsChanged = Signal()
 
     dataPlotted = Signal()
+    # progress of background data-preparation (stage, progress)
+    dataProgress = Signal(str, float)
 
     # -------- shape drawer
     drawFinished = Signal()
@@ -904,7 +904,7 @@ class LayerTabBar(QtWidgets.QTabBar):
                     return
 
         if layer in list(self.m.BM._bg_artists):
-            for a in self.m.BM._bg_artists[layer]:
+            for a in list(self.m.BM._bg_artists[layer]):
                 self.m.BM.remove_bg_artist(a)
                 a.remove()
             del self.m.BM._bg_artists[layer]
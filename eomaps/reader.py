@@ -13,6 +13,7 @@ import numpy as np
 from pyproj import CRS
 
 from .helpers import register_modules
+from ._data_manager import _get_xarray_values
 
 _log = logging.getLogger(__name__)
 
@@ -100,6 +101,7 @@ class read_file:
         set_data=None,
         mask_and_scale=False,
         fill_values="mask",
+        chunks=None,
     ):
         """
         Read all relevant information necessary to add a GeoTIFF to the map.
@@ -173,6 +175,16 @@ class read_file:
                - `cmap.set_over(...)`, `cmap.set_under(...)`)
 
               (fill-values are excluded when evaluating data-limits)
+        chunks : int, dict or str, optional
+            If provided, the data is loaded lazily as a dask-array with the given
+            chunk-sizes (see `xarray.open_dataset`) and only the data required
+            to plot the currently visible extent is computed.
+
+            NOTE: Lazy loading is only possible if a path is provided!
+            (use `xarray.open_dataset(..., chunks=...)` to provide a lazily
+            loaded `xarray.Dataset`)
+
+            The default is None.
 
         Returns
         -------
@@ -208,7 +220,7 @@ class read_file:
             if isinstance(path_or_dataset, (str, Path)):
                 # if a path is provided, open the file (and close it in the end)
                 ncfile = xar.open_dataset(
-                    path_or_dataset, mask_and_scale=mask_and_scale
+                    path_or_dataset, mask_and_scale=mask_and_scale, chunks=chunks
                 )
                 opened = True
 
@@ -261,7 +273,10 @@ class read_file:
             )
             # check if we need to transpose the data
             # (e.g. if data is provided with [y, x] dimensions instead of [x, y])
-            data = np.moveaxis(usencfile.values, *[dims.index(i) for i in ncdims])
+            # (dask-backed data is kept lazy)
+            data = np.moveaxis(
+                _get_xarray_values(usencfile), *[dims.index(i) for i in ncdims]
+            )
 
             x, y = (
                 getattr(usencfile, ncdims[0]).values,
@@ -308,6 +323,7 @@ class read_file:
         set_data=None,
         mask_and_scale=False,
         fill_values="mask",
+        chunks=None,
     ):
         """
         Read all relevant information necessary to add a NetCDF to the map.
@@ -390,6 +406,16 @@ class read_file:
                - `cmap.set_over(...)`, `cmap.set_under(...)`)
 
               (fill-values are excluded when evaluating data-limits)
+        chunks : int, dict or str, optional
+            If provided, the data is loaded lazily as a dask-array with the given
+            chunk-sizes (see `xarray.open_dataset`) and only the data required
+            to plot the currently visible extent is computed.
+
+            NOTE: Lazy loading is only possible if a path is provided!
+            (use `xarray.open_dataset(..., chunks=...)` to provide a lazily
+            loaded `xarray.Dataset`)
+
+            The default is None.
 
         Returns
         -------
@@ -423,7 +449,7 @@ class read_file:
             if isinstance(path_or_dataset, (str, Path)):
                 # if a path is provided, open the file (and close it in the end)
                 ncfile = xar.open_dataset(
-                    path_or_dataset, mask_and_scale=mask_and_scale
+                    path_or_dataset, mask_and_scale=mask_and_scale, chunks=chunks
                 )
                 opened = True
             elif isinstance(path_or_dataset, xar.Dataset):
@@ -530,10 +556,11 @@ class read_file:
                     f"y   : {ystr}\n"
                 )
 
+            # (dask-backed data is kept lazy)
             if data.shape == (y.size, x.size) and len(x.shape) == 1:
-                data = data.values.T
+                data = _get_xarray_values(data).T
             else:
-                data = data.values
+                data = _get_xarray_values(data)
 
             # only use masked arrays if mask_and_scale is False!
             # (otherwise the mask is already applied as NaN's in the float-array)
@@ -828,6 +855,7 @@ class from_file:
         coastline=False,
         mask_and_scale=False,
         fill_values="mask",
+        chunks=None,
         extent=None,
         **kwargs,
     ):
@@ -950,6 +978,16 @@ class from_file:
                - `cmap.set_over(...)`, `cmap.set_under(...)`)
 
               (fill-values are excluded when evaluating data-limits)
+        chunks : int, dict or str, optional
+            If provided, the data is loaded lazily as a dask-array with the given
+            chunk-sizes (see `xarray.open_dataset`) and only the data required
+            to plot the currently visible extent is computed.
+
+            NOTE: Lazy loading is only possible if a path is provided!
+            (use `xarray.open_dataset(..., chunks=...)` to provide a lazily
+            loaded `xarray.Dataset`)
+
+            The default is None.
         extent : tuple or string
             Set the extent of the map prior to plotting
             (can provide great speedups if only a subset of the dataset is shown!)
@@ -1010,6 +1048,7 @@ class from_file:
             set_data=None,
             mask_and_scale=mask_and_scale,
             fill_values=fill_values,
+            chunks=chunks,
         )
 
         if val_transform:
@@ -1040,6 +1079,7 @@ class from_file:
         coastline=False,
         mask_and_scale=False,
         fill_values="mask",
+        chunks=None,
         extent=None,
         **kwargs,
     ):
@@ -1150,6 +1190,16 @@ class from_file:
                - `cmap.set_over(...)`, `cmap.set_under(...)`)
 
               (fill-values are excluded when evaluating data-limits)
+        chunks : int, dict or str, optional
+            If provided, the data is loaded lazily as a dask-array with the given
+            chunk-sizes (see `xarray.open_dataset`) and only the data required
+            to plot the currently visible extent is computed.
+
+            NOTE: Lazy loading is only possible if a path is provided!
+            (use `xarray.open_dataset(..., chunks=...)` to provide a lazily
+            loaded `xarray.Dataset`)
+
+            The default is None.
         extent : tuple or string
             Set the extent of the map prior to plotting
             (can provide great speedups if only a subset of the dataset is shown!)
@@ -1204,6 +1254,7 @@ class from_file:
             crs_key=data_crs_key,
             mask_and_scale=mask_and_scale,
             fill_values=fill_values,
+            chunks=chunks,
         )
 
         if val_transform:
@@ -6,12 +6,19 @@
 """Plot shape classes (for data visualization)."""
 
 import logging
+import os
 from functools import partial, wraps
 from contextlib import contextmanager, ExitStack
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 
 from matplotlib.collections import PolyCollection, QuadMesh, TriMesh
 from matplotlib.tri import Triangulation
 from matplotlib.collections import Collection
+from matplotlib.image import AxesImage
+from matplotlib.path import Path
+from matplotlib.transforms import Bbox
+from matplotlib import artist
 
 from pyproj import CRS
 import numpy as np
@@ -110,7 +117,108 @@ class _ShapeBase:
 
         return radius
 
-    def _wraparound(self, x, y, xs, ys, crs):
+    # the number of points used to estimate the screen-size of the shapes
+    _lod_probe_n = 5
+    # the min. number of valid vertices of the polygons
+    _min_verts = 1
+
+    def _get_vertex_array(self, x, y, crs, radius, n):
+        # get the vertices of the shapes as array of shape (N, k, 2) and a mask
+        # that indicates valid shapes
+        raise NotImplementedError("_get_vertex_array is not implemented")
+
+    def _get_lod_n(self, size, nmax):
+        # get the number of points of each shape based on its size in pixels
+        raise NotImplementedError("_get_lod_n is not implemented")
+
+    def _collapse_verts(self, verts):
+        # get the vertices used for shapes drawn with `_lod_probe_n` points
+        return verts
+
+    def _get_polygons(self, x, y, crs, radius, n):
+        # get the polygons of the shapes and a mask of the valid shapes
+        verts, mask = self._get_vertex_array(x, y, crs, radius, n)
+        verts[~mask] = np.nan
+        return _PolygonBuffer.from_padded(verts, min_verts=self._min_verts)
+
+    @staticmethod
+    def _take_radius(radius, ids):
+        # select the radius of the shapes with the given ids
+        if isinstance(radius, (tuple, list)):
+            return tuple(r[ids] if np.ndim(r) > 0 else r for r in radius)
+        elif np.ndim(radius) > 0:
+            return radius[ids]
+        return radius
+
+    def _get_pixel_size(self, verts):
+        # get the (half) size of the shapes in pixels from their vertices
+        p = self._m.ax.transData.transform(verts.reshape(-1, 2))
+        p = p.reshape(verts.shape)
+
+        size = np.fmax.reduce(p, axis=1) - np.fmin.reduce(p, axis=1)
+        size = np.fmax.reduce(size, axis=1) / 2
+        # use the min. number of points for invalid shapes
+        size[~np.isfinite(size)] = 0
+        return size
+
+    def _get_lod_polygons(self, x, y, crs, radius, nmax):
+        """
+        Get polygons with a number of points based on their size on the screen.
+
+        The screen-size of the shapes is estimated from polygons with
+        `_lod_probe_n` points (e.g. with the current data-limits and dpi of
+        the figure). Shapes with the same number of points are calculated
+        together.
+
+        Parameters
+        ----------
+        x, y : np.ndarray
+            The coordinates of the shapes.
+        crs : any
+            The crs of the coordinates.
+        radius : any
+            The radius of the shapes.
+        nmax : int
+            The max. number of points of the shapes.
+
+        Returns
+        -------
+        polygons : _PolygonBuffer
+            The polygons of all valid shapes.
+        mask : np.ndarray
+            A boolean mask indicating the valid shapes.
+
+        """
+        probe_n = min(self._lod_probe_n, nmax)
+        verts, valid = self._get_vertex_array(x, y, crs, radius, probe_n)
+        n = self._get_lod_n(self._get_pixel_size(verts), nmax)
+
+        mask = np.zeros(len(x), dtype=bool)
+        polygons, ids = [], []
+        for k in np.unique(n):
+            sel = np.flatnonzero(n == k)
+            if k == probe_n:
+                v = self._collapse_verts(verts[sel])
+                v[~valid[sel]] = np.nan
+                p, m = _PolygonBuffer.from_padded(v, min_verts=self._min_verts)
+            else:
+                p, m = self._get_polygons(
+                    x[sel], y[sel], crs, self._take_radius(radius, sel), k
+                )
+            polygons.append(p)
+            ids.append(sel[m])
+            mask[sel[m]] = True
+
+        _log.debug(
+            "EOmaps: Number of points per shape: "
+            + ", ".join(f"{k}: {np.count_nonzero(n == k)}" for k in np.unique(n))
+        )
+
+        # restore the order of the shapes
+        order = np.argsort(np.concatenate(ids), kind="stable")
+        return _PolygonBuffer.concatenate(polygons).take(order), mask
+
+    def _wraparound(self, x, y, xs, ys, crs, lonlat=None):
         # ------------------------- implement some kind of "wraparound"
         if self._m._crs_plot in (
             self._m.CRS.Orthographic(),
@@ -138,12 +246,16 @@ class _ShapeBase:
 
                 return quadrants
 
-            t_in_lonlat = self._m._get_transformer(crs, 4326)
-            t_plot_lonlat = self._m._get_transformer(self._m.crs_plot, 4326)
+            if lonlat is None:
+                t_in_lonlat = self._m._get_transformer(crs, 4326)
+                t_plot_lonlat = self._m._get_transformer(self._m.crs_plot, 4326)
 
-            # transform the coordinates to lon/lat
-            xp, _ = t_in_lonlat.transform(x, y)
-            xsp, _ = t_plot_lonlat.transform(xs, ys)
+                # transform the coordinates to lon/lat
+                xp, _ = t_in_lonlat.transform(x, y)
+                xsp, _ = t_plot_lonlat.transform(xs, ys)
+            else:
+                # use the (already known) longitudes of the points
+                xp, xsp = lonlat
 
             quadrants, pts_quadrants = getQ(xp, xc), getQ(xsp, xc)
 
@@ -168,6 +280,9 @@ class _ShapeBase:
 class _CircularShapeBase(_ShapeBase):
     name = "circular_shape_base"
     radius_crs = None
+    # max. distance (in pixels) between the polygons and the shapes
+    # (used to set the number of points of each shape if n is None)
+    _max_pixel_error = 0.25
 
     def __init__(self, m):
         super().__init__(m=m)
@@ -221,29 +336,57 @@ class _CircularShapeBase(_ShapeBase):
         xs, ys, mask = [], [], []
         return xs, ys, mask
 
-    def get_coll(self, x, y, crs, **kwargs):
+    def _get_vertex_array(self, x, y, crs, radius, n):
         xs, ys, mask = self._get_points(
             x=x,
             y=y,
             crs=crs,
-            radius=self._selected_radius,
+            radius=radius,
             radius_crs=self.radius_crs,
-            n=self.n,
+            n=n,
         )
-        # compress the coordinates (masked arrays produce artefacts on the boundary
+        # drop masked coordinates (masked arrays produce artefacts on the boundary
         # in case intermediate points are masked)
-        verts = (
-            np.column_stack((x.compressed(), y.compressed()))
-            for i, (x, y) in enumerate(zip(xs, ys))
-            if mask[i]
-        )
+        verts = np.ma.stack((xs, ys), axis=2).astype(float).filled(np.nan)
+        return verts, mask
+
+    def _get_lod_n(self, size, nmax):
+        # max. distance between a circle with radius r and an inscribed
+        # regular polygon with k vertices: r * (1 - cos(pi / k))
+        with np.errstate(divide="ignore"):
+            c = np.clip(1 - self._max_pixel_error / size, -1, 1)
+        k = np.pi / np.maximum(np.arccos(c), 1e-6)
+
+        # use powers of 2 (+1 for the closing point) to limit the number of levels
+        k = 2 ** np.ceil(np.log2(np.maximum(k, 8))).astype(int) + 1
+        # shapes smaller than 1 pixel are drawn as quads (see `_collapse_verts`)
+        k[size < 0.5] = self._lod_probe_n
+        return np.minimum(k, nmax)
+
+    def _collapse_verts(self, verts):
+        # scale the quads (4 points on the shape) of shapes smaller than 1 pixel
+        # to preserve the area of the shapes (e.g. the pixel-coverage)
+        c = verts[:, :4].mean(axis=1, keepdims=True)
+        return c + (verts - c) * np.sqrt(np.pi / 2)
+
+    def get_coll(self, x, y, crs, **kwargs):
+        radius = self._selected_radius
+
+        if self._n is None and self._select_radius:
+            # adjust the number of points to the size of the shapes on the screen
+            polygons, mask = self._get_lod_polygons(x, y, crs, radius, self.n)
+        else:
+            polygons, mask = self._get_polygons(x, y, crs, radius, self.n)
+
         # remember masked points
         self._m._data_mask = mask
 
         color_and_array = Shapes._get_colors_and_array(kwargs, mask)
 
-        coll = PolyCollection(
-            verts,
+        # use individual paths to preserve the drawing-order of overlapping shapes
+        coll = _PolygonCollection(
+            polygons,
+            compound=False,
             # transOffset=self._m.ax.transData,
             **color_and_array,
             **kwargs,
@@ -345,6 +488,578 @@ class _CollectionAccessor:
                 pass
 
 
+def _get_array_key(a):
+    # identify an array by its memory (a reference to the array must be kept to
+    # make sure the memory is not re-used by another array)
+    return (a.__array_interface__["data"][0], a.shape, a.strides, a.dtype.str)
+
+
+class _CellIndex:
+    """
+    Bounding-box index of the cells of a tessellation.
+
+    Used to select the cells that intersect a given extent without re-computing
+    the tessellation.
+
+    Parameters
+    ----------
+    xmin, xmax, ymin, ymax : np.ndarray
+        The bounding-boxes of the cells.
+
+    """
+
+    def __init__(self, xmin, xmax, ymin, ymax):
+        # sort cells by xmin to pre-select candidates with a binary search
+        self._order = np.argsort(xmin, kind="stable")
+        self._xmin = xmin[self._order]
+        self._xmax = xmax[self._order]
+        self._ymin = ymin[self._order]
+        self._ymax = ymax[self._order]
+
+    def __len__(self):
+        return len(self._order)
+
+    def select(self, extent=None):
+        """
+        Get the (sorted) indices of all cells that intersect the extent.
+
+        Parameters
+        ----------
+        extent : tuple or None
+            The extent (x0, x1, y0, y1). If None, all cells are selected.
+
+        Returns
+        -------
+        ids : np.ndarray
+            The sorted indices of the selected cells.
+
+        """
+        if extent is None:
+            return np.arange(len(self._order))
+
+        x0, x1, y0, y1 = extent
+
+        n = np.searchsorted(self._xmin, x1, side="right")
+        q = (self._xmax[:n] >= x0) & (self._ymin[:n] <= y1) & (self._ymax[:n] >= y0)
+
+        return np.sort(self._order[:n][q])
+
+
+class _PolygonBuffer:
+    """
+    Vertices of multiple polygons stored in a single contiguous array.
+
+    The vertices of the i-th polygon are ``verts[offsets[i]:offsets[i + 1]]``.
+    All polygons are closed (e.g. the last vertex of each polygon is a copy of
+    its first vertex).
+
+    Parameters
+    ----------
+    verts : np.ndarray
+        The (closed) vertices of all polygons with shape (N, 2).
+    offsets : np.ndarray
+        The start-indices of the polygons (and the total number of vertices).
+
+    """
+
+    def __init__(self, verts, offsets):
+        self.verts = np.asarray(verts, dtype=float)
+        self.offsets = np.asarray(offsets, dtype=np.intp)
+        self._codes = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @classmethod
+    def from_padded(cls, verts, min_verts=3):
+        """
+        Get polygons from an array of vertices (padded with invalid values).
+
+        Non-finite (or masked) vertices are dropped and polygons with less than
+        `min_verts` valid vertices are excluded.
+
+        Parameters
+        ----------
+        verts : np.ndarray or np.ma.MaskedArray
+            The vertices of all polygons with shape (npolygons, nverts, 2).
+        min_verts : int, optional
+            The minimum number of valid vertices of a polygon. The default is 3.
+
+        Returns
+        -------
+        polygons : _PolygonBuffer
+            The polygons.
+        mask : np.ndarray
+            A boolean mask indicating the polygons that have been kept.
+
+        """
+        if np.ma.isMaskedArray(verts):
+            verts = verts.astype(float).filled(np.nan)
+        verts = np.asarray(verts, dtype=float)
+
+        valid = np.isfinite(verts).all(axis=2)
+        if valid.all() and verts.shape[1] >= min_verts:
+            # all vertices are valid (no need to select individual vertices)
+            npoly, nverts = verts.shape[:2]
+            closed_verts = np.concatenate((verts, verts[:, :1]), axis=1)
+            offsets = np.arange(npoly + 1, dtype=np.intp) * (nverts + 1)
+            mask = np.ones(npoly, dtype=bool)
+            return cls(closed_verts.reshape(-1, 2), offsets), mask
+
+        n = np.count_nonzero(valid, axis=1)
+        mask = n >= min_verts
+        valid &= mask[:, None]
+        n = n[mask]
+
+        offsets = np.zeros(len(n) + 1, dtype=np.intp)
+        np.cumsum(n + 1, out=offsets[1:])
+
+        # copy the first vertex of each polygon to the end to close the polygons
+        closing = offsets[1:] - 1
+        is_vert = np.ones(offsets[-1], dtype=bool)
+        is_vert[closing] = False
+
+        closed_verts = np.empty((offsets[-1], 2))
+        closed_verts[is_vert] = verts[valid]
+        closed_verts[closing] = closed_verts[offsets[:-1]]
+
+        return cls(closed_verts, offsets), mask
+
+    @classmethod
+    def concatenate(cls, polygons):
+        """
+        Concatenate multiple polygon-buffers.
+
+        Parameters
+        ----------
+        polygons : list of _PolygonBuffer
+            The polygons to concatenate.
+
+        Returns
+        -------
+        polygons : _PolygonBuffer
+            The concatenated polygons.
+
+        """
+        if len(polygons) == 0:
+            return cls(np.empty((0, 2)), [0])
+
+        n = np.concatenate([np.diff(p.offsets) for p in polygons])
+        offsets = np.zeros(len(n) + 1, dtype=np.intp)
+        np.cumsum(n, out=offsets[1:])
+        return cls(np.concatenate([p.verts for p in polygons]), offsets)
+
+    @property
+    def codes(self):
+        """The path-codes of all vertices."""
+        if self._codes is None:
+            codes = np.full(len(self.verts), Path.LINETO, dtype=Path.code_type)
+            codes[self.offsets[:-1]] = Path.MOVETO
+            codes[self.offsets[1:] - 1] = Path.CLOSEPOLY
+            self._codes = codes
+        return self._codes
+
+    def _get_vertex_ids(self, ids):
+        # get the vertex-indices and offsets of the polygons with the given ids
+        n = np.diff(self.offsets)[ids]
+        offsets = np.zeros(len(n) + 1, dtype=np.intp)
+        np.cumsum(n, out=offsets[1:])
+        vids = np.repeat(self.offsets[:-1][ids] - offsets[:-1], n)
+        vids += np.arange(offsets[-1])
+        return vids, offsets
+
+    def take(self, ids):
+        """
+        Get a subset of the polygons.
+
+        Parameters
+        ----------
+        ids : array-like
+            The indices of the polygons to select.
+
+        Returns
+        -------
+        polygons : _PolygonBuffer
+            The selected polygons.
+
+        """
+        vids, offsets = self._get_vertex_ids(ids)
+        return _PolygonBuffer(self.verts[vids], offsets)
+
+    def get_paths(self):
+        """Get a list of individual paths for all polygons."""
+        if len(self) == 0:
+            return []
+
+        verts, codes = self.verts, self.codes
+        o = self.offsets.tolist()
+
+        # create paths without re-evaluating the properties of each path
+        # (all paths share the same properties as the first path)
+        p0 = Path(verts[o[0] : o[1]], codes[o[0] : o[1]])
+        make = partial(Path._fast_from_codes_and_verts, internals_from=p0)
+        return [make(verts[i:j], codes[i:j]) for i, j in zip(o[:-1], o[1:])]
+
+    def get_compound_paths(self, groups, ngroups):
+        """
+        Get a single compound path for each group of polygons.
+
+        Parameters
+        ----------
+        groups : np.ndarray
+            The group-index (0 <= i < ngroups) of each polygon.
+        ngroups : int
+            The number of groups.
+
+        Returns
+        -------
+        paths : list of matplotlib.path.Path
+            The compound paths of the groups.
+
+        """
+        if ngroups == 1:
+            return [Path(self.verts, self.codes)]
+
+        # sort polygons by group (keeping the polygon order within the groups)
+        vids, _ = self._get_vertex_ids(np.argsort(groups, kind="stable"))
+        verts, codes = self.verts[vids], self.codes[vids]
+
+        # the number of vertices of each group
+        nverts = np.bincount(groups, weights=np.diff(self.offsets), minlength=ngroups)
+        o = np.concatenate(([0], np.cumsum(nverts.astype(np.intp)))).tolist()
+        return [Path(verts[i:j], codes[i:j]) for i, j in zip(o[:-1], o[1:])]
+
+
+class _PolygonCollection(PolyCollection):
+    """
+    A PolyCollection of polygons stored in a `_PolygonBuffer`.
+
+    Paths of individual polygons are only created on demand (e.g. if
+    `get_paths()` is called). If compound paths are used, the faces (and edges)
+    of all polygons with the same color are drawn as a single compound path.
+
+    Note
+    ----
+    Compound paths draw polygons grouped by color and all edges are drawn on top
+    of the faces, e.g. the drawing order of overlapping polygons is not preserved!
+    By default, compound paths are therefore only used for polygons that do not
+    overlap (`overlap=False`) if no edges are drawn.
+
+    Parameters
+    ----------
+    polygons : _PolygonBuffer
+        The polygons of the collection.
+    compound : bool or None, optional
+        Indicator if polygons with the same color should always be drawn as
+        compound paths. If None, the global default is used
+        (see `Maps.config(compound_polygons=...)`). The default is None.
+    overlap : bool, optional
+        Indicator if the polygons might overlap. If False, compound paths are
+        used if no edges are drawn. The default is True.
+    kwargs :
+        Additional kwargs passed to `matplotlib.collections.PolyCollection`.
+
+    """
+
+    # use individual paths if there are more colors than this fraction of polygons
+    _max_style_fraction = 0.5
+    # always use compound paths (see `Maps.config(compound_polygons=...)`)
+    _compound_default = False
+
+    def __init__(self, polygons, compound=None, overlap=True, **kwargs):
+        super().__init__([], closed=False, **kwargs)
+        self._polygons = polygons
+        self._compound = self._compound_default if compound is None else compound
+        self._overlap = overlap
+        self._paths = None
+        # cached compound paths (facecolors, edgecolors, draw-args)
+        self._compound_cache = None
+
+    def set_verts(self, verts, closed=True):
+        # explicitly set vertices replace the polygon-buffer
+        self._polygons = None
+        self._compound_cache = None
+        super().set_verts(verts, closed=closed)
+
+    def set_paths(self, paths):
+        self._polygons = None
+        self._compound_cache = None
+        super().set_paths(paths)
+
+    def get_paths(self):
+        if self._paths is None and self._polygons is not None:
+            self._paths = self._polygons.get_paths()
+        return self._paths
+
+    def get_datalim(self, transData):
+        transform = self.get_transform()
+        if (
+            self._polygons is None
+            or self._offsets is not None
+            or not transform.contains_branch(transData)
+        ):
+            return super().get_datalim(transData)
+
+        bbox = Bbox.null()
+        if len(self._polygons) > 0:
+            verts = (transform - transData).transform(self._polygons.verts)
+            bbox.update_from_data_xy(verts[np.isfinite(verts).all(axis=1)])
+        return bbox
+
+    def _get_color_groups(self, colors):
+        # get the group-index of each polygon and the colors of the groups
+        # (or None if there are too many different colors)
+        npoly = len(self._polygons)
+        if len(colors) <= 1:
+            return np.zeros(npoly, dtype=np.intp), colors
+        elif len(colors) != npoly:
+            # colors are cycled... use individual paths
+            return None
+
+        c8 = np.round(np.clip(colors, 0, 1) * 255).astype(np.uint8)
+        key = np.ascontiguousarray(c8).view(np.uint32)[:, 0]
+        _, first, groups = np.unique(key, return_index=True, return_inverse=True)
+        if len(first) > max(1, npoly * self._max_style_fraction):
+            return None
+
+        # use the color of the first polygon of each group
+        return groups.ravel(), colors[first]
+
+    def _get_compound_draw_args(self):
+        # get compound paths and colors of all polygon-groups with the same color
+        # (or None if individual paths should be used)
+        if (
+            self._polygons is None
+            or self._hatch
+            or len(self._linewidths) > 1
+            or len(self._linestyles) > 1
+            or len(self._antialiaseds) > 1
+            or len(self._urls) > 1
+            or self._gapcolor is not None
+            or self.have_units()
+        ):
+            return None
+
+        fc, ec = self.get_facecolor(), self.get_edgecolor()
+        draw_edges = len(ec) > 0 and self._linewidths[0] > 0 and ec[:, 3].any()
+
+        # individual paths are drawn in the order of the data, compound paths
+        # produce the same result only if polygons don't overlap and have no edges
+        if not self._compound and (self._overlap or draw_edges):
+            return None
+
+        if self._compound_cache is not None:
+            cfc, cec, args = self._compound_cache
+            # (colors of mapped collections are re-evaluated on each draw)
+            if np.array_equal(cfc, fc) and np.array_equal(cec, ec):
+                return args
+
+        # faces and edges are drawn separately (e.g. edges are always drawn on
+        # top of the faces, independent of the groups)
+        nocolor = np.zeros((0, 4))
+        groups = []
+        if len(fc) > 0:
+            groups.append((self._get_color_groups(fc), "face"))
+        if draw_edges:
+            groups.append((self._get_color_groups(ec), "edge"))
+
+        if any(g is None for g, _ in groups):
+            return None
+
+        args = []
+        for (ids, colors), kind in groups:
+            paths = self._polygons.get_compound_paths(ids, len(colors))
+            if kind == "face":
+                args.append((paths, colors, nocolor))
+            else:
+                args.append((paths, nocolor, colors))
+
+        self._compound_cache = (fc, ec, args)
+        return args
+
+    @artist.allow_rasterization
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+
+        self.update_scalarmappable()
+        args = self._get_compound_draw_args()
+        if args is None:
+            return super().draw(renderer)
+
+        renderer.open_group(self.__class__.__name__, self.get_gid())
+
+        transform = self.get_transform()
+        offset_trf = self.get_offset_transform()
+        offsets = self.get_offsets()
+
+        if not offset_trf.is_affine:
+            offsets = offset_trf.transform_non_affine(offsets)
+            offset_trf = offset_trf.get_affine()
+        if isinstance(offsets, np.ma.MaskedArray):
+            offsets = offsets.filled(np.nan)
+
+        gc = renderer.new_gc()
+        self._set_gc_clip(gc)
+        gc.set_snap(self.get_snap())
+
+        if self.get_sketch_params() is not None:
+            gc.set_sketch_params(*self.get_sketch_params())
+
+        if self.get_path_effects():
+            from matplotlib.patheffects import PathEffectRenderer
+
+            renderer = PathEffectRenderer(self.get_path_effects(), renderer)
+
+        if self._joinstyle:
+            gc.set_joinstyle(self._joinstyle)
+
+        if self._capstyle:
+            gc.set_capstyle(self._capstyle)
+
+        for paths, facecolors, edgecolors in args:
+            if not transform.is_affine:
+                paths = [transform.transform_path_non_affine(p) for p in paths]
+
+            renderer.draw_path_collection(
+                gc,
+                transform.get_affine().frozen(),
+                paths,
+                self.get_transforms(),
+                offsets,
+                offset_trf,
+                facecolors,
+                edgecolors,
+                self._linewidths,
+                self._linestyles,
+                self._antialiaseds,
+                self._urls,
+                "screen",
+            )
+
+        gc.restore()
+        renderer.close_group(self.__class__.__name__)
+        self.stale = False
+
+
+class _RasterImage(AxesImage):
+    """
+    An image of a regular grid that is warped to the plot-crs on draw.
+
+    The visible part of the grid is resampled to an image with the size of the
+    axes (in pixels) whenever the extent or the size of the axes changes
+    (e.g. also if a figure is exported with a different dpi).
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        The axes of the image.
+    data : np.ndarray
+        The 2D data of the grid (rows correspond to y, columns to x).
+    grid : tuple
+        The center of the first pixel and the pixel-size of the grid (in the
+        crs of the grid) as (x0, dx, y0, dy).
+    transform : callable
+        A function to transform coordinates from the plot-crs to the crs of the
+        grid (e.g. `transform(x, y) -> (x, y)`).
+    resampling : str, optional
+        The resampling method ("nearest" or "bilinear").
+        The default is "nearest".
+    period : float or None, optional
+        The period of the x-coordinates of the grid (e.g. 360 for longitudes).
+        The default is None.
+    kwargs :
+        Additional kwargs passed to `matplotlib.image.AxesImage`.
+
+    """
+
+    def __init__(
+        self, ax, data, grid, transform, resampling="nearest", period=None, **kwargs
+    ):
+        super().__init__(ax, origin="lower", interpolation="nearest", **kwargs)
+
+        self._grid_data = np.ma.asanyarray(data)
+        self._grid = grid
+        self._grid_transform = transform
+        self._resampling = resampling
+        self._period = period
+        # the extent and size of the last warped image
+        self._warp_key = None
+
+        # use the data of the grid until the image is warped on the next draw
+        self.set_data(data)
+
+    def _get_grid_indices(self, x, y):
+        # get the (fractional) pixel-indices of the grid for plot-crs coordinates
+        x, y = self._grid_transform(x, y)
+        x0, dx, y0, dy = self._grid
+
+        with np.errstate(invalid="ignore"):
+            fx, fy = (np.asarray(x) - x0) / dx, (np.asarray(y) - y0) / dy
+            if self._period is not None:
+                fx = np.mod(fx + 0.5, self._period / abs(dx)) - 0.5
+        return fx, fy
+
+    def _warp(self, extent, w, h):
+        # resample the grid to an image of (w x h) pixels covering the extent
+        x0, x1, y0, y1 = extent
+        x = x0 + (np.arange(w) + 0.5) * (x1 - x0) / w
+        y = y0 + (np.arange(h) + 0.5) * (y1 - y0) / h
+        fx, fy = self._get_grid_indices(*np.meshgrid(x, y))
+
+        data = self._grid_data
+        ny, nx = data.shape
+
+        with np.errstate(invalid="ignore"):
+            # non-finite indices (e.g. outside the projection) are invalid as well
+            valid = (fx >= -0.5) & (fx < nx - 0.5) & (fy >= -0.5) & (fy < ny - 0.5)
+        fx, fy = fx[valid], fy[valid]
+
+        if self._resampling == "bilinear":
+            data = data.astype(float, copy=False)
+            fx, fy = np.clip(fx, 0, nx - 1), np.clip(fy, 0, ny - 1)
+            ix = np.minimum(fx.astype(int), max(nx - 2, 0))
+            iy = np.minimum(fy.astype(int), max(ny - 2, 0))
+            wx, wy = fx - ix, fy - iy
+            jx, jy = np.minimum(ix + 1, nx - 1), np.minimum(iy + 1, ny - 1)
+
+            vals = (
+                data[iy, ix] * ((1 - wx) * (1 - wy))
+                + data[iy, jx] * (wx * (1 - wy))
+                + data[jy, ix] * ((1 - wx) * wy)
+                + data[jy, jx] * (wx * wy)
+            )
+        else:
+            ix = np.floor(fx + 0.5).astype(int)
+            iy = np.floor(fy + 0.5).astype(int)
+            vals = data[iy, ix]
+
+        img = np.ma.masked_all((h, w), dtype=vals.dtype)
+        img[valid] = vals
+        return img
+
+    @artist.allow_rasterization
+    def draw(self, renderer, *args, **kwargs):
+        if not self.get_visible():
+            return
+
+        ax = self.axes
+        (x0, y0), (x1, y1) = ax.viewLim.get_points()
+        w = max(int(np.ceil(ax.bbox.width)), 1)
+        h = max(int(np.ceil(ax.bbox.height)), 1)
+
+        key = (x0, x1, y0, y1, w, h)
+        if key != self._warp_key:
+            _log.debug(f"EOmaps: Warping raster to an image of {w}x{h} pixels")
+
+            with ax.hold_limits():
+                self.set_data(self._warp((x0, x1, y0, y1), w, h))
+                self.set_extent((x0, x1, y0, y1))
+            self._warp_key = key
+
+        super().draw(renderer, *args, **kwargs)
+
+
 class Shapes(object):
     """
     Set the plot-shape to represent the data-points.
@@ -424,12 +1139,19 @@ class Shapes(object):
         if (isinstance(radius, str) and radius == "estimate") or radius is None:
             if m._estimated_radius is None:
                 # make sure props are defined otherwise we can't estimate the radius!
-                if m._data_manager.x0 is None:
-                    m._data_manager.set_props(None)
+                dm = m._data_manager
+                if dm.z_data is None:
+                    dm.set_props(None)
+
+                if dm._lazy_grid is not None:
+                    # avoid re-projecting the full grid of lazy rectilinear grids
+                    x0 = dm._get_lazy_grid_corner(1)[0]
+                else:
+                    x0 = dm.x0
 
                 # check if the first element of x0 is nonzero...
                 # (to avoid slow performance of np.any for large arrays)
-                if not np.any(m._data_manager.x0.take(0)):
+                if not np.any(x0.take(0)):
                     return None
 
                 _log.info("EOmaps: Estimating shape radius...")
@@ -478,7 +1200,12 @@ class Shapes(object):
             if radius_crs == "in":
                 x, y = m._data_manager.xorig, m._data_manager.yorig
             elif radius_crs == "out":
-                x, y = m._data_manager.x0, m._data_manager.y0
+                if m._data_manager._lazy_grid is not None:
+                    # avoid re-projecting the full grid of lazy rectilinear grids
+                    n = int(np.sqrt(m.set_shape._radius_estimation_range))
+                    x, y = m._data_manager._get_lazy_grid_corner(n)
+                else:
+                    x, y = m._data_manager.x0, m._data_manager.y0
 
         radius = None
         # try to estimate radius for 2D datasets
@@ -603,9 +1330,14 @@ class Shapes(object):
 
     class _GeodCircles(_CircularShapeBase):
         name = "geod_circles"
+        # max. number of cached circle-template points
+        # (see `_get_circle_templates()`)
+        _max_template_cache_size = 5_000_000
 
         def __init__(self, m):
             super().__init__(m=m)
+            # cached circle-templates {key: (template-keys, dlon, lat)}
+            self._templates = dict()
 
         def __call__(self, radius=None, n=None):
             """
@@ -620,7 +1352,8 @@ class Shapes(object):
                 the respective size!
             n : int or None
                 The number of intermediate points to calculate on the geodesic circle.
-                If None, 100 is used for < 10k pixels and 20 otherwise.
+                If None, the number of points of each circle is set based on
+                its size on the screen (max. 100 for < 10k pixels and 20 otherwise).
                 The default is None.
 
             Returns
@@ -635,6 +1368,10 @@ class Shapes(object):
             """
             Calculate points on a geodetic circle with a given radius.
 
+            The shape of a geodesic circle does not depend on the longitude, so
+            the points are obtained by shifting (cached) circle-templates that are
+            calculated only once for each unique combination of latitude and radius.
+
             Parameters
             ----------
             lon : array-like
@@ -657,28 +1394,113 @@ class Shapes(object):
                 the latitudes of the geodetic circle points.
 
             """
-            size = lon.size
+            lon = np.asarray(lon, dtype=float).ravel()
+            lat = np.asarray(lat, dtype=float).ravel()
+            radius = np.broadcast_to(np.asarray(radius, dtype=float).ravel(), lon.shape)
+
+            valid = np.isfinite(lat) & np.isfinite(radius)
+
+            # get unique combinations of latitude and radius
+            # (complex numbers are used to sort by latitude and radius)
+            keys = np.where(valid, lat + 1j * radius, 0)
+            keys, inverse = np.unique(keys, return_inverse=True)
+            inverse = inverse.ravel()
+
+            dlon, lats = self._get_circle_templates(keys, n, start_angle)
+            dlon, lats = dlon[inverse], lats[inverse]
+
+            # shift the templates to the center-longitudes (in the -180, 180 range)
+            lons = dlon + lon[:, None]
+            lons += 180
+            np.mod(lons, 360, out=lons)
+            lons -= 180
+
+            lons[~valid] = np.nan
+            lats[~valid] = np.nan
 
-            if isinstance(radius, (int, float)):
-                radius = np.full((size, n), radius)
+            return lons, lats
+
+        def _get_circle_templates(self, keys, n, start_angle):
+            # get the longitude-offsets and latitudes of the points of geodesic
+            # circles centered at longitude 0 for the (sorted) keys (lat + 1j * radius)
+            geod = self._m.crs_plot.get_geod()
+            cache_key = (n, start_angle, geod.initstring)
+
+            if cache_key in self._templates:
+                tkeys, tdlon, tlat = self._templates[cache_key]
             else:
-                if radius.size != lon.size:
-                    radius = np.broadcast_to(radius[:, None], (size, n))
+                tkeys = np.empty(0, dtype=complex)
+                tdlon, tlat = np.empty((0, n)), np.empty((0, n))
+
+            idx = np.searchsorted(tkeys, keys)
+            found = idx < len(tkeys)
+            found[found] = tkeys[idx[found]] == keys[found]
+
+            if not found.all():
+                missing = keys[~found]
+                _log.debug(f"EOmaps: Calculating {len(missing)} geod_circle templates")
+
+                dlon, lat = self._calc_circle_templates(geod, missing, n, start_angle)
+
+                tkeys = np.concatenate((tkeys, missing))
+                order = np.argsort(tkeys)
+                tkeys = tkeys[order]
+                tdlon = np.concatenate((tdlon, dlon))[order]
+                tlat = np.concatenate((tlat, lat))[order]
+
+                # limit the size of the cache (templates of other n are dropped first)
+                size = sum(
+                    t[1].size for k, t in self._templates.items() if k != cache_key
+                )
+                if size + tdlon.size > self._max_template_cache_size:
+                    self._templates.clear()
+                    if tdlon.size > self._max_template_cache_size:
+                        # only keep the templates of the current keys
+                        idx = np.searchsorted(tkeys, keys)
+                        tkeys, tdlon, tlat = keys, tdlon[idx], tlat[idx]
+
+                if tdlon.size <= self._max_template_cache_size:
+                    self._templates[cache_key] = (tkeys, tdlon, tlat)
                 else:
-                    radius = np.broadcast_to(radius.ravel()[:, None], (size, n))
+                    self._templates.pop(cache_key, None)
 
-            geod = self._m.crs_plot.get_geod()
-            lons, lats, back_azim = geod.fwd(
-                lons=np.broadcast_to(lon[:, None], (size, n)),
-                lats=np.broadcast_to(lat[:, None], (size, n)),
-                az=np.linspace(
-                    [start_angle] * size, [360 - start_angle] * size, n, axis=1
-                ),
-                dist=radius,
-                radians=False,
-            )
+                idx = np.searchsorted(tkeys, keys)
 
-            return lons, lats
+            return tdlon[idx], tlat[idx]
+
+        def _calc_circle_templates(self, geod, keys, n, start_angle):
+            # calculate the points of geodesic circles centered at longitude 0
+            # (large numbers of circles are calculated in chunks in parallel threads)
+            lat = np.repeat(keys.real, n)
+            dist = np.repeat(keys.imag, n)
+            lon = np.zeros(lat.shape)
+            az = np.tile(np.linspace(start_angle, 360 - start_angle, n), len(keys))
+
+            # (chunks must contain full circles)
+            chunksize = max(self._m._data_manager._reproject_chunksize, 1)
+            step = max(chunksize // n, 1) * n
+            chunks = [slice(i, i + step) for i in range(0, lat.size, step)]
+
+            def fwd_chunk(s):
+                # results are written to the input-arrays
+                geod.fwd(lon[s], lat[s], az[s], dist[s], inplace=True)
+
+            nworkers = self._m._data_manager._reproject_workers or os.cpu_count() or 1
+            nworkers = min(nworkers, len(chunks))
+
+            if nworkers <= 1:
+                for s in chunks:
+                    fwd_chunk(s)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=nworkers, thread_name_prefix="EOmaps_geod"
+                )
+                try:
+                    list(executor.map(fwd_chunk, chunks))
+                finally:
+                    executor.shutdown(wait=True, cancel_futures=True)
+
+            return lon.reshape(-1, n), lat.reshape(-1, n)
 
         def _get_points(self, x, y, crs, radius, radius_crs="geod", n=20):
             crs = self._m.get_crs(crs)
@@ -699,9 +1521,12 @@ class Shapes(object):
             # calculate some points on the geodesic circle
             lons, lats = self._calc_geod_circle_points(lon, lat, radius, n=n)
 
-            xs, ys = np.ma.masked_invalid(plot_t.transform(lons, lats), copy=False)
+            xs, ys = np.ma.masked_invalid(
+                self._m._data_manager._transform_chunked(plot_t, lons, lats),
+                copy=False,
+            )
 
-            xs, ys, mask = self._wraparound(x, y, xs, ys, crs)
+            xs, ys, mask = self._wraparound(x, y, xs, ys, crs, lonlat=(lon, lons))
 
             return xs, ys, mask
 
@@ -832,6 +1657,12 @@ class Shapes(object):
 
     class _Rectangles(_ShapeBase):
         name = "rectangles"
+        # the corner-points are used to estimate the screen-size of the rectangles
+        _lod_probe_n = 1
+        _min_verts = 4
+        # max. length (in pixels) of the segments of the (curved) edges
+        # (used to set the number of points of each rectangle if n is None)
+        _max_segment_length = 8
 
         def __init__(self, m):
             super().__init__(m=m)
@@ -864,7 +1695,8 @@ class Shapes(object):
                 The number of intermediate points to calculate on the rectangle edges
                 (e.g. to properly plot "curved" rectangles in projected crs)
                 Use n=1 to force rectangles!
-                If None, 40 is used for <10k datapoints and 10 is used otherwise.
+                If None, the number of points of each rectangle is set based on
+                its size on the screen (max. 40 for <10k datapoints and 10 otherwise).
                 The default is None
             """
             from . import MapsGrid  # do this here to avoid circular imports!
@@ -909,6 +1741,18 @@ class Shapes(object):
             return s
 
         def _get_rectangle_verts(self, x, y, crs, radius, radius_crs="in", n=4):
+            verts = self._get_rectangle_vert_array(x, y, crs, radius, radius_crs, n)
+
+            valid = np.isfinite(verts).all(axis=2)
+            mask = np.count_nonzero(valid, axis=1) >= 4
+
+            verts = [v[q] for v, q in zip(verts[mask], valid[mask])]
+
+            return verts, mask
+
+        def _get_rectangle_vert_array(self, x, y, crs, radius, radius_crs="in", n=4):
+            # get the vertices of all rectangles as array of shape (len(x), 4 * n, 2)
+            # (invalid vertices are set to NaN)
             in_crs = self._m.get_crs(crs)
 
             if isinstance(radius, (int, float, np.number)):
@@ -980,35 +1824,42 @@ class Shapes(object):
 
             px, py = t.transform(px, py)
 
-            px = (
-                np.ma.masked_invalid(np.split(px, len(x)))
-                .swapaxes(1, 2)
-                .reshape(len(x), -1)
-            )
-            py = (
-                np.ma.masked_invalid(np.split(py, len(x)))
-                .swapaxes(1, 2)
-                .reshape(len(x), -1)
-            )
+            verts = np.stack((px, py), axis=-1).reshape(len(x), n, 4, 2)
+            verts = verts.swapaxes(1, 2).reshape(len(x), 4 * n, 2)
+            # mask invalid vertices
+            verts[~np.isfinite(verts).all(axis=2)] = np.nan
 
-            verts = np.ma.stack((px.T, py.T), axis=0).T
-            mask = np.count_nonzero(~verts.mask.any(axis=2), axis=1) >= 4
+            return verts
 
-            verts = [i[~i.mask.any(axis=1)] for i in verts[mask]]
+        def _get_vertex_array(self, x, y, crs, radius, n):
+            verts = self._get_rectangle_vert_array(
+                x, y, crs, radius, self.radius_crs, n
+            )
+            return verts, np.ones(len(verts), dtype=bool)
 
-            return verts, mask
+        def _get_lod_n(self, size, nmax):
+            # the number of segments per edge
+            k = np.ceil(2 * size / self._max_segment_length)
+            # use powers of 2 to limit the number of levels
+            k = 2 ** np.ceil(np.log2(np.maximum(k, 1))).astype(int)
+            # (n points per edge result in n - 1 segments for n > 1)
+            return np.minimum(np.where(k > 1, k + 1, 1), nmax)
 
         def _get_polygon_coll(self, x, y, crs, **kwargs):
-            verts, mask = self._get_rectangle_verts(
-                x, y, crs, self._selected_radius, self.radius_crs, self.n
-            )
+            radius, n = self._selected_radius, self.n
+
+            if self._n is None and self._select_radius and n > 1:
+                # adjust the number of points to the size of the shapes on the screen
+                polygons, mask = self._get_lod_polygons(x, y, crs, radius, n)
+            else:
+                polygons, mask = self._get_polygons(x, y, crs, radius, n)
 
             # remember masked points
             self._m._data_mask = mask
             color_and_array = Shapes._get_colors_and_array(kwargs, mask)
 
-            coll = PolyCollection(
-                verts=verts,
+            coll = _PolygonCollection(
+                polygons,
                 # transOffset=self._m.ax.transData,
                 **color_and_array,
                 **kwargs,
@@ -1252,10 +2103,14 @@ class Shapes(object):
 
     class _VoronoiDiagram(object):
         name = "voronoi_diagram"
+        # the visible cells are selected from a cached diagram of the full dataset
+        _select_cells = True
 
         def __init__(self, m):
             self._m = m
             self._mask_radius = None
+            # cached cells (key, coordinates, cells)
+            self._cells = None
 
         def __call__(self, masked=True, mask_radius=None):
             """
@@ -1305,10 +2160,21 @@ class Shapes(object):
         def mask_radius(self, val):
             self._mask_radius = val
 
-        def _get_voronoi_verts_and_mask(self, x, y, crs, radius, masked=True):
+        def _get_voronoi_cells(self, x, y, crs, radius, masked=True):
+            # get the voronoi-cells of all datapoints as flat (closed) vertices
+            # (cells are cached and only re-computed if the coordinates change)
+            if masked:
+                [radiusx, radiusy] = radius
+                maxdist = 2 * np.mean(np.sqrt(radiusx**2 + radiusy**2))
+            else:
+                maxdist = None
+
+            key = (_get_array_key(x), _get_array_key(y), crs, maxdist)
+            if self._cells is not None and self._cells[0] == key:
+                return self._cells[2]
+
             try:
                 from scipy.spatial import Voronoi
-                from itertools import zip_longest
             except ImportError:
                 raise ImportError("'scipy' is required for 'voronoi'!")
 
@@ -1318,57 +2184,80 @@ class Shapes(object):
             x0, y0 = t_in_plot.transform(x, y)
 
             datamask = np.isfinite(x0) & np.isfinite(y0)
-            [radiusx, radiusy] = radius
-
-            maxdist = 2 * np.mean(np.sqrt(radiusx**2 + radiusy**2))
-
             xy = np.column_stack((x0[datamask], y0[datamask]))
 
             vor = Voronoi(xy)
-            rect_regions = np.array(list(zip_longest(*vor.regions, fillvalue=-2))).T
-            # (use -2 instead of None to make np.take work as expected)
 
-            rect_regions = rect_regions[vor.point_region]
-            # exclude all points at infinity
-            mask = np.all(np.not_equal(rect_regions, -1), axis=1)
-            # get the mask for the artificially added vertices
-            rect_mask = rect_regions == -2
+            # flat vertex-indices of all regions
+            lengths = np.fromiter(map(len, vor.regions), dtype=int)
+            starts = np.cumsum(lengths) - lengths
+            regions = np.fromiter(chain.from_iterable(vor.regions), dtype=int)
 
-            x = np.ma.masked_array(
-                np.take(vor.vertices[:, 0], rect_regions), mask=rect_mask
-            )
-            y = np.ma.masked_array(
-                np.take(vor.vertices[:, 1], rect_regions), mask=rect_mask
-            )
-            rect_verts = np.ma.stack((x, y)).swapaxes(0, 1).swapaxes(1, 2)
+            # get the vertex-indices of the region of each point
+            n = lengths[vor.point_region]
+            pids = np.repeat(np.arange(len(xy)), n)
+            pos = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+            vids = regions[np.repeat(starts[vor.point_region], n) + pos]
+
+            # exclude all regions with vertices at infinity
+            mask = n > 0
+            mask[pids[vids == -1]] = False
 
             if masked:
                 # exclude any polygon whose defining point is farther away than maxdist
-                cdist = np.sqrt(np.sum((rect_verts - vor.points[:, None]) ** 2, axis=2))
-                polymask = np.all(cdist < maxdist, axis=1)
-                mask = np.logical_and(mask, polymask)
+                d = np.sqrt(np.sum((vor.vertices[vids] - xy[pids]) ** 2, axis=1))
+                mask[pids[d >= maxdist]] = False
+
+            # get (closed) vertices of all valid cells
+            # (the first vertex of each cell is repeated at the end)
+            keep = mask[pids]
+            n, vids, pos = n[mask], vids[keep], pos[keep]
+            offsets = np.zeros(len(n) + 1, dtype=int)
+            offsets[1:] = np.cumsum(n + 1)
+
+            start = np.cumsum(n) - n
+            pos = np.arange(offsets[-1]) - np.repeat(offsets[:-1], n + 1)
+            verts = vor.vertices[vids[np.repeat(start, n + 1) + pos % np.repeat(n, n + 1)]]
+
+            cells = dict(
+                polygons=_PolygonBuffer(verts, offsets),
+                # the ids of the datapoints of each cell
+                ids=np.flatnonzero(datamask)[mask],
+                datamask=datamask,
+                index=_CellIndex(
+                    np.minimum.reduceat(verts[:, 0], offsets[:-1]),
+                    np.maximum.reduceat(verts[:, 0], offsets[:-1]),
+                    np.minimum.reduceat(verts[:, 1], offsets[:-1]),
+                    np.maximum.reduceat(verts[:, 1], offsets[:-1]),
+                ),
+            )
 
-            verts = list(i.compressed().reshape(-1, 2) for i in rect_verts[mask])
-            return verts, mask, datamask
+            # keep a reference to the coordinates to make sure the key stays valid
+            self._cells = (key, (x, y), cells)
+            return cells
 
         def get_coll(self, x, y, crs, **kwargs):
-
-            verts, mask, datamask = self._get_voronoi_verts_and_mask(
+            cells = self._get_voronoi_cells(
                 x, y, crs, self.mask_radius, masked=self.masked
             )
 
+            # select the cells that intersect the current extent
+            sel = cells["index"].select(self._m._data_manager.last_extent)
+
             # find the masked points that are not masked by the datamask
-            mask2 = ~datamask.copy()
-            mask2[np.where(datamask)[0][mask]] = True
+            mask2 = ~cells["datamask"]
+            mask2[cells["ids"]] = True
             # remember the mask
             self._m._data_mask = mask2
 
-            color_and_array = Shapes._get_colors_and_array(
-                kwargs, np.logical_and(datamask, mask)
-            )
+            visible = np.zeros(len(mask2), dtype=bool)
+            visible[cells["ids"][sel]] = True
+
+            color_and_array = Shapes._get_colors_and_array(kwargs, visible)
 
-            coll = PolyCollection(
-                verts=verts,
+            coll = _PolygonCollection(
+                cells["polygons"].take(sel),
+                overlap=False,
                 **color_and_array,
                 # transOffset=self._m.ax.transData,
                 **kwargs,
@@ -1443,7 +2332,6 @@ class Shapes(object):
         def _get_voronoi_verts_and_mask(self, x, y, crs, radius, masked=True):
             try:
                 from scipy.spatial import SphericalVoronoi
-                from itertools import zip_longest
             except ImportError:
                 raise ImportError("'scipy' is required for 'voronoi'!")
 
@@ -1482,8 +2370,13 @@ class Shapes(object):
             vor = SphericalVoronoi(np.column_stack((x, y, z)), r, [0, 0, 0])
             vor.sort_vertices_of_regions()
 
-            rect_regions = np.array(list(zip_longest(*vor.regions, fillvalue=-2))).T
-            # (use -2 instead of None to make np.take work as expected)
+            # get a padded array of the vertex-indices of all regions
+            # (use -2 as fill-value to make np.take work as expected)
+            lengths = np.fromiter(map(len, vor.regions), dtype=int)
+            rect_regions = np.full((len(lengths), lengths.max()), -2)
+            rect_regions[np.arange(lengths.max()) < lengths[:, None]] = np.fromiter(
+                chain.from_iterable(vor.regions), dtype=int
+            )
 
             # rect_regions = rect_regions[vor.point_region]
             # exclude all points at infinity
@@ -1520,12 +2413,14 @@ class Shapes(object):
                 polymask = np.all(cdist < maxdist, axis=1)
                 mask = np.logical_and(mask, polymask)
 
-            verts = list(i.compressed().reshape(-1, 2) for i in rect_verts[mask])
-            return verts, mask, datamask
+            verts = rect_verts.astype(float).filled(np.nan)
+            verts[~mask] = np.nan
+            polygons, mask = _PolygonBuffer.from_padded(verts, min_verts=1)
+            return polygons, mask, datamask
 
         def get_coll(self, x, y, crs, **kwargs):
 
-            verts, mask, datamask = self._get_voronoi_verts_and_mask(
+            polygons, mask, datamask = self._get_voronoi_verts_and_mask(
                 x, y, crs, self.mask_radius, masked=self.masked
             )
 
@@ -1539,8 +2434,9 @@ class Shapes(object):
                 kwargs, np.logical_and(datamask, mask)
             )
 
-            coll = PolyCollection(
-                verts=verts,
+            coll = _PolygonCollection(
+                polygons,
+                overlap=False,
                 **color_and_array,
                 # transOffset=self._m.ax.transData,
                 **kwargs,
@@ -1559,10 +2455,14 @@ class Shapes(object):
 
     class _DelaunayTriangulation(object):
         name = "delaunay_triangulation"
+        # the visible cells are selected from a cached triangulation of the full dataset
+        _select_cells = True
 
         def __init__(self, m):
             self._m = m
             self._mask_radius = None
+            # cached triangulation (key, coordinates, cells)
+            self._cells = None
 
         def __call__(
             self, masked=True, mask_radius=None, mask_radius_crs="in", flat=False
@@ -1634,6 +2534,17 @@ class Shapes(object):
         def _get_delaunay_triangulation(
             self, x, y, crs, radius, radius_crs="out", masked=True
         ):
+            # get the triangles of all datapoints
+            # (triangles are cached and only re-computed if the coordinates change)
+            if masked:
+                radiusx, radiusy = radius
+                maxdist = 4 * np.mean(np.sqrt(radiusx**2 + radiusy**2))
+            else:
+                maxdist = None
+
+            key = (_get_array_key(x), _get_array_key(y), crs, radius_crs, maxdist)
+            if self._cells is not None and self._cells[0] == key:
+                return self._cells[2]
 
             # prepare data
             try:
@@ -1651,12 +2562,9 @@ class Shapes(object):
                 np.column_stack((x0[datamask], y0[datamask])), qhull_options="QJ"
             )
 
-            tri = Triangulation(d.points[:, 0], d.points[:, 1], d.simplices)
+            px, py, triangles = d.points[:, 0], d.points[:, 1], d.simplices
 
             if masked:
-                radiusx, radiusy = radius
-                maxdist = 4 * np.mean(np.sqrt(radiusx**2 + radiusy**2))
-
                 if radius_crs == "in":
                     # use input-coordinates for evaluating the mask
                     mx = self._m._data_manager._current_data["xorig"].ravel()
@@ -1670,7 +2578,7 @@ class Shapes(object):
                         False
                     ), f"the radius_crs '{radius_crs}' is not supported for delaunay-masking"
 
-                mx, my = mx[datamask][tri.triangles], my[datamask][tri.triangles]
+                mx, my = mx[datamask][triangles], my[datamask][triangles]
                 # get individual triangle side-lengths
                 l = np.array(
                     [
@@ -1683,25 +2591,49 @@ class Shapes(object):
 
                 # mask any triangle whose side-length exceeds maxdist
                 mask = np.any(l > maxdist, axis=0)
-                tri.set_mask(mask)
+            else:
+                mask = np.zeros(len(triangles), dtype=bool)
+
+            tx, ty = px[triangles], py[triangles]
+            cells = dict(
+                x=px,
+                y=py,
+                triangles=triangles,
+                mask=mask,
+                datamask=datamask,
+                index=_CellIndex(
+                    tx.min(axis=1), tx.max(axis=1), ty.min(axis=1), ty.max(axis=1)
+                ),
+            )
 
-            return tri, datamask
+            # keep a reference to the coordinates to make sure the key stays valid
+            self._cells = (key, (x, y), cells)
+            return cells
 
         def get_coll(self, x, y, crs, **kwargs):
-
-            tri, datamask = self._get_delaunay_triangulation(
+            cells = self._get_delaunay_triangulation(
                 x, y, crs, self.mask_radius, self.mask_radius_crs, self.masked
             )
-            maskedTris = tri.get_masked_triangles()
+
+            datamask = cells["datamask"]
 
             # find the masked points that are not masked by the datamask
             mask = ~datamask.copy()
             if self.masked:
-                mask[np.where(datamask)[0][list(set(maskedTris.flat))]] = True
+                tris = cells["triangles"][~cells["mask"]]
+                mask[np.flatnonzero(datamask)[tris.ravel()]] = True
 
             # remember the mask
             self._m._data_mask = mask
 
+            # mask all triangles that do not intersect the current extent
+            trimask = np.ones(len(cells["mask"]), dtype=bool)
+            trimask[cells["index"].select(self._m._data_manager.last_extent)] = False
+
+            tri = Triangulation(cells["x"], cells["y"], cells["triangles"])
+            tri.set_mask(trimask | cells["mask"])
+            maskedTris = tri.get_masked_triangles()
+
             color_and_array = Shapes._get_colors_and_array(kwargs, datamask)
 
             if self.flat == False:
@@ -1737,9 +2669,11 @@ class Shapes(object):
 
                 # Vertices of triangles.
                 verts = np.stack((tri.x[maskedTris], tri.y[maskedTris]), axis=-1)
+                polygons, _ = _PolygonBuffer.from_padded(verts)
 
-                coll = PolyCollection(
-                    verts=verts,
+                coll = _PolygonCollection(
+                    polygons,
+                    overlap=False,
                     # transOffset=self._m.ax.transData,
                     **color_and_array,
                     **kwargs,
@@ -1939,7 +2873,13 @@ class Shapes(object):
             self.radius_crs = "in"
 
         def __call__(
-            self, maxsize=5e6, interp_order=0, aggregator="mean", valid_fraction=0
+            self,
+            maxsize=5e6,
+            interp_order=0,
+            aggregator="mean",
+            valid_fraction=0,
+            overviews=False,
+            resampling="nearest",
         ):
             """
             Draw the data as a rectangular raster  (>> usable for very large datasets!)
@@ -1957,7 +2897,23 @@ class Shapes(object):
 
             Note
             ----
-            The raster-shape uses a QuadMesh to represent the datapoints.
+            Regular grids (e.g. grids with equally spaced rectilinear coordinates)
+            are drawn as a single image. Other grids are drawn as QuadMesh.
+
+            - If the grid is rectilinear in the plot-crs, the image is drawn
+              directly (and resampled by matplotlib)
+            - Otherwise, the visible part of the grid is warped to an image
+              with the resolution of the axes (in pixels) on each draw.
+
+            Large rectilinear grids (>1 million datapoints) provided in a different
+            crs than the plot-crs are not re-projected when the data is plotted.
+            Instead, only the visible part of the grid is re-projected on each
+            redraw. (use `Maps.config(lazy_grid_threshold=...)` to change the
+            size-threshold or to disable this behavior)
+
+            The raster-shape uses a QuadMesh to represent the datapoints if the grid
+            is not regular (or if properties of the collection like edgecolors
+            or explicit facecolors are provided).
 
             - As a requirement for correct identification of the pixels, the
               **data must be sorted by coordinates**!
@@ -2006,6 +2962,11 @@ class Shapes(object):
                   `data = np.array([...]).astype(<desired dtype>)` or use ordinary
                   aggregator metrics.
 
+                - "fast_nanmean", "fast_nanmax": fast (vectorized) metrics that ignore
+                  NaN values and masked values.
+                - "fast_count": the number of valid (e.g. not NaN and not masked)
+                  values within each aggregation block.
+
                 - "spline": aggregate with spline interpolation via `scipy.ndimage.zoom`
                   (interpolation order can be set via the 'interp_order' kwarg)
 
@@ -2021,6 +2982,27 @@ class Shapes(object):
                 (ONLY used if method = "scipy")
                 The spline interpolation order for zooming.
                 See `scipy.ndimage.zoom` for more details.
+            overviews : bool
+                (NOT used by the "spline" method)
+
+                If True, a multi-resolution pyramid of aggregated overviews
+                (with blocksizes of 2, 4, 8, ... pixels) is used to select the data.
+
+                Overview-levels are computed only once (on first use) and re-used
+                on consecutive redraws. This considerably speeds up panning and
+                zooming of very large datasets at the cost of additional memory
+                (approx. 1/3 of the dataset size) and a slightly coarser resolution
+                (the used blocksize is rounded to the next power of 2).
+
+                The default is False.
+            resampling : str or None
+                The resampling method used to draw regular grids as images.
+
+                - "nearest": use the value of the closest pixel
+                - "bilinear": use a bilinear interpolation of the pixel-values
+                - None: always use a QuadMesh to draw the data
+
+                The default is "nearest".
             """
 
             from . import MapsGrid  # do this here to avoid circular imports!
@@ -2031,6 +3013,8 @@ class Shapes(object):
                 shape._interp_order = interp_order
                 shape._aggregator = aggregator
                 shape._valid_fraction = valid_fraction
+                shape._overviews = overviews
+                shape._resampling = resampling
                 m._shape = shape
 
         @property
@@ -2040,6 +3024,8 @@ class Shapes(object):
                 interp_order=self._interp_order,
                 aggregator=self._aggregator,
                 valid_fraction=self._valid_fraction,
+                overviews=self._overviews,
+                resampling=self._resampling,
             )
 
         @property
@@ -2139,9 +3125,132 @@ class Shapes(object):
 
             return coll
 
+        @staticmethod
+        def _get_regular_grid(x, y, rtol=1e-3):
+            # check if the coordinates represent a regular rectilinear grid and
+            # return (transposed, (x0, dx, y0, dy)) or None
+            # (transposed=True if the x-coordinates change along the first axis)
+            if x.ndim != 2 or x.shape != y.shape or min(x.shape) < 2:
+                return None
+
+            for transposed in (False, True):
+                xx, yy = (x.T, y.T) if transposed else (x, y)
+                ny, nx = xx.shape
+
+                x0, y0 = xx[0, 0], yy[0, 0]
+                dx, dy = (xx[0, -1] - x0) / (nx - 1), (yy[-1, 0] - y0) / (ny - 1)
+                if not (np.isfinite([dx, dy]).all() and dx != 0 and dy != 0):
+                    continue
+
+                # max. deviation from a regular grid (NaN for non-finite values)
+                errx = np.abs(xx - (x0 + dx * np.arange(nx))).max()
+                erry = np.abs(yy - (y0 + dy * np.arange(ny))[:, None]).max()
+                if not (errx <= rtol * abs(dx) and erry <= rtol * abs(dy)):
+                    continue
+
+                return transposed, (x0, dx, y0, dy)
+
+            return None
+
+        def _get_plot_grid(self, grid, shape, in_crs, rtol=1e-3):
+            # get the regular grid (x0, dx, y0, dy) in the plot-crs if the grid is
+            # rectilinear and regular in the plot-crs as well (or None)
+            if in_crs == self._m.crs_plot:
+                return grid
+
+            x0, dx, y0, dy = grid
+            ny, nx = shape
+
+            # probe the transformation at some pixel-centers
+            i, j = np.meshgrid(np.linspace(0, nx - 1, 5), np.linspace(0, ny - 1, 5))
+            t = self._m._get_transformer(in_crs, self._m.crs_plot)
+            px, py = t.transform(x0 + i * dx, y0 + j * dy)
+            if not (np.isfinite(px).all() and np.isfinite(py).all()):
+                return None
+
+            pdx = (px[0, -1] - px[0, 0]) / (nx - 1)
+            pdy = (py[-1, 0] - py[0, 0]) / (ny - 1)
+            if pdx == 0 or pdy == 0:
+                return None
+
+            errx = np.abs(px - (px[0, 0] + pdx * i)).max()
+            erry = np.abs(py - (py[0, 0] + pdy * j)).max()
+            if errx > rtol * abs(pdx) or erry > rtol * abs(pdy):
+                return None
+
+            return px[0, 0], pdx, py[0, 0], pdy
+
+        def _get_image(self, x, y, crs, array=None, **kwargs):
+            # get an image of the data (or None if the grid is not regular or if
+            # properties are provided that are not supported by images)
+            if (
+                self._resampling is None
+                or array is None
+                or np.ndim(array) != 2
+                or not all(hasattr(AxesImage, f"set_{key}") for key in kwargs)
+            ):
+                return None
+
+            grid = self._get_regular_grid(np.asarray(x), np.asarray(y))
+            if grid is None:
+                return None
+
+            transposed, grid = grid
+            data = array.T if transposed else array
+
+            self._m._data_mask = None
+
+            resampling = kwargs.pop("interpolation", self._resampling)
+            # use the same zorder as collections
+            kwargs.setdefault("zorder", QuadMesh.zorder)
+
+            in_crs = self._m.get_crs(crs)
+            plot_grid = self._get_plot_grid(grid, data.shape, in_crs)
+
+            if plot_grid is not None:
+                x0, dx, y0, dy = plot_grid
+                ny, nx = data.shape
+                extent = (
+                    x0 - dx / 2,
+                    x0 + (nx - 0.5) * dx,
+                    y0 - dy / 2,
+                    y0 + (ny - 0.5) * dy,
+                )
+
+                img = AxesImage(
+                    self._m.ax,
+                    origin="lower",
+                    extent=extent,
+                    interpolation=resampling,
+                    **kwargs,
+                )
+                img.set_data(data)
+            else:
+                # warp the visible part of the grid to the plot-crs on draw
+                img = _RasterImage(
+                    self._m.ax,
+                    data,
+                    grid,
+                    transform=partial(
+                        self._m._data_manager._transform_chunked,
+                        self._m._get_transformer(self._m.crs_plot, in_crs),
+                    ),
+                    resampling=resampling,
+                    period=360 if in_crs.is_geographic else None,
+                    **kwargs,
+                )
+
+            return img
+
         def get_coll(self, x, y, crs, **kwargs):
 
             x, y = np.asanyarray(x), np.asanyarray(y)
+
+            # draw regular grids as images
+            img = self._get_image(x, y, crs, **kwargs)
+            if img is not None:
+                return img
+
             # don't use antialiasing by default since it introduces unwanted
             # transparency for reprojected QuadMeshes!
             kwargs.setdefault("antialiased", False)
@@ -9,12 +9,23 @@ from matplotlib.legend import DraggableLegend
 from matplotlib.lines import Line2D
 from matplotlib.widgets import Slider
 from functools import wraps
+from itertools import chain
 from matplotlib.pyplot import Artist, rcParams
 
 from packaging import version
 from .helpers import mpl_version
 
 
+def _prefetch_adjacent_layers(m, layers, val, n):
+    # fetch the n layers next to the selected one (in each direction)
+    # while the map is idle
+    if not n:
+        return
+
+    adjacent = chain(*((val + i, val - i) for i in range(1, n + 1)))
+    m.BM.prefetch_layers([layers[i] for i in adjacent if 0 <= i < len(layers)])
+
+
 class SelectorButtons(Artist):
     # A custom button implementation that uses a legend as container-artist
     # ... adapted from https://stackoverflow.com/a/71323434/9703451
@@ -170,7 +181,14 @@ class DraggableLegend_new(DraggableLegend):
 
 class LayerSelector(SelectorButtons):
     def __init__(
-        self, m, layers=None, draggable=True, exclude_layers=None, name=None, **kwargs
+        self,
+        m,
+        layers=None,
+        draggable=True,
+        exclude_layers=None,
+        name=None,
+        prefetch=2,
+        **kwargs,
     ):
         """
         A button-widget that can be used to select the displayed plot-layer.
@@ -209,6 +227,12 @@ class LayerSelector(SelectorButtons):
         name : str
             The name of the slider (used to identify the object)
             If None, a unique identifier is used.
+        prefetch : int, optional
+            The number of adjacent layers (in each direction) that are fetched
+            in the background while the map is idle after a layer was selected.
+            (Only relevant for interactive backends, see `m.BM.prefetch_layers()`)
+            If 0, no layers are prefetched.
+            The default is 2.
         kwargs :
             All additional arguments are passed to `plt.legend`
 
@@ -252,9 +276,12 @@ class LayerSelector(SelectorButtons):
             "layers": layers,
             "draggable": draggable,
             "exclude_layers": exclude_layers,
+            "prefetch": prefetch,
             **kwargs,
         }
 
+        self._prefetch = prefetch
+
         if layers is None:
             if exclude_layers is None:
                 exclude_layers = ["all"]
@@ -310,6 +337,8 @@ class LayerSelector(SelectorButtons):
         self._m.BM.update(blit=False)
         self._m.BM.canvas.draw_idle()
 
+        _prefetch_adjacent_layers(self._m, self.labels, int(val), self._prefetch)
+
     def _reinit(self):
         """
         re-initialize the widget (to update layers etc.)
@@ -344,6 +373,10 @@ class LayerSelector(SelectorButtons):
         self._m.BM.remove_artist(self.leg)
         self.leg.remove()
 
+        # stop prefetching adjacent layers
+        if self._prefetch:
+            self._m.BM.cancel_prefetch()
+
         del self._m.util._selectors[self._init_args["name"]]
         self._m.BM.update()
 
@@ -357,6 +390,7 @@ class LayerSlider(Slider):
         txt_patch_props=None,
         exclude_layers=None,
         name=None,
+        prefetch=2,
         **kwargs,
     ):
         """
@@ -410,6 +444,12 @@ class LayerSlider(Slider):
         name : str
             The name of the slider (used to identify the object)
             If None, a unique identifier is used.
+        prefetch : int, optional
+            The number of adjacent layers (in each direction) that are fetched
+            in the background while the map is idle after the slider was moved.
+            (Only relevant for interactive backends, see `m.BM.prefetch_layers()`)
+            If 0, no layers are prefetched.
+            The default is 2.
         kwargs :
             Additional kwargs are passed to matplotlib.widgets.Slider
 
@@ -444,9 +484,12 @@ class LayerSlider(Slider):
             "layers": layers,
             "txt_patch_props": txt_patch_props,
             "exclude_layers": exclude_layers,
+            "prefetch": prefetch,
             **kwargs,
         }
 
+        self._prefetch = prefetch
+
         if layers is None:
             if exclude_layers is None:
                 exclude_layers = ["all"]
@@ -571,6 +614,8 @@ class LayerSlider(Slider):
         self._m.BM.bg_layer = l
         self._m.BM.update()
 
+        _prefetch_adjacent_layers(self._m, self._layers, int(val), self._prefetch)
+
     def remove(self):
         """
         Remove the widget from the map
@@ -580,6 +625,10 @@ class LayerSlider(Slider):
         self.disconnect_events()
         self.ax.remove()
 
+        # stop prefetching adjacent layers
+        if self._prefetch:
+            self._m.BM.cancel_prefetch()
+
         del self._m.util._sliders[self._init_args["name"]]
 
         self._m.BM.update()
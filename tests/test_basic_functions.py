@@ -1,5 +1,6 @@
 import unittest
 import warnings
+from itertools import chain
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -7,9 +8,13 @@ import numpy as np
 import pandas as pd
 from matplotlib.backend_bases import KeyEvent, MouseEvent
 from matplotlib.gridspec import GridSpec
+from matplotlib.transforms import Bbox
 from pytest import mark
 
+from pyproj import CRS, Transformer
+
 from eomaps import Maps, MapsGrid
+from eomaps._data_manager import _JobCancelled
 
 mpl.rcParams["toolbar"] = "None"
 
@@ -543,6 +548,262 @@ class TestBasicPlotting(unittest.TestCase):
         # TODO add proper checks here!
         plt.close("all")
 
+    def test_prepare_data_chunked_reprojection(self):
+        x, y = np.linspace(-170, 170, 100), np.linspace(-80, 80, 50)
+        data = np.random.default_rng(1).random((100, 50))
+
+        m = Maps(3857)
+        m.set_data(data, x, y, crs=4326)
+        ref = m._data_manager._prepare_data()
+
+        try:
+            Maps.config(reproject_chunksize=333, reproject_workers=3)
+            props = m._data_manager._prepare_data()
+        finally:
+            Maps.config(reproject_chunksize=1_000_000, reproject_workers=0)
+
+        for key in ("x0", "y0"):
+            self.assertEqual(props[key].shape, ref[key].shape)
+            self.assertTrue(np.allclose(props[key], ref[key]))
+
+        plt.close("all")
+
+    def test_reproject_cache(self):
+        import tempfile
+        from eomaps._data_manager import DataManager
+
+        x, y = np.linspace(-170, 170, 100), np.linspace(-80, 80, 50)
+        data = np.random.default_rng(1).random((100, 50))
+
+        m = Maps(3857)
+        m.set_data(data, x, y, crs=4326)
+        ref = m._data_manager._prepare_data()
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            try:
+                Maps.config(reproject_cache=cache_dir)
+                cache = DataManager._reproject_cache
+
+                props = m._data_manager._prepare_data()
+                self.assertEqual(len(list(cache.cache_dir.glob("*.npy"))), 2)
+
+                # re-use the cached coordinates
+                props2 = m._data_manager._prepare_data()
+                self.assertTrue(isinstance(props2["x0"], np.memmap))
+
+                for key in ("x0", "y0"):
+                    self.assertTrue(np.allclose(props[key], ref[key]))
+                    self.assertTrue(np.allclose(props2[key], ref[key]))
+
+                # different crs results in a new cache entry
+                m2 = Maps(3035)
+                m2.set_data(data, x, y, crs=4326)
+                m2._data_manager._prepare_data()
+                self.assertEqual(len(list(cache.cache_dir.glob("*.npy"))), 4)
+
+                # the least recently used entry is removed if the cache is full
+                Maps.config(reproject_cache_size=cache.size * 1.1 / 1e6)
+                m3 = Maps(4087)
+                m3.set_data(data, x, y, crs=4326)
+                m3._data_manager._prepare_data()
+                self.assertEqual(len(list(cache.cache_dir.glob("*.npy"))), 4)
+                transformer = Transformer.from_crs(
+                    CRS.from_user_input(4326),
+                    CRS.from_user_input(m._crs_plot),
+                    always_xy=True,
+                )
+                self.assertTrue(
+                    cache.get(cache.get_key(x, y, transformer, grid=True)) is None
+                )
+                del props2
+            finally:
+                Maps.config(reproject_cache=False, reproject_cache_size=1000)
+
+        plt.close("all")
+
+    def test_lazy_grid_reprojection(self):
+        x, y = np.linspace(-170, 170, 400), np.linspace(-80, 80, 200)
+        data = np.random.default_rng(1).random((400, 200))
+
+        m = Maps(3857)
+        m.set_data(data, x, y, crs=4326)
+        m.set_shape.raster(maxsize=1e4)
+
+        try:
+            Maps.config(lazy_grid_threshold=1)
+            m.plot_map()
+        finally:
+            Maps.config(lazy_grid_threshold=1_000_000)
+
+        dm = m._data_manager
+        self.assertTrue(dm._lazy_grid is not None)
+        self.assertTrue("x0" not in dm._all_data)
+
+        m.f.canvas.draw()
+        self.assertTrue("x0" not in dm._all_data)
+
+        m.set_extent((-20, 20, -10, 10), 4326)
+        m.f.canvas.draw()
+        self.assertTrue("x0" not in dm._all_data)
+
+        # the selected window must contain the visible extent
+        props = dm._current_data
+        self.assertTrue(props["z_data"].size < data.size)
+        x0, x1, y0, y1 = m.get_extent(m.crs_plot)
+        self.assertTrue(props["x0"].min() < x0 and props["x0"].max() > x1)
+        self.assertTrue(props["y0"].min() < y0 and props["y0"].max() > y1)
+
+        # the full grid is reprojected on demand
+        ref = Maps(3857)
+        ref.set_data(data, x, y, crs=4326)
+        ref.set_shape.raster()
+        refprops = ref._data_manager._prepare_data()
+
+        self.assertTrue(np.allclose(dm.x0, refprops["x0"]))
+        self.assertTrue(np.allclose(dm.y0, refprops["y0"]))
+        self.assertTrue(np.allclose(dm._x0min, np.nanmin(refprops["x0"])))
+        self.assertTrue(np.allclose(dm._y0max, np.nanmax(refprops["y0"])))
+
+        # the full grid is reprojected if the extent can not be estimated
+        m2 = Maps(3857)
+        m2.set_data(data, x, y, crs=4326)
+        m2.set_shape.raster(maxsize=1e4)
+        dm2 = m2._data_manager
+        dm2._get_lazy_grid_extent = lambda: None
+        try:
+            Maps.config(lazy_grid_threshold=1)
+            m2.plot_map()
+        finally:
+            Maps.config(lazy_grid_threshold=1_000_000)
+
+        self.assertTrue(dm2._lazy_grid is None)
+        self.assertTrue(np.allclose(dm2.x0, refprops["x0"]))
+        self.assertTrue(np.allclose(dm2._x0min, np.nanmin(refprops["x0"])))
+        self.assertTrue(np.allclose(dm2._y0max, np.nanmax(refprops["y0"])))
+        m2.f.canvas.draw()
+        self.assertTrue(m2.coll is not None)
+
+        # lazy grids can be disabled
+        try:
+            Maps.config(lazy_grid_threshold=0)
+            m3 = Maps(3857)
+            m3.set_data(data, x, y, crs=4326)
+            m3.set_shape.raster(maxsize=1e4)
+            m3.plot_map()
+        finally:
+            Maps.config(lazy_grid_threshold=1_000_000)
+
+        self.assertTrue(m3._data_manager._lazy_grid is None)
+
+        plt.close("all")
+
+    def test_plot_map_background(self):
+        m = Maps(4326)
+        m.set_data(self.data, x="x", y="y", crs=3857, parameter="value")
+        m.set_shape.rectangles()
+
+        # non-interactive backends fall back to synchronous data-preparation
+        m.plot_map(background=True)
+        self.assertTrue(m._data_plotted)
+        self.assertTrue(m.coll is not None)
+
+        # emulate an interactive backend (results are passed to the main
+        # thread by explicitly calling the timer-callback)
+        dm = m._data_manager
+        dm._background_supported = lambda: True
+
+        def finish_job():
+            dm._job[0].result()
+            dm._check_job()
+
+        m.plot_map(background=True, vmin=0)
+        self.assertTrue(m.coll is None)
+        finish_job()
+        self.assertTrue(m._data_plotted)
+        self.assertEqual(m._vmin, 0)
+
+        # collection is created in the background
+        finish_job()
+        coll = m.coll
+        self.assertTrue(coll is not None)
+
+        # check that superseded jobs are cancelled
+        m.set_extent((-50, 50, -20, 20))
+        m.f.canvas.draw()
+        job = dm._job
+        m.set_extent((-40, 40, -20, 20))
+        m.f.canvas.draw()
+        self.assertTrue(dm._job is not job)
+        finish_job()
+        self.assertTrue(m.coll is not coll)
+        self.assertTrue(m.coll.axes is m.ax)
+        self.assertTrue(coll.axes is None)
+
+        # the data-manager is only updated (on the main thread) once a job is done
+        last_extent, current_data = dm.last_extent, dm._current_data
+        m.set_extent((-30, 30, -20, 20))
+        m.f.canvas.draw()
+        dm._job[0].result()
+        self.assertEqual(dm.last_extent, last_extent)
+        self.assertTrue(dm._current_data is current_data)
+        dm._check_job()
+        self.assertEqual(dm.last_extent, dm.current_extent)
+        self.assertTrue(dm._current_data is not current_data)
+
+        # failed jobs are retried on the next fetch
+        select_props = dm._select_props
+
+        def fail(*args, **kwargs):
+            raise AssertionError("EOmaps: failed job")
+
+        dm._select_props = fail
+        m.set_extent((-20, 20, -10, 10))
+        m.f.canvas.draw()
+        dm._job[0].exception()
+        dm._check_job()
+        self.assertTrue(dm.extent_changed)
+
+        dm._select_props = select_props
+        dm.on_fetch_bg()
+        finish_job()
+        self.assertFalse(dm.extent_changed)
+
+        # running select-jobs stop at the next aggregated strip if cancelled
+        x, y = np.linspace(-50, 50, 1000), np.linspace(-40, 40, 800)
+        m2 = m.new_layer()
+        m2.set_data(np.random.rand(1000, 800), x, y, crs=4326)
+        m2.set_shape.raster(maxsize=1e3, aggregator="mean")
+
+        dm2 = m2._data_manager
+        dm2._background_supported = lambda: True
+        m2.plot_map(background=True)
+        while dm2._job is not None:
+            dm2._job[0].result()
+            dm2._check_job()
+
+        dm2._incremental_pan = False
+        dm2._aggregate_chunksize = 10_000
+
+        strips = []
+        aggregate_blocks = dm2._aggregate_blocks
+
+        def aggregate_and_cancel(*args, **kwargs):
+            strips.append(args[0].shape[0])
+            if len(strips) == 1:
+                # emulate a new job that supersedes the running one
+                dm2._job_token += 1
+            return aggregate_blocks(*args, **kwargs)
+
+        dm2._aggregate_blocks = aggregate_and_cancel
+        m2.set_extent((-45, 45, -35, 35))
+        m2.f.canvas.draw()
+        with self.assertRaises(_JobCancelled):
+            dm2._job[0].result()
+        # (without cancellation all blocks of the window would be aggregated)
+        self.assertEqual(len(strips), 1)
+
+        plt.close("all")
+
     def test_layout_editor(self):
 
         mgrid = MapsGrid(2, 2, crs=[[4326, 4326], [3857, 3857]])
@@ -1383,6 +1644,886 @@ class TestBasicPlotting(unittest.TestCase):
         self.assertTrue(len(m.cb.click.get.cbs) == 0)
         plt.close("all")
 
+    def test_bg_cache(self):
+        try:
+            m = Maps(figsize=(4, 3))
+            nbytes = int(m.f.bbox.width) * int(m.f.bbox.height) * 4
+
+            # allow caching approx. 5 layers
+            Maps.config(bg_cache_size=5.5 * nbytes / 1e6)
+            m = Maps(figsize=(4, 3))
+            for i in range(10):
+                m.add_marker(xy=(i, i), layer=str(i))
+
+            m.f.canvas.draw()
+            for i in range(10):
+                m.show_layer(str(i))
+
+            info = m.BM.bg_cache_info()
+            self.assertTrue(info["nbytes"] <= info["maxsize"])
+            self.assertTrue(info["evictions"] > 0)
+            self.assertTrue(info["misses"] >= 10)
+
+            # the active layer and the background and spines layers are kept
+            for layer in ("9", "__BG__", "__SPINES__"):
+                self.assertIn(layer, m.BM._bg_layers)
+            # the least recently shown layers are evicted first
+            self.assertNotIn("0", m.BM._bg_layers)
+
+            # showing a cached layer again does not re-draw the layer
+            misses = info["misses"]
+            m.show_layer("8")
+            info = m.BM.bg_cache_info()
+            self.assertEqual(info["misses"], misses)
+            self.assertTrue(info["hits"] > 0)
+
+            # previews of the previous extent share the budget of the cache
+            m.set_extent((-50, 50, -30, 30))
+            m.f.canvas.draw()
+            for i in (7, 8, 9):
+                m.show_layer(str(i))
+
+            x0, x1 = m.ax.get_xlim()
+            m.ax.set_xlim(x0 + 1, x1 + 1)
+            m.f.canvas.draw()
+            self.assertTrue(len(m.BM._bg_previews) > 0)
+            for i in range(7):
+                m.show_layer(str(i))
+                nbytes = m.BM._bg_layers.nbytes + m.BM._bg_previews.nbytes
+                self.assertTrue(nbytes <= info["maxsize"])
+            self.assertTrue(m.BM._bg_previews.evictions > 0)
+        finally:
+            Maps.config(bg_cache_size=0)
+
+        m = Maps()
+        self.assertIsNone(m.BM.bg_cache_info()["maxsize"])
+        plt.close("all")
+
+    def test_bg_previews(self):
+        m = Maps(3857, figsize=(4, 3), layer="A")
+        m.set_data(self.data, x="x", y="y", crs=3857)
+        m.plot_map()
+        m2 = m.new_layer("B")
+        m2.set_data(self.data, x="x", y="y", crs=3857)
+        m2.plot_map(cmap="Blues")
+
+        m.set_extent((-5e6, 5e6, -3e6, 3e6), 3857)
+        m.f.canvas.draw()
+        m.show_layer("B")
+        m.show_layer("A")
+
+        # emulate an interactive backend (timers are executed explicitly)
+        m.BM._timers_supported = lambda: True
+
+        # pan the map
+        unshifted = m.BM._get_array("B")
+        x0, x1 = m.ax.get_xlim()
+        m.ax.set_xlim(x0 + 1e6, x1 + 1e6)
+        m.f.canvas.draw()
+        self.assertIn("B", m.BM._bg_previews)
+        self.assertNotIn("B", m.BM._bg_layers)
+
+        # a shifted preview is shown on layer-change (without re-drawing the layer)
+        misses = m.BM.bg_cache_info()["misses"]
+        m.show_layer("B")
+        self.assertEqual(m.BM.bg_cache_info()["misses"], misses)
+        self.assertIn("B", m.BM._pending_bg_previews)
+        preview = m.BM._get_preview_array("B")
+
+        # the layer is re-drawn once the timer is executed
+        m.BM._refresh_bg_previews()
+        self.assertIn("B", m.BM._bg_layers)
+        self.assertNotIn("B", m.BM._bg_previews)
+        self.assertEqual(len(m.BM._pending_bg_previews), 0)
+
+        # the preview is shifted to the new extent
+        # (compare the inner part of the map to exclude the newly exposed margin)
+        rgba = m.BM._get_array("B").astype(float)
+        self.assertEqual(preview.shape, rgba.shape)
+
+        px0, py0, px1, py1 = np.round(m.ax.bbox.extents).astype(int)
+        s = (slice(py0 + 10, py1 - 10), slice(px0 + 50, px1 - 50))
+        self.assertTrue(
+            np.abs(preview - rgba)[s].mean()
+            < 0.5 * np.abs(unshifted.astype(float) - rgba)[s].mean()
+        )
+
+        # previews are not kept if the map is zoomed
+        m.show_layer("A")
+        m.ax.set_xlim(x0, x1 + 1e6)
+        m.f.canvas.draw()
+        self.assertEqual(len(m.BM._bg_previews), 0)
+
+        plt.close("all")
+
+    def test_unmanaged_artists(self):
+        m = Maps(figsize=(4, 3))
+        m.add_marker(xy=(0, 0))
+        m2 = m.new_map(ax=122)
+        m.f.canvas.draw()
+
+        def get_unmanaged():
+            # compare incremental tracking against a full scan of all children
+            unmanaged = m.BM._get_unmanaged_artists()
+            managed = set(chain(*m.BM._bg_artists.values(), *m.BM._artists.values()))
+            expected = {
+                a
+                for ax in (m.ax, m2.ax)
+                for a in ax._children
+                if a not in managed and a not in m.BM._ignored_unmanaged_artists
+            }
+            self.assertEqual(unmanaged, expected)
+            return unmanaged
+
+        (l,) = m.ax.plot([0, 1], [0, 1])
+        (l2,) = m2.ax.plot([0, 1], [0, 1])
+        self.assertTrue({l, l2}.issubset(get_unmanaged()))
+
+        m.BM.add_bg_artist(l, layer="A")
+        m.BM.add_bg_artist(l, layer="B")
+        self.assertNotIn(l, get_unmanaged())
+        m.BM.remove_bg_artist(l, layer="A")
+        self.assertNotIn(l, get_unmanaged())
+        m.BM.remove_bg_artist(l, layer="B")
+        self.assertIn(l, get_unmanaged())
+
+        t = m.ax.text(0, 0, "asdf")
+        m.BM.add_artist(t)
+        self.assertNotIn(t, get_unmanaged())
+        m.BM.remove_artist(t)
+        self.assertIn(t, get_unmanaged())
+        t.remove()
+        self.assertNotIn(t, get_unmanaged())
+
+        l.remove()
+        self.assertNotIn(l, get_unmanaged())
+
+        # artists added with matplotlib functions are detected
+        # (also if the number of children did not change)
+        for i in range(3):
+            n = len(m.ax.get_children())
+            (l,) = m.ax.plot([0, i], [0, 1])
+            self.assertIn(l, get_unmanaged())
+            l.remove()
+            (l,) = m.ax.plot([0, i], [0, 1])
+            self.assertEqual(len(m.ax.get_children()), n + 1)
+            self.assertIn(l, get_unmanaged())
+
+        # the checks only involve artists that changed since the last call
+        get_unmanaged()
+        self.assertEqual(len(m.BM._unmanaged_recheck), 0)
+        snapshots = dict(m.BM._axes_snapshots)
+        get_unmanaged()
+        for ax, snapshot in snapshots.items():
+            self.assertIs(m.BM._axes_snapshots[ax], snapshot)
+
+        m.ax.set_title("title")
+        self.assertIn(m.ax.title, m.BM._get_unmanaged_artists())
+
+        # stale unmanaged artists trigger a re-draw of the background
+        l2.set_color("r")
+        self.assertTrue(any(a.stale for a in m.BM._get_unmanaged_artists()))
+        m.f.canvas.draw()
+
+        plt.close(m.f)
+
+    def test_blit_dirty_regions(self):
+        m = Maps(figsize=(4, 3))
+        m.add_marker(xy=(0, 0))
+        m.add_marker(xy=(10, 10), layer="B")
+        m.f.canvas.draw()
+
+        blitted = []
+        m.f.canvas.blit = lambda bbox=None: blitted.append(Bbox(bbox.get_points()))
+
+        txt = m.ax.text(0.1, 0.1, "asdf", transform=m.ax.transAxes)
+        m.BM.add_artist(txt)
+        m.BM.update()
+        extent0 = txt.get_window_extent()
+        self.assertTrue(blitted[-1].contains(*extent0.p0))
+        self.assertTrue(blitted[-1].contains(*extent0.p1))
+        self.assertTrue(blitted[-1].width < m.f.bbox.width / 2)
+
+        # only the old and new extent of changed artists is blitted
+        txt.set_position((0.5, 0.5))
+        m.BM.update()
+        extent1 = txt.get_window_extent()
+        for p in (extent0.p0, extent0.p1, extent1.p0, extent1.p1):
+            self.assertTrue(blitted[-1].contains(*p))
+        self.assertTrue(blitted[-1].width < m.f.bbox.width)
+
+        # nothing is blitted if nothing changed
+        n = len(blitted)
+        m.BM.update()
+        self.assertEqual(len(blitted), n)
+
+        # removed artists are cleared
+        m.BM.remove_artist(txt)
+        m.BM.update()
+        self.assertTrue(blitted[-1].contains(*extent1.p0))
+        self.assertTrue(blitted[-1].width < m.f.bbox.width / 2)
+
+        # changes are blitted with the next blit
+        m.BM.add_artist(txt)
+        m.BM.update(blit=False)
+        self.assertEqual(len(blitted), n + 1)
+        m.BM.update()
+        self.assertTrue(blitted[-1].contains(*extent1.p0))
+
+        # the whole figure is blitted if the background changed
+        m.show_layer("B")
+        self.assertEqual(blitted[-1].bounds, m.f.bbox.bounds)
+
+        plt.close("all")
+
+    def test_draw_animated_overlay(self):
+        m = Maps(figsize=(4, 3))
+        m.add_marker(xy=(0, 0))
+        m.f.canvas.draw()
+
+        ndraw = dict()
+
+        def add_text(i):
+            txt = m.ax.text(i / 20, 0.5, str(i), transform=m.ax.transAxes, zorder=i)
+            ndraw[txt] = 0
+
+            def draw(renderer, txt=txt, draw=txt.draw):
+                ndraw[txt] += 1
+                return draw(renderer)
+
+            txt.draw = draw
+            m.BM.add_artist(txt)
+            return txt
+
+        texts = [add_text(i) for i in range(10)]
+        m.BM.update()
+        self.assertTrue(all(n == 1 for n in ndraw.values()))
+
+        # unchanged artists are not re-drawn
+        new = add_text(10)
+        m.BM.update()
+        self.assertTrue(all(ndraw[t] == 1 for t in texts))
+        self.assertEqual(ndraw[new], 1)
+
+        # only stale artists and artists that overlap with them are re-drawn
+        texts[5].set_color("r")
+        m.BM.update()
+        texts[5].set_color("b")
+        m.BM.update()
+        self.assertTrue(all(ndraw[t] == 1 for t in (*texts[:5], *texts[6:], new)))
+        self.assertEqual(ndraw[texts[5]], 3)
+
+        # overlapping artists are re-drawn in the correct order
+        texts[4].set_position((0.26, 0.5))
+        m.BM.update()
+        self.assertEqual(ndraw[texts[4]], 2)
+        self.assertEqual(ndraw[texts[5]], 4)
+        self.assertEqual(ndraw[texts[0]], 1)
+        buffer = np.array(m.f.canvas.buffer_rgba())
+
+        # the result is the same as re-drawing all artists
+        m.BM._overlay = None
+        m.BM.update()
+        self.assertTrue(np.array_equal(buffer, m.f.canvas.buffer_rgba()))
+
+        # removed artists are no longer drawn
+        n = ndraw[texts[0]]
+        m.BM.remove_artist(texts[0])
+        m.BM.update()
+        self.assertEqual(ndraw[texts[0]], n)
+
+        plt.close("all")
+
+    def test_draw_animated_many_annotations(self):
+        m = Maps(figsize=(6, 4))
+        m.f.canvas.draw()
+
+        ndraw = dict()
+        annotations = []
+        for i in range(10):
+            for j in range(10):
+                a = m.ax.annotate(
+                    str(i * 10 + j), xy=(i / 10, j / 10), xycoords=m.ax.transAxes
+                )
+                ndraw[a] = 0
+
+                def draw(renderer, a=a, draw=a.draw):
+                    ndraw[a] += 1
+                    return draw(renderer)
+
+                a.draw = draw
+                m.BM.add_artist(a)
+                annotations.append(a)
+
+        m.BM.update()
+        self.assertTrue(all(n == 1 for n in ndraw.values()))
+
+        for c in ("r", "g", "b"):
+            annotations[55].set_color(c)
+            m.BM.update()
+
+        # only the changed annotation is re-drawn
+        self.assertEqual(ndraw[annotations[55]], 4)
+        self.assertTrue(
+            all(n == 1 for a, n in ndraw.items() if a is not annotations[55])
+        )
+
+        plt.close("all")
+
+    def test_composite_layers(self):
+        m = Maps(3857, figsize=(4, 3), layer="A")
+        m.set_data(self.data, x="x", y="y", crs=3857)
+        m.plot_map()
+        m2 = m.new_layer("B")
+        m2.set_data(self.data, x="x", y="y", crs=3857)
+        m2.plot_map(cmap="Reds", alpha=0.7)
+        m.f.canvas.draw()
+
+        def composite(layer):
+            # straight-forward "over"-compositing of the cached layers
+            layers, alphas = m.BM._parse_multi_layer_str(layer)
+            rgba = np.zeros((*np.asarray(m.BM._bg_layers.get("A")).shape[:2], 4))
+            for l, a in zip(layers, alphas):
+                src = np.asarray(m.BM._bg_layers.get(l)) / 255
+                alpha = src[..., 3:] * a
+                rgba[..., :3] = src[..., :3] * alpha + rgba[..., :3] * (1 - alpha)
+                rgba[..., 3:] = alpha + rgba[..., 3:] * (1 - alpha)
+            return rgba * 255
+
+        for a in (1, 0.5, 0.1):
+            layer = m.BM._get_showlayer_name(f"A|B{{{a}}}")
+            bg = m.BM._combine_bgs(layer)
+            self.assertTrue(np.abs(np.asarray(bg) - composite(layer)).max() <= 2)
+
+            # composites are cached
+            self.assertIs(m.BM._combine_bgs(layer), bg)
+
+        # the composite of the layers below a semi-transparent layer is kept
+        self.assertEqual([l for l, a in m.BM._compositor._prefix[0]], ["__BG__", "A"])
+
+        # composites are re-combined if a layer is re-fetched
+        m.BM._refetch_layer("B")
+        m.f.canvas.draw()
+        self.assertIsNot(m.BM._combine_bgs(layer), bg)
+
+        plt.close("all")
+
+    def test_composite_opaque_layers(self):
+        from eomaps._blit_manager import LayerCompositor
+
+        def layer(color, region=(slice(None), slice(None))):
+            rgba = np.zeros((10, 20, 4), dtype=np.uint8)
+            rgba[region] = color
+            return rgba
+
+        # semi-transparent -> opaque -> semi-transparent -> opaque -> sparse layer
+        sources = [
+            layer((100, 0, 0, 100)),
+            layer((9, 9, 9, 255)),
+            layer((255, 0, 0, 128)),
+            layer((0, 255, 0, 255)),
+            layer((0, 0, 255, 255), (1, 1)),
+        ]
+        names = ["T", "O1", "X", "O2", "Y"]
+
+        expected = layer((0, 255, 0, 255))
+        expected[1, 1] = (0, 0, 255, 255)
+
+        compositor = LayerCompositor()
+        for key in (None, "key", "key"):
+            out = compositor.composite(
+                names,
+                [1] * 5,
+                sources,
+                lambda: np.zeros((10, 20, 4), dtype=np.uint8),
+                key=key,
+            )
+            self.assertTrue(np.array_equal(np.asarray(out), expected))
+
+        # a sparse layer below a semi-transparent layer is blended as well
+        out = compositor.composite(
+            ["Y", "X"],
+            [1, 1],
+            [sources[4], sources[2]],
+            lambda: np.zeros((10, 20, 4), dtype=np.uint8),
+        )
+        self.assertTrue(np.array_equal(out[0, 0], (255, 0, 0, 128)))
+        self.assertTrue(np.all(np.abs(out[1, 1].astype(int) - (127, 0, 128, 255)) <= 1))
+
+    def test_profile(self):
+        m = Maps(figsize=(4, 3))
+        m.set_data(self.data, x="x", y="y", crs=3857)
+        m.plot_map()
+        m2 = m.new_layer("B")
+        m2.add_marker(xy=(0, 0))
+        m.f.canvas.draw()
+
+        # nothing is recorded if profiling is disabled
+        m.BM.update()
+        self.assertEqual(len(m.BM.profiler.report()["events"]), 0)
+
+        with m.BM.profile() as p:
+            m.ax.set_extent((-10, 10, -10, 10))
+            m.f.canvas.draw()
+            m.show_layer("base|B{0.5}")
+            m.BM.update()
+            m.BM.update()
+
+        self.assertFalse(p.enabled)
+        report = p.report()
+        for stage in ("fetch_bg", "draw_artist", "combine_bgs", "get_props"):
+            self.assertIn(stage, report["stages"])
+        self.assertIn("fetch_bg", report["layers"]["base"])
+        self.assertTrue(any("Dataset" in key for key in report["artists"]))
+        self.assertEqual(report["caches"]["data"]["misses"], 1)
+        self.assertGreater(report["caches"]["composite"]["misses"], 0)
+        self.assertGreater(report["caches"]["composite"]["hits"], 0)
+        self.assertTrue(0 < report["caches"]["bg_layers"]["hit_rate"] < 1)
+
+        df = p.to_dataframe()
+        self.assertEqual(len(df), len(report["events"]))
+
+        trace = p.to_chrome_trace()
+        self.assertEqual(len(trace["traceEvents"]), len(df))
+        self.assertTrue(all(e["ph"] == "X" for e in trace["traceEvents"]))
+
+        # recorded timings are kept if the profiler is not cleared
+        with m.BM.profile(clear=False):
+            m.BM.update()
+        self.assertGreater(len(p.report()["events"]), len(df))
+
+        plt.close(m.f)
+
+    def test_batch_renderer(self):
+        import tempfile
+        from pathlib import Path
+
+        x, y = np.linspace(-20, 50, 40), np.linspace(30, 70, 30)
+
+        m = Maps(Maps.CRS.Mollweide(), figsize=(4, 3))
+        m.set_extent((-20, 50, 30, 70))
+        g = m.add_gridlines(5)
+        m.add_logo()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with m.new_batch_renderer(processes=0) as r:
+                r.m.set_shape.raster()
+                for i in range(3):
+                    with m.BM.profile() as p:
+                        r.render(
+                            Path(tmpdir) / f"frame_{i}.png",
+                            np.random.rand(40, 30),
+                            x=x,
+                            y=y,
+                            crs=4326,
+                            plot_kwargs=dict(vmin=0, vmax=1),
+                            colorbar=True,
+                        )
+
+                    self.assertEqual(len(m.BM._bg_artists[r.m.layer]), 3)
+                    self.assertEqual(len(r.m._colorbars), 1)
+
+                # the static layers are only rendered once
+                layers = p.report()["layers"]
+                self.assertIn("fetch_bg", layers[r.m.layer])
+                self.assertNotIn("fetch_bg", layers.get(m.layer, {}))
+
+                # artists above the dataset are rendered on top of the dataset
+                self.assertIn(g._coll, m.BM._bg_artists[r._overlay_layer])
+                self.assertTrue(r.show_layer.startswith(f"{m.layer}|{r.m.layer}|"))
+
+            frame = plt.imread(Path(tmpdir) / "frame_2.png")
+            m.savefig(Path(tmpdir) / "savefig.png")
+            expected = plt.imread(Path(tmpdir) / "savefig.png")
+            self.assertEqual(frame.shape, expected.shape)
+            self.assertLess(np.abs(frame - expected).mean(), 0.01)
+
+            # outputs are written in worker-processes
+            with m.new_batch_renderer(layer="pool", processes=1) as r:
+                future = r.render(
+                    Path(tmpdir) / "pool.png", np.random.rand(40, 30), x=x, y=y
+                )
+            self.assertTrue(future.done())
+            self.assertTrue((Path(tmpdir) / "pool.png").exists())
+
+        plt.close(m.f)
+
+    def test_export_animation(self):
+        import sys
+        import tempfile
+        from pathlib import Path
+        from PIL import Image
+        from matplotlib import animation
+
+        x, y = np.linspace(-20, 50, 40), np.linspace(30, 70, 30)
+
+        m = Maps(Maps.CRS.Mollweide(), figsize=(4, 3))
+        m.set_extent((-20, 50, 30, 70))
+        m.add_gridlines(5, layer="all")
+
+        layers = []
+        for i in range(4):
+            m2 = m.new_layer(f"t{i}")
+            m2.set_data(np.random.rand(40, 30), x, y, crs=4326)
+            m2.set_shape.raster()
+            m2.plot_map(set_extent=False)
+            layers.append(m2.layer)
+
+        m.f.canvas.draw()
+        nlayers = len(m.BM._bg_layers)
+
+        draws = []
+        draw = m.f.canvas.draw
+        m.f.canvas.draw = lambda *args, **kwargs: draws.append(1) or draw()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with m.BM.profile() as p:
+                m.export_animation(
+                    [*layers, [layers[0], (layers[1], 0.5)]],
+                    Path(tmpdir) / "frame_{:02d}.png",
+                )
+
+            # frames are rendered from cached backgrounds (no full draw)
+            self.assertEqual(len(draws), 0)
+            self.assertGreater(p.report()["stages"]["fetch_bg"]["count"], 0)
+            # backgrounds fetched for the export are not kept in memory
+            self.assertEqual(len(m.BM._bg_layers), nlayers)
+            # the initially visible layer is restored
+            self.assertEqual(m.BM.bg_layer, m.layer)
+
+            self.assertEqual(len(list(Path(tmpdir).glob("frame_*.png"))), 5)
+
+            frame = plt.imread(Path(tmpdir) / "frame_02.png")
+            m.show_layer(layers[2])
+            m.savefig(Path(tmpdir) / "savefig.png")
+            expected = plt.imread(Path(tmpdir) / "savefig.png")
+            self.assertEqual(frame.shape, expected.shape)
+            self.assertLess(np.abs(frame - expected).mean(), 0.01)
+
+            m.export_animation(layers, Path(tmpdir) / "anim.gif", fps=5)
+            with Image.open(Path(tmpdir) / "anim.gif") as im:
+                self.assertEqual(im.n_frames, 4)
+
+            # frames are piped to movie-writers as raw RGBA data
+            class CopyWriter(animation.MovieWriter):
+                supported_formats = ["rgba"]
+
+                def _args(self):
+                    code = (
+                        "import sys, shutil; "
+                        "shutil.copyfileobj(sys.stdin.buffer, open(sys.argv[1], 'wb'))"
+                    )
+                    return [sys.executable, "-c", code, self.outfile]
+
+            draws.clear()
+            m.export_animation(
+                layers, Path(tmpdir) / "anim.raw", writer=CopyWriter(fps=5)
+            )
+            self.assertEqual(len(draws), 0)
+            w, h = m.f.canvas.get_width_height()
+            rgba = np.fromfile(Path(tmpdir) / "anim.raw", dtype=np.uint8)
+            rgba = rgba.reshape(len(layers), h, w, 4)
+            self.assertTrue(np.array_equal(rgba[2], m.BM._render_frame(layers[2])))
+
+            with self.assertRaises(TypeError):
+                m.export_animation(
+                    layers, Path(tmpdir) / "anim.gif", writer=animation.PillowWriter()
+                )
+
+            with self.assertRaises(ValueError):
+                m.export_animation(["t0", "asdf"], Path(tmpdir) / "anim.gif")
+            with self.assertRaises(ValueError):
+                m.export_animation(layers, Path(tmpdir) / "f.png", writer="sequence")
+
+        plt.close(m.f)
+
+    def test_cached_cells(self):
+        x, y = np.random.uniform(-40, 40, (2, 2000))
+
+        for shape in ("voronoi_diagram", "delaunay_triangulation"):
+            with self.subTest(shape=shape):
+                m = Maps(4326)
+                m.set_data(np.random.rand(2000), x, y, crs=4326)
+                getattr(m.set_shape, shape)()
+                m.plot_map()
+                m.f.canvas.draw()
+
+                cells = m.shape._cells
+                ncells = len(cells[2]["index"])
+                nvisible = len(m.coll.get_paths())
+
+                # the cells are not re-computed if the extent changes
+                m.set_extent((-10, 10, -10, 10))
+                m.f.canvas.draw()
+                self.assertIs(m.shape._cells, cells)
+
+                # only cells that intersect the extent are drawn
+                ids = cells[2]["index"].select(m._data_manager.last_extent)
+                self.assertLess(len(ids), ncells)
+                if shape == "voronoi_diagram":
+                    self.assertEqual(len(m.coll.get_paths()), len(ids))
+                    self.assertLess(len(ids), nvisible)
+
+                # the cells are re-computed for new coordinates
+                m.set_data(np.random.rand(2000), x + 1, y, crs=4326)
+                m.plot_map(set_extent=False)
+                m.f.canvas.draw()
+                self.assertIsNot(m.shape._cells, cells)
+
+                plt.close(m.f)
+
+    def test_polygon_collection(self):
+        from eomaps.shapes import _PolygonBuffer, _PolygonCollection
+
+        # polygons with invalid vertices are dropped
+        verts = np.random.rand(5, 4, 2)
+        verts[1, 0] = np.nan
+        verts[2, :2] = np.nan
+        polygons, mask = _PolygonBuffer.from_padded(verts, min_verts=3)
+        self.assertEqual(mask.tolist(), [True, True, False, True, True])
+        self.assertEqual(np.diff(polygons.offsets).tolist(), [5, 4, 5, 5])
+        # polygons are closed
+        self.assertTrue(np.array_equal(polygons.verts[4], polygons.verts[0]))
+        self.assertTrue(np.array_equal(polygons.take([1]).verts[:3], verts[1, 1:]))
+
+        x, y = np.meshgrid(np.linspace(-50, 50, 50), np.linspace(-30, 30, 40))
+        m = Maps(4326, figsize=(4, 3))
+        m.set_data(np.random.randint(0, 5, x.size), x.ravel(), y.ravel())
+        m.set_shape.rectangles()
+        m.plot_map(cmap="viridis")
+        m.f.canvas.draw()
+
+        self.assertIsInstance(m.coll, _PolygonCollection)
+        # rectangles might overlap so they are drawn in the order of the data
+        self.assertIsNone(m.coll._compound_cache)
+        buffer = np.array(m.f.canvas.buffer_rgba())
+
+        # polygons with the same color are drawn as compound paths if requested
+        m.coll._compound = True
+        m.BM._refetch_layer(m.layer)
+        m.f.canvas.draw()
+        args = m.coll._compound_cache[2]
+        self.assertEqual(len(args), 1)
+        self.assertEqual(len(args[0][0]), 5)
+
+        # compound paths of polygons that don't overlap are drawn like
+        # individual paths (except for antialiasing at the polygon-boundaries)
+        px, py = m.ax.transData.transform(np.column_stack((x.flat, y.flat))).T
+        px, py = px.astype(int), buffer.shape[0] - 1 - py.astype(int)
+        compound_buffer = np.array(m.f.canvas.buffer_rgba())
+        self.assertTrue(np.array_equal(buffer[py, px], compound_buffer[py, px]))
+
+        plt.close(m.f)
+
+        # the drawing-order of overlapping polygons is preserved by default
+        m = Maps(4326, figsize=(4, 3))
+        m.set_data(np.arange(6) % 2, np.arange(6), np.arange(6))
+        m.set_shape.rectangles(radius=1)
+        m.plot_map(cmap="viridis", set_extent=False)
+        m.ax.set_extent((-3, 8, -3, 8))
+        m.f.canvas.draw()
+        self.assertIsNone(m.coll._compound_cache)
+        # (rectangles are drawn on top of the previous ones)
+        buffer = np.array(m.f.canvas.buffer_rgba())
+        colors = np.round(m.coll.get_facecolor() * 255)
+        for i in range(1, 6):
+            px, py = m.ax.transData.transform((i - 0.5, i - 0.5)).astype(int)
+            color = buffer[buffer.shape[0] - 1 - py, px]
+            self.assertTrue(np.array_equal(color, colors[i]))
+
+        plt.close(m.f)
+
+        # polygons that can not overlap use compound paths if no edges are drawn
+        m = Maps(4326, figsize=(4, 3))
+        m.set_data(np.random.randint(0, 5, 500), *np.random.rand(2, 500) * 40)
+        m.set_shape.voronoi_diagram(masked=False)
+        m.plot_map(ec="k", lw=0.5)
+        m.f.canvas.draw()
+        self.assertIsNone(m.coll._compound_cache)
+
+        m.coll.set_edgecolor("none")
+        m.BM._refetch_layer(m.layer)
+        m.f.canvas.draw()
+        self.assertIsNotNone(m.coll._compound_cache)
+
+        plt.close(m.f)
+
+        # compound paths can be enabled globally
+        try:
+            Maps.config(compound_polygons=True)
+            m = Maps(4326, figsize=(4, 3))
+            m.set_data(np.random.randint(0, 5, x.size), x.ravel(), y.ravel())
+            m.set_shape.rectangles()
+            m.plot_map(ec="k")
+            m.f.canvas.draw()
+            self.assertIsNotNone(m.coll._compound_cache)
+            # individual paths are only created on demand
+            self.assertIsNone(m.coll._paths)
+            self.assertEqual(len(m.coll.get_paths()), x.size)
+        finally:
+            Maps.config(compound_polygons=False)
+
+        plt.close(m.f)
+
+    def test_geod_circle_templates(self):
+        m = Maps(3857, figsize=(4, 3))
+        shp = m.set_shape._get("geod_circles", radius=50000, n=20)
+
+        lon = np.random.uniform(-180, 180, 500)
+        lat = np.random.choice(np.linspace(-80, 80, 20), 500)
+        radius = np.random.choice([1000, 50000], 500)
+        lons, lats = shp._calc_geod_circle_points(lon, lat, radius, n=20)
+
+        # circles are identical to circles calculated with geod.fwd
+        lons2, lats2, _ = m.crs_plot.get_geod().fwd(
+            np.broadcast_to(lon[:, None], (500, 20)),
+            np.broadcast_to(lat[:, None], (500, 20)),
+            np.broadcast_to(np.linspace(0, 360, 20), (500, 20)),
+            np.broadcast_to(radius[:, None], (500, 20)),
+        )
+        dlon = (lons - lons2 + 180) % 360 - 180
+        self.assertTrue(np.allclose(dlon, 0, atol=1e-8))
+        self.assertTrue(np.allclose(lats, lats2, atol=1e-8))
+
+        # templates are only calculated for unique latitudes and radii
+        key = (20, 0, m.crs_plot.get_geod().initstring)
+        templates = shp._templates[key]
+        self.assertLessEqual(len(templates[0]), 40)
+
+        # shifted circles re-use the cached templates
+        shp._calc_geod_circle_points(lon + 10, lat, radius, n=20)
+        self.assertIs(shp._templates[key], templates)
+
+        plt.close(m.f)
+
+    def test_shape_level_of_detail(self):
+        x, y = np.meshgrid(np.linspace(-50, 50, 30), np.linspace(-50, 50, 30))
+        data = np.random.rand(*x.shape)
+
+        for shape, kwargs, nmin in (
+            ("ellipses", dict(radius=0.1), 6),
+            ("geod_circles", dict(radius=10000), 6),
+            ("rectangles", dict(radius=0.1), 5),
+        ):
+            with self.subTest(shape=shape):
+                m = Maps(3857, figsize=(4, 3))
+                m.set_data(data, x, y, crs=4326)
+                getattr(m.set_shape, shape)(**kwargs)
+                m.plot_map()
+                m.f.canvas.draw()
+
+                # sub-pixel shapes are drawn with the min. number of points
+                nverts = np.diff(m.coll._polygons.offsets)
+                self.assertEqual(len(nverts), data.size)
+                self.assertTrue(np.all(nverts == nmin))
+
+                # shapes get more points if they become larger on the screen
+                m.set_extent((-1, 1, -1, 1), 4326)
+                m.f.canvas.draw()
+                nverts = np.diff(m.coll._polygons.offsets)
+                self.assertTrue(np.all(nverts > nmin))
+
+                # an explicit number of points is always respected
+                getattr(m.set_shape, shape)(**kwargs, n=12)
+                m.plot_map()
+                m.f.canvas.draw()
+                nverts = np.diff(m.coll._polygons.offsets)
+                self.assertTrue(np.all(nverts == 13 if shape != "rectangles" else 45))
+
+                plt.close(m.f)
+
+    def test_prefetch_layers(self):
+        m = Maps(figsize=(4, 3))
+        for i in range(6):
+            m.add_marker(xy=(i, i), layer=str(i))
+
+        s = m.util.layer_slider(layers=[str(i) for i in range(6)], prefetch=2)
+        m.f.canvas.draw()
+
+        # prefetching requires working timers
+        m.BM.prefetch_layers(["1"])
+        self.assertEqual(len(m.BM._prefetch_queue), 0)
+        self.assertEqual(len(m.BM._cid_prefetch), 0)
+
+        # emulate an interactive backend (timers are executed explicitly)
+        m.BM._timers_supported = lambda: True
+
+        s.set_val(2)
+        self.assertEqual(m.BM._prefetch_queue, ["3", "1", "4", "0"])
+        self.assertEqual(len(m.BM._cid_prefetch), 3)
+
+        buffer = np.array(m.f.canvas.buffer_rgba())
+        while len(m.BM._prefetch_queue) > 0:
+            m.BM._do_prefetch()
+
+        # callbacks are only connected while layers are prefetched
+        self.assertEqual(len(m.BM._cid_prefetch), 0)
+
+        for layer in ("0", "1", "3", "4"):
+            self.assertIn(layer, m.BM._bg_layers)
+        self.assertNotIn("5", m.BM._bg_layers)
+        # the canvas is not changed by prefetching layers
+        self.assertTrue(np.array_equal(buffer, m.f.canvas.buffer_rgba()))
+
+        # prefetched layers are shown without re-drawing
+        misses = m.BM.bg_cache_info()["misses"]
+        m.show_layer("3")
+        self.assertEqual(m.BM.bg_cache_info()["misses"], misses)
+
+        # prefetching is cancelled on user-interaction
+        m.BM.prefetch_layers(["5"])
+        MouseEvent("scroll_event", m.f.canvas, 10, 10, step=1)._process()
+        self.assertEqual(len(m.BM._prefetch_queue), 0)
+
+        # prefetching stops if the cache is full
+        m.BM._bg_layers.maxsize = m.BM._bg_layers.nbytes
+        m.BM.prefetch_layers(["5"])
+        m.BM._do_prefetch()
+        self.assertNotIn("5", m.BM._bg_layers)
+        self.assertEqual(len(m.BM._prefetch_queue), 0)
+
+        # prefetch layers with m.fetch_layers
+        m.BM._bg_layers.maxsize = None
+        m.fetch_layers(["5"], idle=True)
+        self.assertEqual(m.BM._prefetch_queue, ["5"])
+        m.BM._do_prefetch()
+        self.assertIn("5", m.BM._bg_layers)
+
+        # removing the slider cancels prefetching and disconnects the callbacks
+        m.BM._bg_layers.clear()
+        s.set_val(3)
+        cids = list(m.BM._cid_prefetch)
+        self.assertEqual(len(cids), 3)
+        s.remove()
+        self.assertEqual(len(m.BM._prefetch_queue), 0)
+        self.assertEqual(len(m.BM._cid_prefetch), 0)
+        connected = set(chain(*m.f.canvas.callbacks.callbacks.values()))
+        self.assertTrue(connected.isdisjoint(cids))
+
+        # layer-selectors prefetch the layers next to the selected button
+        s = m.util.layer_selector(layers=[str(i) for i in range(6)], prefetch=1)
+        s.on_clicked(4)
+        self.assertEqual(m.BM.bg_layer, "4")
+        self.assertEqual(m.BM._prefetch_queue, ["5", "3"])
+        while len(m.BM._prefetch_queue) > 0:
+            m.BM._do_prefetch()
+        for layer in ("3", "5"):
+            self.assertIn(layer, m.BM._bg_layers)
+
+        s.on_clicked(1)
+        self.assertEqual(m.BM._prefetch_queue, ["2", "0"])
+        s.remove()
+        self.assertEqual(len(m.BM._prefetch_queue), 0)
+        self.assertEqual(len(m.BM._cid_prefetch), 0)
+
+        # prefetching can be disabled
+        s = m.util.layer_selector(layers=[str(i) for i in range(6)], prefetch=0)
+        s.on_clicked(2)
+        self.assertEqual(len(m.BM._prefetch_queue), 0)
+        s.remove()
+
+        plt.close("all")
+
     def test_blit_artists(self):
         # just a sanity-check if function throws an error...
         m = Maps()
@@ -758,6 +758,69 @@ class TestCallbacks(unittest.TestCase):
         self.assertTrue(m2.cb.pick.get.picked_vals["ID"][0] == 1225)
         plt.close("all")
 
+    def test_search_tree_index(self):
+        m = Maps(4326)
+        m.set_data(self.data, x="lon", y="lat")
+        m.plot_map()
+        m.cb.pick.attach.get_values()
+        m.f.canvas.draw()
+
+        # check that the index is only built once
+        self.assertEqual(m.tree.query(self.data.loc[1225][["lon", "lat"]]), 1225)
+        index = m.tree._index
+        self.assertEqual(m.tree.query(self.data.loc[10][["lon", "lat"]]), 10)
+        self.assertIs(m.tree._index, index)
+
+        # check k nearest neighbours (relative to the closest point)
+        x, y = self.data.loc[1225][["lon", "lat"]]
+        ids = m.tree.query((x + 0.1, y), k=5)
+        ref = KDTree(self.data[["lon", "lat"]].values).query((x, y), k=5)[1]
+        self.assertTrue(np.array_equal(np.sort(ids), np.sort(ref)))
+
+        # check that points outside the search-radius are not found
+        self.assertIsNone(m.tree.query((x + 0.1, y), d=0.01))
+
+        # check that the index is re-built if the data changes
+        m.set_data(self.data[::2], x="lon", y="lat")
+        m.plot_map()
+        self.assertEqual(m.tree.query(self.data.loc[10][["lon", "lat"]]), 5)
+        self.assertIsNot(m.tree._index, index)
+        plt.close("all")
+
+    def test_search_tree_index_1D(self):
+        # 1D coordinates with different sizes and 2D data
+        x, y = np.linspace(-170, 170, 50), np.linspace(-80, 80, 30)
+        data = np.random.default_rng(1).random((50, 30))
+
+        m = Maps(4326)
+        m.set_data(data, x, y, crs=4326)
+        m.set_shape.raster()
+        m.plot_map()
+        m.cb.pick.attach.get_values()
+        m.f.canvas.draw()
+
+        dm = m._data_manager
+        self.assertIsNotNone(dm.x0_1D)
+
+        # "shade_raster" keeps the 1D coordinates (e.g. x0 and y0 are not 2D)
+        dm._all_data["x0"], dm._all_data["y0"] = x, y
+        dm._props_version += 1
+
+        for ix, iy in ((10, 20), (49, 0), (0, 29)):
+            # the index of the grid is consistent with the 1D coordinates
+            ind = m.tree._query_index((x[ix] + 0.1, y[iy] - 0.1), k=1, d=10)[0]
+            self.assertEqual(ind, m.tree.query((x[ix] + 0.1, y[iy] - 0.1)))
+            self.assertEqual(dm._get_xy_from_index(ind), (x[ix], y[iy]))
+            self.assertEqual(dm._get_val_from_index(ind), data[ix, iy])
+
+        # k nearest neighbours of the grid
+        ids = m.tree._query_index((x[10], y[20]), k=5, d=100)
+        xs, ys = dm._get_xy_from_index(ids)
+        d = np.hypot(xs - x[10], ys - y[20])
+        self.assertEqual(len(ids), 5)
+        self.assertTrue(np.all(d <= np.hypot(np.diff(x)[0], np.diff(y)[0]) + 1e-8))
+        plt.close("all")
+
     def test_keypress_callbacks_for_any_key(self):
         m = self.create_basic_map()
         m.new_layer("0")
@@ -1,6 +1,9 @@
 import unittest
+import warnings
 from pathlib import Path
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.backend_bases import MouseEvent
 from eomaps import Maps
 
 
@@ -28,6 +31,9 @@ class TestRasterAggregation(unittest.TestCase):
             "spline",
             "fast_mean",
             "fast_sum",
+            "fast_nanmean",
+            "fast_nanmax",
+            "fast_count",
         ]:
             for valid_fraction in (0, 0.5):
                 m = Maps.from_file.GeoTIFF(
@@ -89,3 +95,386 @@ class TestRasterAggregation(unittest.TestCase):
 
                 m.f.canvas.draw()
             plt.close("all")
+
+    def test_raster_aggregation_overviews(self):
+        x = np.linspace(-170, 170, 400)
+        y = np.linspace(-80, 80, 200)
+        data = np.random.default_rng(1).random((400, 200))
+
+        for agg in [
+            "mean",
+            "first",
+            "last",
+            "max",
+            "median",
+            "fast_mean",
+            "fast_nanmax",
+        ]:
+            with self.subTest(aggregator=agg):
+                m = Maps(4326)
+                m.set_data(data, x, y)
+                m.set_shape.raster(maxsize=1e3, aggregator=agg, overviews=True)
+                m.plot_map()
+                m.f.canvas.draw()
+
+                dm = m._data_manager
+                self.assertTrue(len(dm._overviews) > 0)
+
+                # check that overviews are re-used on zoom
+                overviews = dict(dm._overviews)
+                m.set_extent((-50, 50, -20, 20))
+                m.f.canvas.draw()
+                for level, ov in overviews.items():
+                    self.assertIs(dm._overviews[level], ov)
+
+                # check that overview levels match aggregation of the full dataset
+                for level, ov in dm._overviews.items():
+                    bs = (2**level, 2**level)
+                    blocks = dm._block_view(dm._trim_to_blocks(dm.z_data, bs[0]), bs)
+                    ref = dm._aggregate_blocks(blocks, agg, bs)
+                    self.assertTrue(np.allclose(ov["z_data"], ref))
+
+                plt.close("all")
+
+    def test_raster_aggregation_lazy(self):
+        import dask.array as da
+
+        x = np.linspace(-170, 170, 400)
+        y = np.linspace(-80, 80, 200)
+        data = np.random.default_rng(1).random((400, 200))
+
+        for agg in ["mean", "first", "max", "median", "fast_mean", "spline"]:
+            with self.subTest(aggregator=agg):
+                props = []
+                for d in (data, da.from_array(data, chunks=(64, 48))):
+                    m = Maps(4326)
+                    m.set_data(d, x, y)
+                    m.set_shape.raster(maxsize=1e3, aggregator=agg)
+                    m.plot_map()
+                    m.f.canvas.draw()
+
+                    props.append(m._data_manager._current_data)
+
+                # data is kept lazy and only the aggregated values are computed
+                self.assertTrue(isinstance(m._data_manager.z_data, da.Array))
+                self.assertTrue(isinstance(props[1]["z_data"], np.ndarray))
+
+                for key in ("x0", "y0", "z_data"):
+                    self.assertTrue(np.allclose(props[0][key], props[1][key]))
+
+                plt.close("all")
+
+    def test_raster_lazy_from_file(self):
+        import dask.array as da
+
+        m = Maps.from_file.NetCDF(
+            self.netcdfpath,
+            data_crs=4326,
+            shape=dict(shape="raster", maxsize=1e2),
+            chunks=dict(lon=50),
+        )
+        self.assertTrue(isinstance(m._data_manager.z_data, da.Array))
+
+        m.set_extent(self.extent)
+        m.f.canvas.draw()
+        self.assertTrue(isinstance(m._data_manager._current_data["z_data"], np.ndarray))
+
+        plt.close("all")
+
+    def test_raster_aggregation_streaming(self):
+        from eomaps._data_manager import DataManager
+
+        rng = np.random.default_rng(1)
+        m = Maps(4326)
+        dm = m._data_manager
+
+        data = dict(
+            float=rng.random((200, 120)),
+            nan=np.where(rng.random((200, 120)) > 0.99, np.nan, rng.random((200, 120))),
+            int=rng.integers(0, 10, (200, 120)),
+            uint8=rng.integers(0, 5, (200, 120)).astype("uint8"),
+        )
+
+        for agg in ["mean", "max", "median", "mode", "fast_mean"]:
+            for name, d in data.items():
+                for bs in ((3, 3), (4, 4)):
+                    with self.subTest(aggregator=agg, data=name, blocksize=bs):
+                        ref = dm._aggregate_blocks(dm._block_view(d, bs), agg, bs)
+
+                        # check results of the fast median / mode paths
+                        if agg == "median":
+                            self.assertTrue(
+                                np.allclose(
+                                    ref,
+                                    np.median(dm._block_view(d, bs), axis=(-1, -2)),
+                                    equal_nan=True,
+                                )
+                            )
+                        elif agg == "mode" and name != "nan":
+                            from scipy.stats import mode
+
+                            out, _ = mode(dm._block_view(d, bs), axis=(-1, -2))
+                            self.assertTrue(np.array_equal(ref, out))
+                            self.assertEqual(ref.dtype, d.dtype)
+
+                        try:
+                            Maps.config(aggregate_chunksize=1000, aggregate_workers=3)
+                            res = dm._aggregate_streaming(d, agg, bs)
+                        finally:
+                            Maps.config(aggregate_chunksize=1e7, aggregate_workers=1)
+
+                        self.assertEqual(res.shape, ref.shape)
+                        self.assertTrue(np.allclose(res, ref, equal_nan=True))
+
+        # the mode of small integer dtypes must not overflow
+        from scipy.stats import mode
+
+        d = rng.integers(-128, 128, (40, 40)).astype("int8")
+        d[:2, :2] = [[-128, 127], [127, -128]]
+        ref, _ = mode(dm._block_view(d, (4, 4)), axis=(-1, -2))
+        res = dm._aggregate_blocks(dm._block_view(d, (4, 4)), "mode", (4, 4))
+        self.assertTrue(np.array_equal(res, ref))
+
+        # the median must not modify the input data
+        # (e.g. if the window is only one block wide)
+        for shape in ((40, 4), (4, 40), (40, 40)):
+            d = rng.random(shape)
+            orig = d.copy()
+            res = dm._aggregate_blocks(dm._block_view(d, (4, 4)), "median", (4, 4))
+            self.assertTrue(np.array_equal(d, orig))
+            self.assertTrue(
+                np.allclose(res, np.median(dm._block_view(orig, (4, 4)), axis=(-1, -2)))
+            )
+
+        self.assertEqual(DataManager._aggregate_workers, 1)
+        plt.close("all")
+
+    def test_raster_aggregation_fast_nan(self):
+        rng = np.random.default_rng(1)
+        m = Maps(4326)
+        m.set_shape.raster(aggregator="fast_nanmean", valid_fraction=0)
+        dm = m._data_manager
+
+        d = rng.random((200, 120))
+        d[rng.random(d.shape) > 0.9] = np.nan
+        d[:4, :4] = np.nan
+        mask = rng.random(d.shape) > 0.9
+        dmasked = np.ma.masked_array(d, mask)
+
+        bs = (4, 4)
+        for name, data in dict(float=d, masked=dmasked).items():
+            for agg in ["fast_nanmean", "fast_nanmax", "fast_count", "fast_mean"]:
+                with self.subTest(aggregator=agg, data=name):
+                    orig = data.copy()
+                    blocks = dm._block_view(data, bs)
+                    res = dm._aggregate_blocks(blocks, agg, bs)
+
+                    # the input data must not be modified
+                    self.assertTrue(np.array_equal(data, orig, equal_nan=True))
+                    if name == "masked":
+                        self.assertTrue(np.array_equal(data.mask, orig.mask))
+
+                    vals = np.ma.filled(blocks.astype(float), np.nan)
+                    if agg == "fast_nanmean":
+                        with warnings.catch_warnings():
+                            warnings.simplefilter("ignore", RuntimeWarning)
+                            ref = np.nanmean(vals, axis=(-1, -2))
+                    elif agg == "fast_nanmax":
+                        ref = np.nanmax(
+                            np.where(np.isnan(vals), -np.inf, vals), axis=(-1, -2)
+                        )
+                        ref[np.isinf(ref)] = np.nan
+                    elif agg == "fast_count":
+                        ref = np.count_nonzero(~np.isnan(vals), axis=(-1, -2))
+                    else:
+                        ref = np.ma.getdata(blocks).mean(axis=(-1, -2))
+
+                    if name == "masked":
+                        # with valid_fraction=0 all blocks with masked values are masked
+                        blockmask = blocks.mask.any(axis=(-1, -2))
+                        self.assertTrue(np.array_equal(res.mask, blockmask))
+                        res, ref = res[~blockmask], ref[~blockmask]
+                        res = np.ma.getdata(res)
+
+                    self.assertTrue(np.allclose(res, ref, equal_nan=True))
+
+        # check valid_fraction masking
+        m.set_shape.raster(aggregator="fast_nanmean", valid_fraction=0.5)
+        blocks = dm._block_view(dmasked, bs)
+        res = dm._aggregate_blocks(blocks, "fast_nanmean", bs)
+        nmasked = np.count_nonzero(blocks.mask, axis=(-1, -2))
+        self.assertTrue(np.array_equal(res.mask, nmasked > 0.5 * 16))
+
+        # check that the fast aggregators work with integer data and masks
+        dint = np.ma.masked_array(rng.integers(0, 10, (20, 20)), np.zeros((20, 20)))
+        dint.mask[:4, :4] = True
+        res = dm._aggregate_blocks(dm._block_view(dint, bs), "fast_nanmax", bs)
+        self.assertTrue(res.mask[0, 0] and not res.mask[1:, 1:].any())
+
+        plt.close("all")
+
+    def test_raster_aggregation_incremental_pan(self):
+        # (use a shape that is not a multiple of the blocksizes)
+        x = np.linspace(-170, 170, 1003)
+        y = np.linspace(-80, 80, 601)
+        data = np.random.default_rng(1).random((1003, 601))
+
+        for agg, crs in [("mean", 4326), ("median", 4326), ("max", 3857)]:
+            with self.subTest(aggregator=agg, crs=crs):
+                m = Maps(crs)
+                m.set_data(data, x, y, crs=4326)
+                m.set_shape.raster(maxsize=1e4, aggregator=agg)
+                m.plot_map()
+                m.set_extent((-100, 20, -40, 30), 4326)
+                m.f.canvas.draw()
+
+                dm = m._data_manager
+                windows = []
+                aggregate_window = dm._aggregate_window
+
+                def spy(slices, blocksize):
+                    windows.append(slices)
+                    return aggregate_window(slices, blocksize)
+
+                dm._aggregate_window = spy
+
+                for dx, dy in [(5, 0), (0, -3), (4, 2), (0, 0)]:
+                    windows.clear()
+                    x0, x1, y0, y1 = m.get_extent(4326)
+                    m.set_extent((x0 + dx, x1 + dx, y0 + dy, y1 + dy), 4326)
+                    m.f.canvas.draw()
+
+                    last = dm._last_window
+                    self.assertIsNotNone(last)
+
+                    # only the newly exposed strips are aggregated
+                    wx0, wx1, wy0, wy1 = last["slices"]
+                    size = sum((s[1] - s[0]) * (s[3] - s[2]) for s in windows)
+                    self.assertTrue(size < (wx1 - wx0) * (wy1 - wy0) / 2)
+
+                    # check that the result is equal to aggregating the full window
+                    ref = aggregate_window(last["slices"], last["key"][1])
+                    for key, val in ref.items():
+                        self.assertTrue(
+                            np.allclose(dm._current_data[key], val, equal_nan=True)
+                        )
+
+                # check that the result is equal to a full redraw of the extent
+                # (e.g. windows at the boundary of the data are trimmed the same way)
+                m.set_extent((-100, 20, -40, 30), 4326)
+                m.f.canvas.draw()
+                pans = [(60, 0), (3, 25), (2, 21), (4, 3), (-150, -35), (-1, -30)]
+                for dx, dy in pans:
+                    x0, x1, y0, y1 = m.get_extent(4326)
+                    m.set_extent((x0 + dx, x1 + dx, y0 + dy, y1 + dy), 4326)
+                    m.f.canvas.draw()
+
+                    dm._incremental_pan = False
+                    try:
+                        ref = dm._select_props(dm.last_extent, dict())
+                    finally:
+                        del dm._incremental_pan
+
+                    for key, val in ref.items():
+                        self.assertEqual(dm._current_data[key].shape, val.shape)
+                        self.assertTrue(
+                            np.allclose(dm._current_data[key], val, equal_nan=True)
+                        )
+
+                plt.close("all")
+
+        # check that incremental pan can be disabled
+        try:
+            Maps.config(incremental_pan=False)
+            m = Maps(4326)
+            m.set_data(data, x, y)
+            m.set_shape.raster(maxsize=1e4)
+            m.plot_map()
+            m.set_extent((-100, 20, -40, 30))
+            m.f.canvas.draw()
+            self.assertIsNone(m._data_manager._last_window)
+        finally:
+            Maps.config(incremental_pan=True)
+
+        plt.close("all")
+
+    def test_raster_image(self):
+        from matplotlib.collections import QuadMesh
+        from matplotlib.image import AxesImage
+        from eomaps.shapes import _RasterImage
+
+        x = np.linspace(-177, 177, 60)
+        y = np.linspace(-87, 87, 30)
+        data = np.random.default_rng(1).random((60, 30))
+
+        # regular grids in the plot-crs are drawn as images
+        m = Maps(4326)
+        m.set_data(data, x, y, crs=4326)
+        m.set_shape.raster()
+        m.plot_map()
+        m.add_colorbar()
+        m.f.canvas.draw()
+        self.assertIs(type(m.coll), AxesImage)
+        self.assertTrue(np.allclose(m.coll.get_extent(), (-180, 180, -90, 90)))
+        self.assertTrue(np.array_equal(m.coll.get_array(), data.T))
+
+        # transposed 2D coordinates
+        m2 = m.new_layer()
+        xx, yy = np.meshgrid(x, y, indexing="ij")
+        m2.set_data(data, xx, yy, crs=4326)
+        m2.set_shape.raster(resampling="bilinear")
+        m2.plot_map()
+        m2.show()
+        self.assertIs(type(m2.coll), AxesImage)
+        self.assertEqual(m2.coll.get_interpolation(), "bilinear")
+        self.assertTrue(np.array_equal(m2.coll.get_array(), data.T))
+
+        # reprojected grids are warped to an image with the size of the axes
+        for resampling in ("nearest", "bilinear"):
+            with self.subTest(resampling=resampling):
+                m = Maps(3857)
+                m.set_data(data, x, y, crs=4326)
+                m.set_shape.raster(resampling=resampling)
+                m.plot_map()
+                m.f.canvas.draw()
+                self.assertIsInstance(m.coll, _RasterImage)
+                self.assertEqual(
+                    m.coll.get_array().shape,
+                    tuple(int(np.ceil(i)) for i in m.ax.bbox.size[::-1]),
+                )
+
+                # check that the warped image shows the values of the grid
+                px, py = m._transf_lonlat_to_plot.transform(x[10], y[10])
+                ix, iy = m.ax.transData.transform((px, py))
+                event = MouseEvent("button_press_event", m.f.canvas, ix, iy, 1)
+                self.assertAlmostEqual(
+                    m.coll.get_cursor_data(event),
+                    data[10, 10],
+                    delta=0.1 if resampling == "bilinear" else 1e-12,
+                )
+
+                # picking still uses the search-tree
+                picked = []
+                m.cb.pick.attach(lambda val, **kwargs: picked.append(val))
+                m.f.canvas.callbacks.process("button_press_event", event)
+                event.name = "button_release_event"
+                m.f.canvas.callbacks.process("button_release_event", event)
+                self.assertEqual(picked, [data[10, 10]])
+
+        plt.close("all")
+
+        # use a QuadMesh if the grid is not regular or if collection-properties
+        # are provided
+        for xi, kwargs, resampling in [
+            (np.sort(np.random.default_rng(1).uniform(-177, 177, 60)), {}, "nearest"),
+            (x, dict(ec="k"), "nearest"),
+            (x, {}, None),
+        ]:
+            m = Maps(4326)
+            m.set_data(data, xi, y, crs=4326)
+            m.set_shape.raster(resampling=resampling)
+            m.plot_map(**kwargs)
+            m.f.canvas.draw()
+            self.assertIs(type(m.coll), QuadMesh)
+
+        plt.close("all")